@@ -16,6 +16,69 @@ class Settings(BaseSettings):
     .env 파일에서 자동으로 환경 변수를 읽어옵니다.
     """
     notion_api_key: Optional[str] = None  # Notion Integration API 키
+    web_concurrency: int = 1  # 워커 프로세스 수 (uvicorn/gunicorn의 WEB_CONCURRENCY)
+
+    # 블록 내용 write-behind 버퍼 (워커 하나일 때만 사용 가능)
+    block_write_behind_enabled: bool = False  # 버퍼 사용 여부
+    block_write_behind_interval_ms: int = 200  # 주기적 반영 간격 (ms)
+    block_write_behind_max_pending: int = 500  # 이 개수 이상 쌓이면 즉시 반영
+
+    # 테넌트(Page.user_id)별 데이터베이스 샤딩
+    tenant_sharding_enabled: bool = False  # 샤딩 사용 여부
+    tenant_header: str = "X-Tenant-ID"  # 테넌트 ID를 담는 요청 헤더
+    tenant_shard_dir: str = "./shards"  # 테넌트별 SQLite 파일 폴더
+    tenant_max_open_engines: int = 64  # 동시에 열어 둘 샤드 엔진 수 (LRU)
+
+    # 읽기/쓰기 세션 분리 (읽기 복제본)
+    read_replica_enabled: bool = False  # 읽기 전용 라우트를 복제본으로 보낼지 여부
+    read_replica_urls: list[str] = []  # 복제본 URL 목록 (비어 있으면 SQLite 읽기 전용 WAL 연결)
+    read_your_writes_seconds: float = 5.0  # 쓰기 후 이 시간 동안은 primary에서 읽기 (복제 지연 허용치)
+
+    # 응답 압축 (brotli가 설치되어 있으면 br, 아니면 gzip)
+    response_compression_enabled: bool = False  # 압축 사용 여부
+    response_compression_min_size: int = 1024  # 이 크기(bytes) 이상인 응답만 압축
+    response_gzip_level: int = 6  # gzip 압축 레벨 (1-9)
+    response_brotli_quality: int = 4  # brotli 압축 품질 (0-11)
+
+    # 요청 수락 제어 (과부하 시 503/429로 빠르게 거절)
+    admission_control_enabled: bool = False  # 수락 제어 사용 여부
+    admission_read_concurrency: int = 32  # 조회 요청 동시 실행 수
+    admission_write_concurrency: int = 8  # 일반 쓰기 요청 동시 실행 수
+    admission_heavy_concurrency: int = 2  # 가져오기/삭제/복제/이동 동시 실행 수
+    admission_queue_size: int = 64  # 조회/쓰기 요청 최대 대기 수 (넘치면 503)
+    admission_heavy_queue_size: int = 4  # 무거운 요청 최대 대기 수
+    admission_queue_timeout_seconds: float = 2.0  # 최대 대기 시간 (넘치면 503)
+    admission_retry_after_seconds: float = 1.0  # 503 응답의 Retry-After (초)
+    rate_limit_per_second: float = 20.0  # 클라이언트별 초당 요청 수 (0이면 제한 없음)
+    rate_limit_burst: int = 40  # 클라이언트별 순간 최대 요청 수
+
+    # 단일 writer 큐 (SQLite 쓰기를 엔진별 스레드 하나로 모아 group commit)
+    single_writer_enabled: bool = False  # 단일 writer 사용 여부
+    single_writer_max_batch: int = 64  # 한 트랜잭션에 묶을 최대 쓰기 작업 수
+    single_writer_batch_window_ms: int = 0  # 첫 작업 후 더 모을 시간 (ms, 0이면 쌓인 작업만)
+
+    # 페이지 계층 구조 메모리 인덱스
+    page_tree_index_enabled: bool = True  # 메모리 인덱스 사용 여부
+    page_tree_check_interval_ms: int = 1000  # 다른 워커의 페이지 변경 확인 간격 (ms)
+
+    # 변경 로그 (GET /api/changes)
+    change_log_retention_days: float = 30.0  # 이보다 오래된 기록은 압축 시 삭제 (오래된 커서는 410)
+
+    # 관리 API (/api/admin)
+    admin_api_token: Optional[str] = None  # 관리 API의 X-Admin-Token 값 (없으면 관리 API 비활성화)
+
+    # 온라인 백업 (POST /api/admin/backups, manage.py backup)
+    backup_dir: str = "./backups"  # 스냅샷 저장 폴더
+    backup_pages_per_step: int = 1024  # 한 단계에 복사할 페이지 수 (writer는 최대 한 단계만 기다림)
+    backup_step_sleep_ms: int = 5  # 단계 사이에 쉬는 시간 (ms)
+    backup_max_restarts: int = 3  # 쓰기로 복사가 처음부터 다시 시작되는 최대 횟수 (넘으면 WAL 모드는 한 번에 복사, 아니면 실패)
+    backup_chunk_size_mb: int = 4  # 증분 스냅샷 청크 크기 (MB)
+    backup_compress: bool = True  # 청크 gzip 압축 여부
+    backup_keep: int = 48  # 보관할 스냅샷 수 (0이면 모두 보관)
+    backup_wal_enabled: bool = False  # 기본 DB/샤드를 WAL 모드로 사용 (백업 중에도 writer가 막히지 않음)
+
+    # 스키마 마이그레이션
+    auto_migrate: bool = True  # 앱 시작 시 마이그레이션 실행 (false면 manage.py migrate로 먼저 실행)
 
     class Config:
         env_file = ".env"
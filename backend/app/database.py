@@ -1,6 +1,17 @@
-from sqlalchemy import create_engine
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from fastapi import HTTPException, Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import settings
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
 
@@ -12,9 +23,269 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+@event.listens_for(Engine, "connect")
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """SQLite에서 ON DELETE CASCADE가 동작하도록 외래 키 제약 활성화"""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+def enable_wal(sqlite_engine: Engine) -> None:
+    """읽기 전용 연결이 쓰기를 막지 않도록 SQLite WAL 모드 사용"""
+
+    @event.listens_for(sqlite_engine, "connect")
+    def set_wal(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
+
+def create_read_only_engine(path: str) -> Engine:
+    """SQLite 파일에 대한 읽기 전용 엔진 생성"""
+    return create_engine(
+        f"sqlite:///file:{path}?mode=ro&uri=true",
+        connect_args={"check_same_thread": False},
+    )
+
+
+# 읽기 복제본 연결과 온라인 백업이 쓰기를 막지 않도록 WAL 모드 사용
+USE_WAL = settings.read_replica_enabled or settings.backup_wal_enabled
+
+if USE_WAL:
+    enable_wal(engine)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+class TenantEngineRegistry:
+    """
+    테넌트별 SQLite 샤드 엔진 풀
+
+    테넌트(Page.user_id)마다 별도의 SQLite 파일을 사용해서
+    쓰기 잠금을 테넌트끼리 공유하지 않도록 합니다.
+    열린 엔진 수는 LRU 방식으로 제한합니다.
+    """
+
+    def __init__(self, shard_dir: str, max_engines: int):
+        self.shard_dir = shard_dir
+        self.max_engines = max_engines
+        self._engines: "OrderedDict[tuple[int, bool], Engine]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def shard_path(self, tenant_id: int) -> str:
+        """테넌트 샤드 파일 경로"""
+        return os.path.join(self.shard_dir, f"tenant_{tenant_id}.db")
+
+    def shard_exists(self, tenant_id: int) -> bool:
+        """테넌트 샤드 파일이 있는지 확인"""
+        return os.path.exists(self.shard_path(tenant_id))
+
+    def list_tenants(self) -> list[int]:
+        """샤드 파일이 있는 테넌트 ID 목록"""
+        if not os.path.isdir(self.shard_dir):
+            return []
+        tenant_ids = []
+        for name in os.listdir(self.shard_dir):
+            if name.startswith("tenant_") and name.endswith(".db"):
+                try:
+                    tenant_ids.append(int(name[len("tenant_"):-len(".db")]))
+                except ValueError:
+                    continue
+        return sorted(tenant_ids)
+
+    def get_engine(self, tenant_id: int, read_only: bool = False) -> Engine:
+        """
+        테넌트 샤드 엔진 반환 (없으면 생성, 가장 오래 안 쓴 엔진은 정리)
+
+        Args:
+            tenant_id: 테넌트 ID
+            read_only: 읽기 전용 연결 엔진 여부
+
+        Returns:
+            샤드 엔진
+        """
+        key = (tenant_id, read_only)
+        with self._lock:
+            tenant_engine = self._engines.get(key)
+            if tenant_engine is not None:
+                self._engines.move_to_end(key)
+                return tenant_engine
+
+            if read_only:
+                tenant_engine = create_read_only_engine(self.shard_path(tenant_id))
+            else:
+                tenant_engine = create_engine(
+                    f"sqlite:///{self.shard_path(tenant_id)}",
+                    connect_args={"check_same_thread": False},
+                )
+                if USE_WAL:
+                    enable_wal(tenant_engine)
+            self._engines[key] = tenant_engine
+
+            while len(self._engines) > self.max_engines:
+                _, evicted = self._engines.popitem(last=False)
+                # 사용 중인 연결은 반납될 때 닫힘
+                evicted.dispose()
+
+            return tenant_engine
+
+    def open_engines(self) -> int:
+        """현재 열린 엔진 수"""
+        return len(self._engines)
+
+    def dispose_all(self) -> None:
+        """열린 엔진 모두 정리"""
+        with self._lock:
+            for tenant_engine in self._engines.values():
+                tenant_engine.dispose()
+            self._engines.clear()
+
+
+tenant_engines = TenantEngineRegistry(
+    settings.tenant_shard_dir, settings.tenant_max_open_engines
+)
+
+
+def get_tenant_id(request: Request) -> int | None:
+    """
+    요청에서 테넌트 ID를 추출
+
+    샤딩이 꺼져 있으면 None을 반환합니다.
+
+    Raises:
+        HTTPException: 테넌트 헤더가 없거나 형식이 잘못된 경우 (400)
+    """
+    if not settings.tenant_sharding_enabled:
+        return None
+
+    raw_tenant_id = request.headers.get(settings.tenant_header)
+    if raw_tenant_id is None:
+        raise HTTPException(
+            status_code=400, detail=f"Missing {settings.tenant_header} header"
+        )
+    try:
+        return int(raw_tenant_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid {settings.tenant_header} header"
+        )
+
+
+def get_tenant_db(request: Request):
+    """
+    테넌트 샤드에 연결된 세션을 반환하는 get_db 변형
+
+    샤딩이 꺼져 있으면 기본 데이터베이스 세션을 반환합니다.
+
+    Raises:
+        HTTPException: 테넌트 샤드가 없는 경우 (404)
+    """
+    tenant_id = get_tenant_id(request)
+    if tenant_id is None:
+        yield from get_db()
+        return
+
+    if not tenant_engines.shard_exists(tenant_id):
+        raise HTTPException(status_code=404, detail="Tenant shard not found")
+
+    db = Session(bind=tenant_engines.get_engine(tenant_id), autoflush=False)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class ReadReplicaRouter:
+    """
+    읽기 전용 세션용 복제본 엔진 선택기
+
+    복제본 URL이 없으면 기본 SQLite 파일에 대한 읽기 전용 WAL 연결을 사용합니다.
+    여러 복제본은 라운드 로빈으로 돌아가며 사용합니다.
+    """
+
+    def __init__(self, replica_urls: list[str]):
+        self.replica_urls = replica_urls
+        self._engines: list[Engine] = []
+        self._cycle = None
+        self._lock = threading.Lock()
+
+    def _create_engines(self) -> list[Engine]:
+        if not self.replica_urls:
+            return [create_read_only_engine(engine.url.database)]
+        return [create_engine(url) for url in self.replica_urls]
+
+    def get_engine(self) -> Engine:
+        """다음 복제본 엔진 반환 (처음 호출 시 생성)"""
+        with self._lock:
+            if self._cycle is None:
+                self._engines = self._create_engines()
+                self._cycle = itertools.cycle(self._engines)
+            return next(self._cycle)
+
+
+read_replicas = ReadReplicaRouter(settings.read_replica_urls)
+
+# 마지막 쓰기 이후 primary에서 읽어야 하는 시각을 담는 쿠키
+READ_YOUR_WRITES_COOKIE = "rw_sticky_until"
+
+
+def wrote_recently(request: Request) -> bool:
+    """이 클라이언트가 복제 지연 허용 시간 안에 쓰기를 했는지 확인"""
+    try:
+        sticky_until = float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0))
+    except ValueError:
+        return False
+    return sticky_until > time.time()
+
+
+def primary_bind(db: Session) -> Engine:
+    """세션의 쓰기(primary) 엔진 반환 (읽기 세션이면 대응하는 primary)"""
+    return db.info.get("primary_bind") or db.get_bind()
+
+
+def bind_key(bind: Engine) -> str:
+    """
+    엔진이 가리키는 데이터베이스의 고정 식별자 (SQLite 파일 절대 경로)
+
+    샤드 엔진은 LRU에서 밀려나면 새 Engine 객체로 다시 만들어지므로,
+    엔진별 상태(버퍼, writer, 트리)는 Engine 객체 대신 이 값으로 구분합니다.
+    """
+    database = bind.url.database
+    return os.path.abspath(database) if database else str(bind.url)
+
+
+def get_read_db(request: Request):
+    """
+    읽기 전용 라우트용 세션
+
+    복제본 라우팅이 켜져 있으면 복제본(또는 SQLite 읽기 전용 연결)에 연결합니다.
+    클라이언트가 최근에 쓰기를 했다면 자신의 쓰기를 볼 수 있도록 primary를 사용합니다.
+    """
+    tenant_id = get_tenant_id(request)
+    if tenant_id is not None and not tenant_engines.shard_exists(tenant_id):
+        raise HTTPException(status_code=404, detail="Tenant shard not found")
+
+    use_primary = not settings.read_replica_enabled or wrote_recently(request)
+    if use_primary:
+        yield from get_tenant_db(request)
+        return
+
+    if tenant_id is None:
+        primary, replica = engine, read_replicas.get_engine()
+    else:
+        primary = tenant_engines.get_engine(tenant_id)
+        replica = tenant_engines.get_engine(tenant_id, read_only=True)
+
+    db = Session(bind=replica, autoflush=False, info={"primary_bind": primary})
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,15 +1,25 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.database import engine, Base
-from app.routers import examples, pages, blocks, mcp
-from app.models import Page, Block  # Import for table creation
-
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+from app.config import settings
+from app.database import engine, SessionLocal
+from app.middleware import (
+    AdmissionControlMiddleware,
+    CompressionMiddleware,
+    ReadYourWritesMiddleware,
+)
+from app.routers import examples, pages, blocks, mcp, admin, todos, changes
+from app.services.write_behind import block_write_buffer
+from app.services.writer import write_queue
+from app.services.page_tree import page_trees
+from app.migrations import run_migrations
 
 app = FastAPI(title="Module 5 API", version="1.0.0")
 
+# 과부하 시 요청 거절 (CORS 안쪽에 두어 거절 응답에도 CORS 헤더가 붙도록 먼저 등록)
+if settings.admission_control_enabled:
+    app.add_middleware(AdmissionControlMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -19,11 +29,56 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 읽기 복제본 사용 시 쓰기 직후 읽기는 primary로 보냄
+if settings.read_replica_enabled:
+    app.add_middleware(
+        ReadYourWritesMiddleware, window_seconds=settings.read_your_writes_seconds
+    )
+
+# 큰 응답 압축 (br/gzip)
+if settings.response_compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.response_compression_min_size,
+        gzip_level=settings.response_gzip_level,
+        brotli_quality=settings.response_brotli_quality,
+    )
+
 # 라우터 등록
 app.include_router(examples.router)
 app.include_router(pages.router)
 app.include_router(blocks.router)
 app.include_router(mcp.router)
+app.include_router(todos.router)
+app.include_router(changes.router)
+app.include_router(admin.router)
+
+
+@app.on_event("startup")
+def migrate_schema():
+    # 스키마 마이그레이션 (잠금으로 한 워커만 실행, 이미 최신이면 버전만 확인)
+    if settings.auto_migrate:
+        run_migrations(engine)
+
+
+@app.on_event("startup")
+def start_write_behind():
+    block_write_buffer.start()
+
+
+@app.on_event("startup")
+def load_page_tree():
+    # 페이지 계층 구조 메모리 인덱스 (테넌트 샤드는 처음 사용할 때 읽음)
+    if page_trees.enabled:
+        with SessionLocal() as db:
+            page_trees.load(db)
+
+
+@app.on_event("shutdown")
+def flush_write_behind():
+    # 버퍼에 남은 블록 수정 사항을 모두 반영
+    block_write_buffer.stop()
+    write_queue.stop()
 
 
 @app.get("/api/health")
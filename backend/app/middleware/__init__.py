@@ -0,0 +1,10 @@
+from app.middleware.admission import AdmissionControlMiddleware, admission_controller
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
+
+__all__ = [
+    "AdmissionControlMiddleware",
+    "admission_controller",
+    "CompressionMiddleware",
+    "ReadYourWritesMiddleware",
+]
@@ -0,0 +1,325 @@
+"""
+요청 수락 제어(admission control) 및 부하 차단 미들웨어
+
+요청이 몰릴 때 동기 엔드포인트가 스레드 풀에 끝없이 쌓여 모두 타임아웃되는 대신,
+- 라우트 종류(read / write / heavy)별 동시 실행 수를 제한하고
+- 대기열 길이와 대기 시간을 제한해서 넘치면 바로 `503`을,
+- 클라이언트별 토큰 버킷으로 요청 속도를 제한해서 넘치면 `429`를
+`Retry-After` 헤더와 함께 반환합니다.
+"""
+
+import asyncio
+import math
+import re
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Pattern, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.database import tenant_engines
+
+# (라우트 종류, 메서드 집합(None이면 전체), 경로 정규식) - 위에서부터 처음 맞는 규칙 사용
+ROUTE_CLASS_RULES: List[Tuple[str, Optional[set], Pattern]] = [
+    ("exempt", None, re.compile(r"^/api/(health|admin/(metrics|backups))")),
+    ("heavy", {"POST"}, re.compile(r"^/api/mcp/import")),
+    ("heavy", {"POST"}, re.compile(r"^/api/pages/(move|\d+/duplicate)$")),
+    ("heavy", {"DELETE"}, re.compile(r"^/api/pages/\d+$")),
+    ("read", {"GET", "HEAD"}, re.compile(r"")),
+    ("write", None, re.compile(r"")),
+]
+
+
+def classify(method: str, path: str) -> str:
+    """요청을 라우트 종류(exempt / heavy / read / write)로 분류"""
+    if method == "OPTIONS":
+        return "exempt"
+    for route_class, methods, pattern in ROUTE_CLASS_RULES:
+        if (methods is None or method in methods) and pattern.match(path):
+            return route_class
+    return "write"
+
+
+class ConcurrencyLimiter:
+    """
+    대기열 길이가 제한된 비동기 세마포어
+
+    Args:
+        limit: 동시에 실행할 수 있는 요청 수
+        max_waiting: 대기할 수 있는 요청 수 (넘치면 바로 거절)
+        wait_timeout: 최대 대기 시간 (초)
+    """
+
+    def __init__(self, limit: int, max_waiting: int, wait_timeout: float):
+        self.limit = limit
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        # 통계
+        self.admitted = 0
+        self.rejected = 0
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """실행 슬롯 획득 (대기열이 가득 찼거나 시간 초과면 False)"""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return True
+
+        if len(self._waiters) >= self.max_waiting:
+            self.rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.wait_timeout)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # 시간 초과 직전에 슬롯을 넘겨받은 경우
+                self.admitted += 1
+                return True
+            waiter.cancel()
+            self._remove(waiter)
+            self.rejected += 1
+            return False
+        except asyncio.CancelledError:
+            # 대기 중 요청 취소 (클라이언트 연결 종료 등)
+            if waiter.done() and not waiter.cancelled():
+                # 이미 넘겨받은 슬롯은 다음 대기자에게 넘김
+                self.release()
+            else:
+                waiter.cancel()
+                self._remove(waiter)
+            raise
+        self.admitted += 1
+        return True
+
+    def _remove(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self) -> None:
+        """실행 슬롯 반납 (대기 중인 요청이 있으면 슬롯을 바로 넘김)"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+class TokenBucketLimiter:
+    """
+    클라이언트별 토큰 버킷 속도 제한
+
+    Args:
+        rate: 초당 충전되는 토큰 수
+        burst: 버킷 최대 크기
+        max_clients: 추적할 최대 클라이언트 수 (LRU)
+    """
+
+    def __init__(self, rate: float, burst: int, max_clients: int = 10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self.limited = 0
+
+    def consume(self, client: str) -> float:
+        """
+        토큰 하나 사용
+
+        Returns:
+            0이면 허용, 아니면 다음 토큰까지 기다려야 하는 시간 (초)
+        """
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(client, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / self.rate
+            self.limited += 1
+
+        self._buckets[client] = (tokens, now)
+        while len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "clients": len(self._buckets),
+            "limited": self.limited,
+        }
+
+
+class AdmissionController:
+    """
+    라우트 종류별 동시 실행 제한과 클라이언트별 속도 제한을 묶은 컨트롤러
+
+    Args:
+        enabled: 수락 제어 사용 여부 (메트릭 표시용)
+        concurrency: 라우트 종류별 동시 실행 수 {"read": 32, "write": 8, "heavy": 2}
+        queue_sizes: 라우트 종류별 최대 대기 요청 수
+        queue_timeout: 최대 대기 시간 (초)
+        retry_after_seconds: 503 응답의 Retry-After 값 (초)
+        rate_per_second: 클라이언트별 초당 요청 수 (0이면 속도 제한 안 함)
+        burst: 클라이언트별 순간 최대 요청 수
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        concurrency: Dict[str, int],
+        queue_sizes: Dict[str, int],
+        queue_timeout: float,
+        retry_after_seconds: float,
+        rate_per_second: float,
+        burst: int,
+    ):
+        self.enabled = enabled
+        self.retry_after_seconds = retry_after_seconds
+        self.limiters = {
+            route_class: ConcurrencyLimiter(limit, queue_sizes[route_class], queue_timeout)
+            for route_class, limit in concurrency.items()
+        }
+        self.rate_limiter = (
+            TokenBucketLimiter(rate_per_second, burst) if rate_per_second > 0 else None
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """실시간 대기열 / 거절 통계"""
+        return {
+            "enabled": self.enabled,
+            "routes": {name: limiter.stats() for name, limiter in self.limiters.items()},
+            "rate_limit": self.rate_limiter.stats() if self.rate_limiter else None,
+        }
+
+
+# 전역 컨트롤러 인스턴스 (메트릭 조회용)
+admission_controller = AdmissionController(
+    enabled=settings.admission_control_enabled,
+    concurrency={
+        "read": settings.admission_read_concurrency,
+        "write": settings.admission_write_concurrency,
+        "heavy": settings.admission_heavy_concurrency,
+    },
+    queue_sizes={
+        "read": settings.admission_queue_size,
+        "write": settings.admission_queue_size,
+        "heavy": settings.admission_heavy_queue_size,
+    },
+    queue_timeout=settings.admission_queue_timeout_seconds,
+    retry_after_seconds=settings.admission_retry_after_seconds,
+    rate_per_second=settings.rate_limit_per_second,
+    burst=settings.rate_limit_burst,
+)
+
+
+def scope_tenant_id(scope: Scope) -> Optional[int]:
+    """
+    요청의 테넌트 ID (샤딩이 켜져 있고 헤더가 유효한 테넌트 샤드를 가리킬 때만)
+
+    헤더는 클라이언트가 마음대로 바꿀 수 있으므로 검증하지 않은 값은 쓰지 않습니다.
+    """
+    if not settings.tenant_sharding_enabled:
+        return None
+    tenant_header = settings.tenant_header.lower().encode("latin-1")
+    for key, value in scope.get("headers", []):
+        if key == tenant_header:
+            try:
+                tenant_id = int(value.decode("latin-1"))
+            except ValueError:
+                return None
+            return tenant_id if tenant_engines.shard_exists(tenant_id) else None
+    return None
+
+
+def client_key(scope: Scope) -> str:
+    """속도 제한에 사용할 클라이언트 식별자 (유효한 테넌트면 테넌트 포함, 아니면 호스트만)"""
+    client = scope.get("client")
+    host = client[0] if client else "unknown"
+    tenant_id = scope_tenant_id(scope)
+    return f"{tenant_id}@{host}" if tenant_id is not None else host
+
+
+async def send_rejection(send: Send, status: int, detail: str, retry_after: float) -> None:
+    """JSON 본문과 Retry-After 헤더가 있는 거절 응답 전송"""
+    body = f'{{"detail":"{detail}"}}'.encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionControlMiddleware:
+    """
+    요청 수락 제어 ASGI 미들웨어
+
+    Args:
+        app: 감쌀 ASGI 앱
+        controller: 사용할 AdmissionController
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController = admission_controller):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = classify(scope["method"], scope["path"])
+        if route_class == "exempt":
+            await self.app(scope, receive, send)
+            return
+
+        rate_limiter = self.controller.rate_limiter
+        if rate_limiter is not None:
+            retry_after = rate_limiter.consume(client_key(scope))
+            if retry_after:
+                await send_rejection(send, 429, "Too many requests", retry_after)
+                return
+
+        limiter = self.controller.limiters[route_class]
+        if not await limiter.acquire():
+            await send_rejection(
+                send, 503, "Server is busy, please retry", self.controller.retry_after_seconds
+            )
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
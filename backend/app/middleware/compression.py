@@ -0,0 +1,185 @@
+"""
+응답 압축 미들웨어
+
+`Accept-Encoding`에 따라 brotli(설치된 경우) 또는 gzip으로 응답을 압축합니다.
+임계값보다 작은 응답은 압축하지 않고, 스트리밍 응답은 청크 단위로 바로 압축해서
+큰 응답을 메모리에 두 번 버퍼링하지 않습니다.
+"""
+
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성
+    brotli = None
+
+
+class GzipCompressor:
+    """zlib 기반 스트리밍 gzip 압축기"""
+
+    encoding = "gzip"
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    """스트리밍 brotli 압축기"""
+
+    encoding = "br"
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Accept-Encoding 헤더에서 q=0이 아닌 인코딩 목록 추출"""
+    encodings = set()
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        if name:
+            encodings.add(name.strip())
+    return encodings
+
+
+class CompressionMiddleware:
+    """
+    brotli/gzip 응답 압축 ASGI 미들웨어
+
+    Args:
+        app: 감쌀 ASGI 앱
+        minimum_size: 이 크기(bytes) 미만의 응답은 압축하지 않음
+        gzip_level: gzip 압축 레벨 (1-9)
+        brotli_quality: brotli 압축 품질 (0-11)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def choose_compressor(self, scope: Scope):
+        """클라이언트가 받을 수 있는 압축기 선택 (없으면 None)"""
+        encodings = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        if brotli is not None and "br" in encodings:
+            return lambda: BrotliCompressor(self.brotli_quality)
+        if "gzip" in encodings:
+            return lambda: GzipCompressor(self.gzip_level)
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        compressor_factory = self.choose_compressor(scope)
+        if compressor_factory is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(self.app, self.minimum_size, compressor_factory)
+        await responder(scope, receive, send)
+
+
+class CompressionResponder:
+    """응답 하나를 압축해서 전송하는 헬퍼"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int, compressor_factory):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compressor_factory = compressor_factory
+        self.compressor = None
+        self.send: Send = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # 헤더를 어떻게 바꿀지 첫 본문 청크를 보고 결정
+            self.initial_message = message
+            self.passthrough = "content-encoding" in Headers(raw=message["headers"])
+            return
+
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.passthrough:
+            if not self.started:
+                self.started = True
+                await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            if len(body) < self.minimum_size and not more_body:
+                # 작은 응답은 압축하지 않음
+                await self.send(self.initial_message)
+                await self.send(message)
+                self.passthrough = True
+                return
+
+            self.compressor = self.compressor_factory()
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = self.compressor.encoding
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body:
+                # 한 번에 전송되는 응답
+                compressed = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(compressed))
+                await self.send(self.initial_message)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+            # 스트리밍 응답: 길이를 알 수 없으므로 chunked 전송
+            del headers["Content-Length"]
+            await self.send(self.initial_message)
+
+        if more_body:
+            chunk = self.compressor.compress(body) + self.compressor.flush()
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": True})
+        else:
+            chunk = self.compressor.compress(body) + self.compressor.finish()
+            await self.send({"type": "http.response.body", "body": chunk})
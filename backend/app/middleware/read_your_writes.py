@@ -0,0 +1,53 @@
+"""
+Read-your-writes 미들웨어
+
+쓰기 요청이 성공하면 `rw_sticky_until` 쿠키를 설정해서,
+복제 지연 허용 시간 동안 해당 클라이언트의 읽기를 primary로 보냅니다.
+쿠키 기반이라 여러 워커 사이에서도 상태 공유 없이 동작합니다.
+"""
+
+import time
+from http.cookies import SimpleCookie
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database import READ_YOUR_WRITES_COOKIE
+
+# 쓰기로 간주하지 않는 메서드
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadYourWritesMiddleware:
+    """
+    성공한 쓰기 요청 응답에 read-your-writes 쿠키를 추가하는 ASGI 미들웨어
+
+    Args:
+        app: 감쌀 ASGI 앱
+        window_seconds: 쓰기 후 primary에서 읽을 시간 (복제 지연 허용치)
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: float):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = SimpleCookie()
+                cookie[READ_YOUR_WRITES_COOKIE] = f"{time.time() + self.window_seconds:.3f}"
+                cookie[READ_YOUR_WRITES_COOKIE]["path"] = "/"
+                cookie[READ_YOUR_WRITES_COOKIE]["max-age"] = int(self.window_seconds) + 1
+                cookie[READ_YOUR_WRITES_COOKIE]["httponly"] = True
+                cookie[READ_YOUR_WRITES_COOKIE]["samesite"] = "lax"
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"set-cookie", cookie.output(header="").strip().encode("latin-1"))
+                )
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,91 @@
+"""
+버전별 스키마 마이그레이션
+
+스키마는 앱 import 시점이 아니라 이 모듈로 한 번만 바꿉니다.
+각 버전은 `vNNNN_*.py` 모듈(VERSION, DESCRIPTION, upgrade(connection))이고,
+적용한 버전은 `schema_version` 테이블에 기록합니다.
+
+- `run_migrations()`는 `BEGIN IMMEDIATE`로 쓰기 잠금을 잡고 실행하므로,
+  여러 워커가 동시에 시작해도 한 프로세스만 DDL을 실행하고 나머지는
+  잠금이 풀린 뒤 이미 적용된 것을 확인하고 넘어갑니다.
+- 이미 최신이면 잠금 없이 버전 하나만 읽고 끝나므로 시작 비용이 거의 없습니다.
+- 운영에서는 `python manage.py migrate`로 워커를 띄우기 전에 실행하고
+  `AUTO_MIGRATE=false`로 워커에서는 건너뛸 수 있습니다.
+"""
+
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.migrations import v0001_baseline, v0002_block_order_index
+
+MIGRATIONS = [v0001_baseline, v0002_block_order_index]
+LATEST_VERSION = MIGRATIONS[-1].VERSION
+
+SCHEMA_VERSION_DDL = """CREATE TABLE IF NOT EXISTS schema_version (
+	version INTEGER NOT NULL,
+	description VARCHAR(200) NOT NULL,
+	applied_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	PRIMARY KEY (version)
+)"""
+
+
+def read_version(connection: Connection) -> int:
+    """적용된 마지막 버전 (schema_version 테이블이 없으면 0)"""
+    has_table = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+    ).first()
+    if has_table is None:
+        return 0
+    return connection.exec_driver_sql("SELECT max(version) FROM schema_version").scalar() or 0
+
+
+def current_version(bind: Engine) -> int:
+    """데이터베이스에 적용된 마지막 스키마 버전"""
+    with bind.connect() as connection:
+        return read_version(connection)
+
+
+def run_migrations(bind: Engine, lock_timeout: float = 60.0) -> List[int]:
+    """
+    적용되지 않은 마이그레이션을 순서대로 실행
+
+    모든 버전을 한 트랜잭션으로 적용하므로 중간에 실패하면 아무것도 바뀌지 않습니다.
+
+    Args:
+        bind: SQLite 엔진 (기본 데이터베이스 또는 테넌트 샤드)
+        lock_timeout: 다른 프로세스의 마이그레이션을 기다릴 최대 시간 (초)
+
+    Returns:
+        이번에 적용한 버전 목록 (이미 최신이면 빈 리스트)
+    """
+    with bind.connect() as connection:
+        if read_version(connection) >= LATEST_VERSION:
+            return []
+        connection.rollback()
+
+        connection.exec_driver_sql(f"PRAGMA busy_timeout = {int(lock_timeout * 1000)}")
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            # 잠금을 기다리는 동안 다른 프로세스가 적용했을 수 있으므로 다시 확인
+            connection.exec_driver_sql(SCHEMA_VERSION_DDL)
+            version = read_version(connection)
+            applied = []
+            for migration in MIGRATIONS:
+                if migration.VERSION <= version:
+                    continue
+                migration.upgrade(connection)
+                connection.execute(
+                    text("INSERT INTO schema_version (version, description) VALUES (:version, :description)"),
+                    {"version": migration.VERSION, "description": migration.DESCRIPTION},
+                )
+                applied.append(migration.VERSION)
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+        finally:
+            # 풀로 돌아가는 연결은 기본 대기 시간(5초)으로 복원
+            connection.exec_driver_sql("PRAGMA busy_timeout = 5000")
+    return applied
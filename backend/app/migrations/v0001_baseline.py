@@ -0,0 +1,144 @@
+"""
+v0001: 기준 스키마
+
+이 마이그레이션 이전에는 앱이 시작할 때마다 `create_all`과 `add_missing_columns`로
+스키마를 맞췄습니다. 그 결과를 고정된 DDL로 옮긴 것이므로, 빈 데이터베이스에는
+전체 스키마를 만들고 기존 데이터베이스에는 빠진 테이블/컬럼/인덱스/트리거만 추가합니다.
+
+모델이 바뀌어도 이 파일은 수정하지 않습니다. 스키마 변경은 새 버전 파일로 추가합니다.
+"""
+
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+VERSION = 1
+DESCRIPTION = "baseline schema"
+
+TABLES = [
+    """CREATE TABLE IF NOT EXISTS examples (
+	id INTEGER NOT NULL,
+	name VARCHAR(100) NOT NULL,
+	description VARCHAR(500),
+	created_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	updated_at DATETIME,
+	PRIMARY KEY (id)
+)""",
+    """CREATE TABLE IF NOT EXISTS pages (
+	id INTEGER NOT NULL,
+	title VARCHAR(500) NOT NULL,
+	icon VARCHAR(10),
+	parent_id INTEGER,
+	user_id INTEGER,
+	child_count INTEGER DEFAULT '0' NOT NULL,
+	block_count INTEGER DEFAULT '0' NOT NULL,
+	content_bytes INTEGER DEFAULT '0' NOT NULL,
+	created_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	updated_at DATETIME,
+	PRIMARY KEY (id),
+	FOREIGN KEY(parent_id) REFERENCES pages (id) ON DELETE CASCADE
+)""",
+    """CREATE TABLE IF NOT EXISTS page_tree_version (
+	id INTEGER NOT NULL,
+	version INTEGER DEFAULT '0' NOT NULL,
+	PRIMARY KEY (id)
+)""",
+    """CREATE TABLE IF NOT EXISTS change_log (
+	seq INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+	entity VARCHAR(10) NOT NULL,
+	entity_id INTEGER NOT NULL,
+	page_id INTEGER,
+	op VARCHAR(10) NOT NULL,
+	changed_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	CONSTRAINT uq_change_log_entity UNIQUE (entity, entity_id)
+)""",
+    """CREATE TABLE IF NOT EXISTS change_log_state (
+	id INTEGER NOT NULL,
+	compacted_seq INTEGER DEFAULT '0' NOT NULL,
+	PRIMARY KEY (id)
+)""",
+    """CREATE TABLE IF NOT EXISTS blocks (
+	id INTEGER NOT NULL,
+	page_id INTEGER NOT NULL,
+	type VARCHAR(50) NOT NULL,
+	content TEXT,
+	"order" FLOAT NOT NULL,
+	created_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+	updated_at DATETIME,
+	checked BOOLEAN GENERATED ALWAYS AS (CASE WHEN type = 'todo' THEN coalesce(substr(content, 1, 3) = '[x]', 0) END),
+	PRIMARY KEY (id),
+	FOREIGN KEY(page_id) REFERENCES pages (id) ON DELETE CASCADE
+)""",
+    """CREATE TABLE IF NOT EXISTS page_links (
+	source_block_id INTEGER NOT NULL,
+	target_page_id INTEGER NOT NULL,
+	source_page_id INTEGER NOT NULL,
+	PRIMARY KEY (source_block_id, target_page_id),
+	FOREIGN KEY(source_block_id) REFERENCES blocks (id) ON DELETE CASCADE,
+	FOREIGN KEY(target_page_id) REFERENCES pages (id) ON DELETE CASCADE,
+	FOREIGN KEY(source_page_id) REFERENCES pages (id) ON DELETE CASCADE
+)""",
+]
+
+# 집계/생성 컬럼이 생기기 전에 만들어진 데이터베이스에 추가할 컬럼
+LEGACY_COLUMNS = [
+    ("pages", "child_count", "INTEGER NOT NULL DEFAULT '0'"),
+    ("pages", "block_count", "INTEGER NOT NULL DEFAULT '0'"),
+    ("pages", "content_bytes", "INTEGER NOT NULL DEFAULT '0'"),
+    # SQLite는 VIRTUAL 생성 컬럼만 ALTER TABLE로 추가할 수 있음
+    (
+        "blocks",
+        "checked",
+        "BOOLEAN GENERATED ALWAYS AS "
+        "(CASE WHEN type = 'todo' THEN coalesce(substr(content, 1, 3) = '[x]', 0) END)",
+    ),
+]
+COUNT_COLUMNS = {"child_count", "block_count", "content_bytes"}
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_examples_id ON examples (id)",
+    "CREATE INDEX IF NOT EXISTS ix_pages_id ON pages (id)",
+    "CREATE INDEX IF NOT EXISTS ix_pages_parent_id ON pages (parent_id)",
+    "CREATE INDEX IF NOT EXISTS ix_blocks_id ON blocks (id)",
+    "CREATE INDEX IF NOT EXISTS ix_blocks_page_id ON blocks (page_id)",
+    'CREATE INDEX IF NOT EXISTS ix_blocks_order ON blocks ("order")',
+    "CREATE INDEX IF NOT EXISTS ix_blocks_todo_checked_id ON blocks (checked, id) WHERE type = 'todo'",
+    "CREATE INDEX IF NOT EXISTS ix_blocks_todo_id ON blocks (id) WHERE type = 'todo'",
+    "CREATE INDEX IF NOT EXISTS ix_page_links_source_page_id ON page_links (source_page_id)",
+    "CREATE INDEX IF NOT EXISTS ix_page_links_target_source ON page_links (target_page_id, source_page_id)",
+]
+
+# 변경 로그 트리거 (app.services.change_log 참고)
+TRIGGERS = [
+    f"CREATE TRIGGER IF NOT EXISTS change_log_{table}_{event.lower()} "
+    f"AFTER {event} ON {table} BEGIN "
+    f"INSERT OR REPLACE INTO change_log (entity, entity_id, page_id, op) "
+    f"VALUES ('{entity}', {row}.id, {row}.{page_id}, '{op}'); "
+    f"END"
+    for table, entity, page_id in (("pages", "page", "id"), ("blocks", "block", "page_id"))
+    for event, row, op in (("INSERT", "NEW", "upsert"), ("UPDATE", "NEW", "upsert"), ("DELETE", "OLD", "delete"))
+]
+
+
+def table_columns(connection: Connection, table: str) -> set:
+    """테이블의 컬럼 이름 (생성 컬럼 포함)"""
+    rows = connection.exec_driver_sql(f"PRAGMA table_xinfo({table})").all()
+    return {row[1] for row in rows}
+
+
+def upgrade(connection: Connection) -> None:
+    for ddl in TABLES:
+        connection.exec_driver_sql(ddl)
+
+    added = []
+    for table, column, spec in LEGACY_COLUMNS:
+        if column not in table_columns(connection, table):
+            connection.exec_driver_sql(f'ALTER TABLE {table} ADD COLUMN "{column}" {spec}')
+            added.append(column)
+
+    for ddl in INDEXES + TRIGGERS:
+        connection.exec_driver_sql(ddl)
+
+    if COUNT_COLUMNS.intersection(added):
+        # 새로 추가된 집계 컬럼 채우기
+        from app.services.page_counts import reconcile_page_counts
+        reconcile_page_counts(Session(bind=connection))
@@ -0,0 +1,22 @@
+"""
+v0002: 블록 (page_id, order, id) 복합 인덱스
+
+페이지 블록 조회는 `WHERE page_id = ? ORDER BY order, id`인데 page_id / order 단일
+인덱스로는 page_id로 찾은 뒤 임시 B-tree로 다시 정렬해야 했습니다.
+복합 인덱스 하나로 찾기와 정렬(그리고 keyset 창의 시작 위치 찾기)을 모두 처리하고,
+이 인덱스의 앞부분과 겹치는 page_id 인덱스와 어떤 쿼리도 쓰지 않는 order 단일 인덱스는
+쓰기 비용만 늘리므로 삭제합니다.
+"""
+
+from sqlalchemy.engine import Connection
+
+VERSION = 2
+DESCRIPTION = "blocks (page_id, order, id) index"
+
+
+def upgrade(connection: Connection) -> None:
+    connection.exec_driver_sql(
+        'CREATE INDEX IF NOT EXISTS ix_blocks_page_order ON blocks (page_id, "order", id)'
+    )
+    connection.exec_driver_sql("DROP INDEX IF EXISTS ix_blocks_page_id")
+    connection.exec_driver_sql("DROP INDEX IF EXISTS ix_blocks_order")
@@ -1,5 +1,16 @@
 from app.models.example import Example
 from app.models.page import Page
 from app.models.block import Block
+from app.models.page_link import PageLink
+from app.models.page_tree_version import PageTreeVersion
+from app.models.change_log import ChangeLogEntry, ChangeLogState
 
-__all__ = ["Example", "Page", "Block"]
+__all__ = [
+    "Example",
+    "Page",
+    "Block",
+    "PageLink",
+    "PageTreeVersion",
+    "ChangeLogEntry",
+    "ChangeLogState",
+]
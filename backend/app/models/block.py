@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text
+from sqlalchemy import (
+    Boolean, Column, Computed, DateTime, Float, ForeignKey, Index, Integer, String, Text, text
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -9,12 +11,28 @@ class Block(Base):
     __tablename__ = "blocks"
 
     id = Column(Integer, primary_key=True, index=True)
-    page_id = Column(Integer, ForeignKey("pages.id", ondelete="CASCADE"), nullable=False, index=True)  # Index for query performance
+    page_id = Column(Integer, ForeignKey("pages.id", ondelete="CASCADE"), nullable=False)
     type = Column(String(50), nullable=False)  # text, heading1, heading2, etc.
     content = Column(Text, nullable=True)  # JSON string for rich content
-    order = Column(Float, nullable=False, default=0.0, index=True)  # Index for sorting performance
+    order = Column(Float, nullable=False, default=0.0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Todo state parsed from "[x] text" / "[ ] text" content (NULL for other block types).
+    # Generated by the database, so every write path keeps it in sync.
+    checked = Column(
+        Boolean,
+        Computed(
+            "CASE WHEN type = 'todo' THEN coalesce(substr(content, 1, 3) = '[x]', 0) END"
+        ),
+    )
+
+    __table_args__ = (
+        # Page blocks: WHERE page_id = ? ORDER BY order, id (no temp sort, keyset windows)
+        Index("ix_blocks_page_order", "page_id", "order", "id"),
+        # Workspace-wide todo lists: WHERE type = 'todo' [AND checked = ?] ORDER BY id
+        Index("ix_blocks_todo_checked_id", "checked", "id", sqlite_where=text("type = 'todo'")),
+        Index("ix_blocks_todo_id", "id", sqlite_where=text("type = 'todo'")),
+    )
 
     # Relationship back to page
     page = relationship("Page", back_populates="blocks")
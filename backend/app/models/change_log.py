@@ -0,0 +1,33 @@
+from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class ChangeLogEntry(Base):
+    """
+    Latest change per page/block, written by SQLite triggers (see services/change_log.py).
+    seq is AUTOINCREMENT so cursors never see a reused value after compaction.
+    """
+    __tablename__ = "change_log"
+
+    seq = Column(Integer, primary_key=True)
+    entity = Column(String(10), nullable=False)  # page, block
+    entity_id = Column(Integer, nullable=False)
+    page_id = Column(Integer, nullable=True)  # Page the entity belongs to (itself for pages)
+    op = Column(String(10), nullable=False)  # upsert, delete
+    changed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # One row per entity: triggers use INSERT OR REPLACE to keep only the latest change
+        UniqueConstraint("entity", "entity_id", name="uq_change_log_entity"),
+        {"sqlite_autoincrement": True},
+    )
+
+
+class ChangeLogState(Base):
+    """Single-row compaction horizon: cursors at or below compacted_seq must resync fully"""
+    __tablename__ = "change_log_state"
+
+    id = Column(Integer, primary_key=True)
+    compacted_seq = Column(Integer, nullable=False, default=0, server_default="0")
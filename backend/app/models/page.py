@@ -13,6 +13,10 @@ class Page(Base):
     icon = Column(String(10), nullable=True)  # Emoji
     parent_id = Column(Integer, ForeignKey("pages.id", ondelete="CASCADE"), nullable=True, index=True)  # Index for query performance
     user_id = Column(Integer, nullable=True)  # FK to users table (not implemented yet)
+    # Denormalized counts, maintained by every write path (see services/page_counts.py)
+    child_count = Column(Integer, nullable=False, default=0, server_default="0")
+    block_count = Column(Integer, nullable=False, default=0, server_default="0")
+    content_bytes = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, ForeignKey, Index
+
+from app.database import Base
+
+
+class PageLink(Base):
+    """Index of page references found in block content (for backlinks)"""
+    __tablename__ = "page_links"
+
+    source_block_id = Column(Integer, ForeignKey("blocks.id", ondelete="CASCADE"), primary_key=True)
+    target_page_id = Column(Integer, ForeignKey("pages.id", ondelete="CASCADE"), primary_key=True)
+    source_page_id = Column(Integer, ForeignKey("pages.id", ondelete="CASCADE"), nullable=False)
+
+    __table_args__ = (
+        # "What links here" lookups
+        Index("ix_page_links_target_source", "target_page_id", "source_page_id"),
+        Index("ix_page_links_source_page_id", "source_page_id"),
+    )
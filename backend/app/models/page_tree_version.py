@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer
+
+from app.database import Base
+
+
+class PageTreeVersion(Base):
+    """Single-row counter bumped by every page hierarchy write (cache invalidation signal)"""
+    __tablename__ = "page_tree_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
@@ -0,0 +1,73 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import get_tenant_db, primary_bind, tenant_engines
+from app.middleware import admission_controller
+from app.services.backup import backup_manager, database_name
+from app.services.notion_blocks import conversion_totals
+from app.services.page_tree import page_trees
+from app.services.write_behind import block_write_buffer
+from app.services.writer import write_queue
+
+
+def require_admin_token(x_admin_token: str | None = Header(None)):
+    """Allow admin endpoints only with the configured X-Admin-Token."""
+    if not settings.admin_api_token:
+        raise HTTPException(status_code=404, detail="Admin API is disabled")
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, settings.admin_api_token):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+router = APIRouter(
+    prefix="/api/admin", tags=["admin"], dependencies=[Depends(require_admin_token)]
+)
+
+
+@router.get("/metrics")
+def get_metrics():
+    """Live queue depths and rejection counters for load shedding dashboards."""
+    return {
+        "admission": admission_controller.stats(),
+        "write_behind": block_write_buffer.stats(),
+        "writer": write_queue.stats(),
+        "page_tree": page_trees.stats(),
+        "backup": backup_manager.stats(),
+        "notion_import": conversion_totals.as_dict(),
+        "open_tenant_engines": tenant_engines.open_engines(),
+    }
+
+
+@router.get("/page-tree/verify")
+def verify_page_tree(db: Session = Depends(get_tenant_db)):
+    """Compare the in-memory page hierarchy with the database and reload it on mismatch."""
+    return page_trees.verify(db)
+
+
+@router.post("/backups", status_code=202)
+def create_backup(
+    compress: bool | None = Query(None, description="Gzip snapshot chunks (default from settings)"),
+    db: Session = Depends(get_tenant_db),
+):
+    """
+    Start an online snapshot of the (tenant) database in the background.
+    Poll GET /api/admin/backups for progress and copy/stall metrics.
+    Restoring is only available from `python manage.py backup restore` with the server stopped.
+    """
+    source_path = primary_bind(db).url.database
+    if not backup_manager.start(source_path, compress):
+        raise HTTPException(status_code=409, detail=f"Backup already running: {backup_manager.running}")
+    return {"started": True, "database": database_name(source_path)}
+
+
+@router.get("/backups")
+def list_backups(db: Session = Depends(get_tenant_db)):
+    """List snapshots of the (tenant) database with the last backup's metrics."""
+    name = database_name(primary_bind(db).url.database)
+    return {
+        "database": name,
+        **backup_manager.stats(),
+        "snapshots": backup_manager.list_snapshots(name),
+    }
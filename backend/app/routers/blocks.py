@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_read_db, get_tenant_db
 from app.models import Block, Page
 from app.schemas import (
     BlockCreate,
@@ -9,78 +9,148 @@ from app.schemas import (
     BlockResponse,
     BlockReorderRequest,
 )
+from app.services.serialization import (
+    FastJSONResponse,
+    MsgPackRoute,
+    fetch_block_rows,
+    fetch_block_row,
+    render,
+)
+from app.services.write_behind import block_write_buffer
+from app.services.writer import run_write
+from app.services.backlinks import sync_block_links
+from app.services.page_counts import adjust_page_counts, content_size
 
-router = APIRouter(prefix="/api", tags=["blocks"])
+# MsgPackRoute: block write endpoints also accept MessagePack request bodies
+router = APIRouter(prefix="/api", tags=["blocks"], route_class=MsgPackRoute)
 
 
 @router.get("/pages/{page_id}/blocks", response_model=list[BlockResponse])
-def get_page_blocks(page_id: int, db: Session = Depends(get_db)):
-    """Get all blocks for a specific page, ordered by the order field"""
+def get_page_blocks(
+    page_id: int,
+    request: Request,
+    after_order: float | None = Query(None, description="Only blocks after this order"),
+    after_id: int | None = Query(None, description="Tie-breaker for blocks sharing after_order"),
+    before_order: float | None = Query(None, description="Only blocks before this order"),
+    limit: int | None = Query(None, ge=1, le=1000, description="Maximum number of blocks"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Get blocks for a specific page, ordered by (order, id).
+    Use after_order/after_id of the last received block to fetch the next window.
+    """
     # Verify page exists
-    page = db.query(Page).filter(Page.id == page_id).first()
-    if not page:
+    page_exists = db.query(Page.id).filter(Page.id == page_id).first()
+    if not page_exists:
         raise HTTPException(status_code=404, detail="Page not found")
 
-    blocks = db.query(Block).filter(Block.page_id == page_id).order_by(Block.order).all()
-    return blocks
+    blocks = fetch_block_rows(
+        db,
+        page_id,
+        after_order=after_order,
+        after_id=after_id,
+        before_order=before_order,
+        limit=limit,
+    )
+    return render(request, block_write_buffer.overlay(db, blocks))
 
 
 @router.post("/blocks", response_model=BlockResponse)
-def create_block(block: BlockCreate, db: Session = Depends(get_db)):
+def create_block(block: BlockCreate, db: Session = Depends(get_tenant_db)):
     """Create a new block"""
-    # Verify page exists
-    page = db.query(Page).filter(Page.id == block.page_id).first()
-    if not page:
-        raise HTTPException(status_code=404, detail="Page not found")
 
-    db_block = Block(**block.model_dump())
-    db.add(db_block)
-    db.commit()
-    db.refresh(db_block)
-    return db_block
+    def apply(db: Session) -> dict:
+        # Verify page exists
+        page = db.query(Page.id).filter(Page.id == block.page_id).first()
+        if not page:
+            raise HTTPException(status_code=404, detail="Page not found")
 
+        db_block = Block(**block.model_dump())
+        db.add(db_block)
+        db.flush()
+        sync_block_links(db, [(db_block.id, db_block.page_id, db_block.content)])
+        adjust_page_counts(
+            db, db_block.page_id, blocks=1, content_bytes=content_size(db_block.content)
+        )
+        return fetch_block_row(db, db_block.id)
 
-@router.patch("/blocks/{block_id}", response_model=BlockResponse)
-def update_block(block_id: int, block_update: BlockUpdate, db: Session = Depends(get_db)):
-    """Update a block"""
-    db_block = db.query(Block).filter(Block.id == block_id).first()
-    if not db_block:
-        raise HTTPException(status_code=404, detail="Block not found")
+    return run_write(db, apply)
 
-    # Update only provided fields
+
+@router.patch("/blocks/{block_id}", response_model=BlockResponse)
+def update_block(block_id: int, block_update: BlockUpdate, db: Session = Depends(get_tenant_db)):
+    """
+    Update a block.
+    Content-only updates are coalesced by the write-behind buffer when it is enabled.
+    """
     update_data = block_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_block, key, value)
 
-    db.commit()
-    db.refresh(db_block)
-    return db_block
+    if block_write_buffer.accepts(update_data):
+        block = fetch_block_row(db, block_id)
+        if block is None:
+            raise HTTPException(status_code=404, detail="Block not found")
+        block.update(block_write_buffer.put(db, block_id, update_data))
+        return FastJSONResponse(block)
+
+    block_write_buffer.flush_if_pending(db, block_id)
+
+    def apply(db: Session) -> dict:
+        db_block = db.query(Block).filter(Block.id == block_id).first()
+        if not db_block:
+            raise HTTPException(status_code=404, detail="Block not found")
+
+        old_size = content_size(db_block.content)
+
+        # Update only provided fields
+        for key, value in update_data.items():
+            setattr(db_block, key, value)
+        db.flush()
+
+        if "content" in update_data:
+            sync_block_links(db, [(db_block.id, db_block.page_id, db_block.content)])
+            adjust_page_counts(
+                db, db_block.page_id, content_bytes=content_size(db_block.content) - old_size
+            )
+        return fetch_block_row(db, block_id)
+
+    return run_write(db, apply)
 
 
 @router.delete("/blocks/{block_id}")
-def delete_block(block_id: int, db: Session = Depends(get_db)):
+def delete_block(block_id: int, db: Session = Depends(get_tenant_db)):
     """Delete a block"""
-    db_block = db.query(Block).filter(Block.id == block_id).first()
-    if not db_block:
-        raise HTTPException(status_code=404, detail="Block not found")
 
-    db.delete(db_block)
-    db.commit()
+    def apply(db: Session) -> None:
+        db_block = db.query(Block).filter(Block.id == block_id).first()
+        if not db_block:
+            raise HTTPException(status_code=404, detail="Block not found")
+
+        block_write_buffer.discard(db, block_id)
+        adjust_page_counts(
+            db, db_block.page_id, blocks=-1, content_bytes=-content_size(db_block.content)
+        )
+        db.delete(db_block)
+
+    run_write(db, apply)
     return {"message": "Block deleted successfully"}
 
 
 @router.post("/blocks/reorder", response_model=BlockResponse)
-def reorder_block(reorder: BlockReorderRequest, db: Session = Depends(get_db)):
+def reorder_block(reorder: BlockReorderRequest, db: Session = Depends(get_tenant_db)):
     """
     Reorder a block by updating its order field.
     Use float values for flexible positioning (e.g., 1.0, 1.5, 2.0).
     To place between blocks with order 1.0 and 2.0, use 1.5.
     """
-    db_block = db.query(Block).filter(Block.id == reorder.block_id).first()
-    if not db_block:
-        raise HTTPException(status_code=404, detail="Block not found")
-
-    db_block.order = reorder.new_order
-    db.commit()
-    db.refresh(db_block)
-    return db_block
+    block_write_buffer.flush_if_pending(db, reorder.block_id)
+
+    def apply(db: Session) -> dict:
+        db_block = db.query(Block).filter(Block.id == reorder.block_id).first()
+        if not db_block:
+            raise HTTPException(status_code=404, detail="Block not found")
+
+        db_block.order = reorder.new_order
+        db.flush()
+        return fetch_block_row(db, reorder.block_id)
+
+    return run_write(db, apply)
@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.database import get_read_db
+from app.schemas import ChangesResponse
+from app.services.change_log import current_cursor, fetch_changes, read_horizon
+from app.services.serialization import render
+from app.services.write_behind import block_write_buffer
+
+router = APIRouter(prefix="/api/changes", tags=["changes"])
+
+
+@router.get("/", response_model=ChangesResponse)
+def get_changes(
+    request: Request,
+    since: int | None = Query(None, ge=0, description="Cursor from the previous response"),
+    limit: int = Query(500, ge=1, le=5000, description="Maximum number of changes"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Get pages and blocks changed or deleted after a cursor, one entry per entity.
+    Without since, only the current cursor is returned (start tracking from now).
+    Responds 410 when the cursor is older than the compacted log; the client must
+    then refetch everything and continue from a fresh cursor.
+    """
+    if since is None:
+        return render(request, {"changes": [], "cursor": current_cursor(db), "has_more": False})
+
+    if since < read_horizon(db):
+        raise HTTPException(
+            status_code=410, detail="Cursor is older than the change log, full resync required"
+        )
+
+    result = fetch_changes(db, since, limit)
+    blocks = [
+        change["data"]
+        for change in result["changes"]
+        if change["entity"] == "block" and change["data"] is not None
+    ]
+    block_write_buffer.overlay(db, blocks)
+    return render(request, result)
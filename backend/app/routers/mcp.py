@@ -4,24 +4,36 @@ MCP (Notion API 연동) 라우터
 Notion에서 페이지를 가져와 우리 시스템에 저장하는 엔드포인트를 제공합니다.
 """
 
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from notion_client.errors import APIResponseError
+from typing import Optional
 
-from app.database import get_db
+from app.database import get_tenant_db, get_tenant_id
 from app.schemas.mcp import NotionImportRequest, NotionImportResponse
-from app.services.mcp_notion import get_notion_service, NotionService
 from app.models import Page, Block
+from app.services.backlinks import sync_block_links
+from app.services.page_counts import adjust_page_counts, content_size
+from app.services.notion_blocks import ConversionStats, batched, conversion_totals
+from app.services.page_tree import record_pages
 from app.config import settings
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/mcp", tags=["MCP"])
 
+# 가져온 블록을 한 번에 INSERT할 개수
+IMPORT_BATCH_SIZE = 500
+
 
 @router.post("/import", response_model=NotionImportResponse, status_code=status.HTTP_201_CREATED)
 def import_notion_page(
     request: NotionImportRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_tenant_db),
+    tenant_id: Optional[int] = Depends(get_tenant_id),
 ):
     """
     Notion 페이지를 가져와서 우리 시스템에 저장
@@ -49,6 +61,10 @@ def import_notion_page(
                 detail=str(e)
             )
 
+        # Notion 연동 모듈은 처음 가져올 때 로드 (워커 시작 시 import 비용 제거)
+        from notion_client.errors import APIResponseError
+        from app.services.mcp_notion import get_notion_service
+
         # Notion 서비스 초기화
         try:
             notion_service = get_notion_service()
@@ -92,14 +108,27 @@ def import_notion_page(
         new_page = Page(
             title=title,
             icon=icon,
-            parent_id=request.parent_id
+            parent_id=request.parent_id,
+            user_id=tenant_id,
         )
         db.add(new_page)
         db.flush()  # ID 생성을 위해 flush
 
-        # Notion 블록 가져오기
+        # Notion 블록을 가져오는 대로 변환해서 묶음 단위로 저장
+        stats = ConversionStats()
+        blocks_count = 0
+        content_bytes = 0
         try:
-            notion_blocks = notion_service.get_notion_blocks(request.notion_page_id)
+            converted = notion_service.iter_import_blocks(request.notion_page_id, stats)
+            for batch in batched(converted, IMPORT_BATCH_SIZE):
+                rows = [{"page_id": new_page.id, **block_data} for block_data in batch]
+                inserted = db.execute(
+                    insert(Block).returning(Block.id, Block.page_id, Block.content), rows
+                ).all()
+                # 백링크 인덱스 갱신
+                sync_block_links(db, inserted)
+                blocks_count += len(rows)
+                content_bytes += sum(content_size(row["content"]) for row in rows)
         except APIResponseError as e:
             # 블록 가져오기 실패 시 페이지 롤백
             db.rollback()
@@ -108,17 +137,15 @@ def import_notion_page(
                 detail=f"Notion 블록 가져오기 실패: {e.message}"
             )
 
-        # 블록 변환 및 저장
-        our_blocks = notion_service.convert_notion_blocks_to_our_format(notion_blocks)
+        if stats.skipped:
+            logger.info("Notion 가져오기에서 지원하지 않는 블록 건너뜀: %s", dict(stats.skipped))
+        conversion_totals.merge(stats)
 
-        for block_data in our_blocks:
-            new_block = Block(
-                page_id=new_page.id,
-                type=block_data["type"],
-                content=block_data["content"],
-                order=block_data["order"]
-            )
-            db.add(new_block)
+        # 페이지 집계 값 갱신
+        new_page.block_count = blocks_count
+        new_page.content_bytes = content_bytes
+        adjust_page_counts(db, request.parent_id, children=1)
+        record_pages(db, [(new_page.id, request.parent_id, title, icon)])
 
         # 커밋
         db.commit()
@@ -127,7 +154,8 @@ def import_notion_page(
         # 응답 생성
         return NotionImportResponse(
             page_id=new_page.id,
-            blocks_count=len(our_blocks),
+            blocks_count=blocks_count,
+            skipped_types=dict(stats.skipped),
             notion_page_id=request.notion_page_id,
             title=title,
             icon=icon
@@ -1,17 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_read_db, get_tenant_db, get_tenant_id
 from app.models import Page, Block
 from app.schemas import (
     PageCreate,
     PageUpdate,
+    PageDuplicateRequest,
+    PageMoveRequest,
     PageResponse,
     PageWithBlocksResponse,
+    PageWindowResponse,
+    BacklinkResponse,
+    PageTreeNode,
+    PageBreadcrumb,
+    PageBatchResponse,
 )
+from app.services.serialization import (
+    fetch_page_rows,
+    fetch_page_row,
+    fetch_pages_by_ids,
+    fetch_block_rows,
+    fetch_blocks_by_page,
+    fetch_block_stats,
+    render,
+    render_stream,
+)
+from app.services.page_subtree import (
+    duplicate_subtree,
+    fetch_subtree_rows,
+    moves_into_own_subtree,
+    move_pages,
+)
+from app.services.page_tree import page_trees, record_delete, record_move, record_pages
+from app.services.write_behind import block_write_buffer
+from app.services.backlinks import fetch_backlinks
+from app.services.page_counts import adjust_page_counts, count_children_by_parent
+from app.services.writer import run_write
 
 router = APIRouter(prefix="/api/pages", tags=["pages"])
 
+# Maximum number of pages in one GET /api/pages/batch request
+MAX_BATCH_PAGES = 100
+
 
 def is_descendant(db: Session, page_id: int, potential_parent_id: int) -> bool:
     """
@@ -29,6 +60,11 @@ def is_descendant(db: Session, page_id: int, potential_parent_id: int) -> bool:
     if potential_parent_id is None:
         return False
 
+    # Answer from the in-memory hierarchy when it matches this transaction's view
+    tree = page_trees.get_current(db)
+    if tree is not None:
+        return tree.is_descendant(page_id, potential_parent_id)
+
     current = db.query(Page).filter(Page.id == potential_parent_id).first()
 
     # Traverse up the tree to check if we reach page_id
@@ -53,92 +89,291 @@ def is_descendant(db: Session, page_id: int, potential_parent_id: int) -> bool:
 
 @router.get("/", response_model=list[PageResponse])
 def get_pages(
+    request: Request,
     parent_id: int | None = Query(None, description="Filter by parent page ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get all pages, optionally filtered by parent_id"""
-    query = db.query(Page)
-    if parent_id is not None:
-        query = query.filter(Page.parent_id == parent_id)
-    return query.all()
+    return render(request, fetch_page_rows(db, parent_id))
+
+
+@router.get("/tree", response_model=list[PageTreeNode])
+def get_page_tree(
+    request: Request,
+    root_id: int | None = Query(None, description="Only the subtree below this page"),
+    depth: int | None = Query(None, ge=1, description="Maximum depth (1 = direct children)"),
+    db: Session = Depends(get_read_db),
+):
+    """Get the page hierarchy (id, title, icon) as nested children, served from memory"""
+    tree = page_trees.get(db)
+    if root_id is not None and root_id not in tree:
+        raise HTTPException(status_code=404, detail="Page not found")
+    return render(request, tree.subtree(root_id, depth))
+
+
+@router.get("/batch", response_model=PageBatchResponse)
+def get_pages_batch(
+    request: Request,
+    ids: str = Query(..., description="Comma-separated page IDs"),
+    include_blocks: bool = Query(False, description="Include each page's blocks"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Get several pages in one round trip, e.g. to prefetch child or linked pages.
+    Pages and all their blocks are loaded with two queries and streamed page by page,
+    in the requested order; IDs that do not exist are listed in missing.
+    """
+    try:
+        page_ids = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    if not page_ids or len(page_ids) > MAX_BATCH_PAGES:
+        raise HTTPException(
+            status_code=400, detail=f"ids must contain 1 to {MAX_BATCH_PAGES} page IDs"
+        )
+
+    pages = {page["id"]: page for page in fetch_pages_by_ids(db, page_ids)}
+    if include_blocks:
+        blocks = fetch_blocks_by_page(db, list(pages))
+        for page_id, page in pages.items():
+            page["blocks"] = block_write_buffer.overlay(db, blocks.get(page_id, []))
+
+    found = [pages[page_id] for page_id in page_ids if page_id in pages]
+    missing = [page_id for page_id in page_ids if page_id not in pages]
+    return render_stream(request, "pages", found, {"missing": missing})
+
 
+@router.get("/{page_id}", response_model=PageWithBlocksResponse | PageWindowResponse)
+def get_page(
+    page_id: int,
+    request: Request,
+    block_limit: int | None = Query(
+        None, ge=1, le=1000, description="Return only the first N blocks plus the total count"
+    ),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Get a specific page with its blocks.
+    With block_limit, only the first window of blocks is returned;
+    fetch the rest with GET /api/pages/{page_id}/blocks?after_order=...
+    """
+    page = fetch_page_row(db, page_id)
+    if page is None:
+        raise HTTPException(status_code=404, detail="Page not found")
+
+    if block_limit is None:
+        page["blocks"] = block_write_buffer.overlay(db, fetch_block_rows(db, page_id))
+        return render(request, page)
 
-@router.get("/{page_id}", response_model=PageWithBlocksResponse)
-def get_page(page_id: int, db: Session = Depends(get_db)):
-    """Get a specific page with its blocks"""
-    page = db.query(Page).filter(Page.id == page_id).first()
-    if not page:
+    total_blocks, max_order = fetch_block_stats(db, page_id)
+    page["blocks"] = block_write_buffer.overlay(
+        db, fetch_block_rows(db, page_id, limit=block_limit)
+    )
+    page["total_blocks"] = total_blocks
+    page["has_more"] = total_blocks > len(page["blocks"])
+    page["max_order"] = max_order
+    return render(request, page)
+
+
+@router.get("/{page_id}/backlinks", response_model=list[BacklinkResponse])
+def get_page_backlinks(page_id: int, request: Request, db: Session = Depends(get_read_db)):
+    """Get pages whose blocks link to this page (served from the link index)"""
+    page_exists = db.query(Page.id).filter(Page.id == page_id).first()
+    if not page_exists:
         raise HTTPException(status_code=404, detail="Page not found")
-    return page
+    return render(request, fetch_backlinks(db, page_id))
+
+
+@router.get("/{page_id}/breadcrumbs", response_model=list[PageBreadcrumb])
+def get_page_breadcrumbs(page_id: int, request: Request, db: Session = Depends(get_read_db)):
+    """Get the path from the top-level page down to this page, served from memory"""
+    breadcrumbs = page_trees.get(db).ancestors(page_id)
+    if not breadcrumbs:
+        raise HTTPException(status_code=404, detail="Page not found")
+    return render(request, breadcrumbs)
 
 
 @router.post("/", response_model=PageResponse)
-def create_page(page: PageCreate, db: Session = Depends(get_db)):
+def create_page(
+    page: PageCreate,
+    db: Session = Depends(get_tenant_db),
+    tenant_id: int | None = Depends(get_tenant_id),
+):
     """Create a new page"""
-    # Validate parent exists if parent_id is provided
-    if page.parent_id is not None:
-        parent = db.query(Page).filter(Page.id == page.parent_id).first()
-        if not parent:
-            raise HTTPException(status_code=404, detail="Parent page not found")
 
-    db_page = Page(**page.model_dump())
-    db.add(db_page)
-    db.commit()
-    db.refresh(db_page)
-    return db_page
+    def apply(db: Session) -> dict:
+        # Validate parent exists if parent_id is provided
+        if page.parent_id is not None:
+            parent = db.query(Page.id).filter(Page.id == page.parent_id).first()
+            if not parent:
+                raise HTTPException(status_code=404, detail="Parent page not found")
+
+        db_page = Page(**page.model_dump())
+        if tenant_id is not None:
+            # With sharding enabled every page belongs to the request's tenant
+            db_page.user_id = tenant_id
+        db.add(db_page)
+        db.flush()
+        adjust_page_counts(db, page.parent_id, children=1)
+        record_pages(db, [(db_page.id, db_page.parent_id, db_page.title, db_page.icon)])
+        return fetch_page_row(db, db_page.id)
+
+    return run_write(db, apply)
 
 
 @router.patch("/{page_id}", response_model=PageResponse)
-def update_page(page_id: int, page_update: PageUpdate, db: Session = Depends(get_db)):
+def update_page(page_id: int, page_update: PageUpdate, db: Session = Depends(get_tenant_db)):
     """Update a page"""
-    db_page = db.query(Page).filter(Page.id == page_id).first()
-    if not db_page:
-        raise HTTPException(status_code=404, detail="Page not found")
 
-    # Validate parent_id if provided
-    if page_update.parent_id is not None:
-        # Check self-parent
-        if page_update.parent_id == page_id:
-            raise HTTPException(
-                status_code=400,
-                detail="Page cannot be its own parent"
-            )
-
-        # Check if parent exists
-        parent = db.query(Page).filter(Page.id == page_update.parent_id).first()
-        if not parent:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Parent page with id {page_update.parent_id} not found"
-            )
-
-        # Check for circular reference (descendant becoming parent)
-        if is_descendant(db, page_id, page_update.parent_id):
-            raise HTTPException(
-                status_code=400,
-                detail="Cannot set a descendant page as parent (circular reference)"
-            )
-
-    # Update only provided fields
-    update_data = page_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_page, key, value)
-
-    db.commit()
-    db.refresh(db_page)
-    return db_page
+    def apply(db: Session) -> dict:
+        db_page = db.query(Page).filter(Page.id == page_id).first()
+        if not db_page:
+            raise HTTPException(status_code=404, detail="Page not found")
+
+        # Validate parent_id if provided
+        if page_update.parent_id is not None:
+            # Check self-parent
+            if page_update.parent_id == page_id:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Page cannot be its own parent"
+                )
+
+            # Check if parent exists
+            parent = db.query(Page).filter(Page.id == page_update.parent_id).first()
+            if not parent:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Parent page with id {page_update.parent_id} not found"
+                )
+
+            # Check for circular reference (descendant becoming parent)
+            if is_descendant(db, page_id, page_update.parent_id):
+                raise HTTPException(
+                    status_code=400,
+                    detail="Cannot set a descendant page as parent (circular reference)"
+                )
+
+        # Update only provided fields
+        update_data = page_update.model_dump(exclude_unset=True)
+        if "parent_id" in update_data and update_data["parent_id"] != db_page.parent_id:
+            adjust_page_counts(db, db_page.parent_id, children=-1)
+            adjust_page_counts(db, update_data["parent_id"], children=1)
+
+        for key, value in update_data.items():
+            setattr(db_page, key, value)
+        db.flush()
+        record_pages(db, [(db_page.id, db_page.parent_id, db_page.title, db_page.icon)])
+        return fetch_page_row(db, page_id)
+
+    return run_write(db, apply)
+
+
+@router.post("/{page_id}/duplicate", response_model=PageResponse, status_code=201)
+def duplicate_page(
+    page_id: int,
+    request: PageDuplicateRequest | None = None,
+    db: Session = Depends(get_tenant_db),
+):
+    """
+    Duplicate a page with all of its child pages and blocks.
+    The copy is made server-side with set-based INSERT ... SELECT statements.
+    """
+    request = request or PageDuplicateRequest()
+
+    def apply(db: Session) -> dict:
+        source = db.query(Page).filter(Page.id == page_id).first()
+        if not source:
+            raise HTTPException(status_code=404, detail="Page not found")
+
+        # parent_id defaults to the source's parent unless explicitly provided
+        if "parent_id" in request.model_fields_set:
+            parent_id = request.parent_id
+            if parent_id is not None:
+                parent = db.query(Page.id).filter(Page.id == parent_id).first()
+                if not parent:
+                    raise HTTPException(status_code=404, detail="Parent page not found")
+        else:
+            parent_id = source.parent_id
+
+        new_page_id = duplicate_subtree(
+            db,
+            source,
+            parent_id=parent_id,
+            title=request.title if request.title is not None else source.title,
+        )
+        adjust_page_counts(db, parent_id, children=1)
+        record_pages(db, fetch_subtree_rows(db, new_page_id))
+        return fetch_page_row(db, new_page_id)
+
+    # Buffered block content must be in the database before it is copied
+    block_write_buffer.flush()
+
+    try:
+        return run_write(db, apply)
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to duplicate page: {str(e)}")
+
+
+@router.post("/move")
+def move_pages_bulk(request: PageMoveRequest, db: Session = Depends(get_tenant_db)):
+    """Move several pages (with their subtrees) under a new parent in one statement"""
+    page_ids = list(dict.fromkeys(request.page_ids))
+
+    def apply(db: Session) -> int:
+        found = db.query(Page.id).filter(Page.id.in_(page_ids)).count()
+        if found != len(page_ids):
+            raise HTTPException(status_code=404, detail="One or more pages not found")
+
+        if request.parent_id is not None:
+            parent = db.query(Page.id).filter(Page.id == request.parent_id).first()
+            if not parent:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Parent page with id {request.parent_id} not found"
+                )
+
+            # Check for circular reference (page or its descendant becoming parent)
+            tree = page_trees.get_current(db)
+            if tree is not None:
+                circular = tree.moves_into_own_subtree(page_ids, request.parent_id)
+            else:
+                circular = moves_into_own_subtree(db, page_ids, request.parent_id)
+            if circular:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Cannot move a page under itself or its descendant (circular reference)"
+                )
+
+        for old_parent_id, count in count_children_by_parent(db, page_ids).items():
+            adjust_page_counts(db, old_parent_id, children=-count)
+        moved_count = move_pages(db, page_ids, request.parent_id)
+        adjust_page_counts(db, request.parent_id, children=moved_count)
+        record_move(db, page_ids, request.parent_id)
+        return moved_count
+
+    moved_count = run_write(db, apply)
+    return {"message": "Pages moved successfully", "moved_count": moved_count}
 
 
 @router.delete("/{page_id}")
-def delete_page(page_id: int, db: Session = Depends(get_db)):
+def delete_page(page_id: int, db: Session = Depends(get_tenant_db)):
     """Delete a page (cascade deletes blocks and child pages)"""
-    try:
+
+    def apply(db: Session) -> None:
         db_page = db.query(Page).filter(Page.id == page_id).first()
         if not db_page:
             raise HTTPException(status_code=404, detail="Page not found")
 
+        adjust_page_counts(db, db_page.parent_id, children=-1)
+        record_delete(db, page_id)
         db.delete(db_page)
-        db.commit()
+
+    try:
+        run_write(db, apply)
         return {"message": "Page deleted successfully"}
     except HTTPException:
         # HTTPException은 그대로 전파
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+
+from app.database import get_read_db
+from app.schemas import TodoListResponse
+from app.services.serialization import render
+from app.services.todos import fetch_todos
+from app.services.write_behind import block_write_buffer
+
+router = APIRouter(prefix="/api/todos", tags=["todos"])
+
+
+@router.get("/", response_model=TodoListResponse)
+def get_todos(
+    request: Request,
+    checked: bool | None = Query(None, description="Filter by checked state"),
+    after_id: int | None = Query(None, description="Only todos after this block ID"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of todos"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    List todo blocks across the workspace with their page title and icon, ordered by ID.
+    Pass next_after_id from the response as after_id to fetch the next window.
+    """
+    # The checked filter runs in SQL, so a todo whose state changed only in the buffer
+    # would never be selected by it; flush buffered edits before a filtered listing
+    if checked is not None:
+        block_write_buffer.flush()
+
+    # Buffered edits are not in the database yet; show them and recompute their state
+    items, next_after_id = fetch_todos(
+        db,
+        checked=checked,
+        after_id=after_id,
+        limit=limit,
+        overlay=lambda rows: block_write_buffer.overlay(db, rows),
+    )
+
+    return render(request, {"items": items, "next_after_id": next_after_id})
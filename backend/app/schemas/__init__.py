@@ -1,16 +1,41 @@
 from app.schemas.example import ExampleCreate, ExampleResponse
-from app.schemas.page import PageCreate, PageUpdate, PageResponse, PageWithBlocksResponse
+from app.schemas.page import (
+    PageCreate,
+    PageUpdate,
+    PageDuplicateRequest,
+    PageMoveRequest,
+    PageResponse,
+    PageWithBlocksResponse,
+    PageWindowResponse,
+    PageBatchResponse,
+    BacklinkResponse,
+    PageTreeNode,
+    PageBreadcrumb,
+)
 from app.schemas.block import BlockCreate, BlockUpdate, BlockResponse, BlockReorderRequest
+from app.schemas.todo import TodoResponse, TodoListResponse
+from app.schemas.change import ChangeResponse, ChangesResponse
 
 __all__ = [
     "ExampleCreate",
     "ExampleResponse",
     "PageCreate",
     "PageUpdate",
+    "PageDuplicateRequest",
+    "PageMoveRequest",
     "PageResponse",
     "PageWithBlocksResponse",
+    "PageWindowResponse",
+    "PageBatchResponse",
+    "BacklinkResponse",
+    "PageTreeNode",
+    "PageBreadcrumb",
     "BlockCreate",
     "BlockUpdate",
     "BlockResponse",
     "BlockReorderRequest",
+    "TodoResponse",
+    "TodoListResponse",
+    "ChangeResponse",
+    "ChangesResponse",
 ]
@@ -0,0 +1,23 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+from app.schemas.block import BlockResponse
+from app.schemas.page import PageResponse
+
+
+class ChangeResponse(BaseModel):
+    """Latest change of one page or block; data is null for deletes (tombstones)"""
+    seq: int
+    entity: Literal["page", "block"]
+    id: int
+    page_id: int | None
+    op: Literal["upsert", "delete"]
+    data: PageResponse | BlockResponse | None
+
+
+class ChangesResponse(BaseModel):
+    """Changes after a cursor; pass cursor as since on the next call"""
+    changes: list[ChangeResponse]
+    cursor: int
+    has_more: bool
@@ -5,7 +5,7 @@ Notion API 연동을 위한 요청/응답 검증 스키마입니다.
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Dict, Optional
 
 
 class NotionImportRequest(BaseModel):
@@ -34,6 +34,9 @@ class NotionImportResponse(BaseModel):
     notion_page_id: str = Field(..., description="원본 Notion 페이지 ID")
     title: str = Field(..., description="페이지 제목")
     icon: Optional[str] = Field(None, description="페이지 아이콘 (이모지)")
+    skipped_types: Dict[str, int] = Field(
+        default_factory=dict, description="지원하지 않아 건너뛴 Notion 블록 타입별 개수"
+    )
 
     class Config:
         json_schema_extra = {
@@ -42,6 +45,7 @@ class NotionImportResponse(BaseModel):
                 "blocks_count": 10,
                 "notion_page_id": "a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6",
                 "title": "My Notion Page",
-                "icon": "📄"
+                "icon": "📄",
+                "skipped_types": {"image": 2}
             }
         }
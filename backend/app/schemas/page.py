@@ -15,12 +15,27 @@ class PageUpdate(BaseModel):
     parent_id: int | None = None
 
 
+class PageDuplicateRequest(BaseModel):
+    """Request to duplicate a page subtree (defaults: same parent and title)"""
+    parent_id: int | None = None
+    title: str | None = None
+
+
+class PageMoveRequest(BaseModel):
+    """Request to move several pages (with their subtrees) under a new parent"""
+    page_ids: list[int] = Field(..., min_length=1, max_length=1000)
+    parent_id: int | None = None
+
+
 class PageResponse(BaseModel):
     id: int
     title: str
     icon: str | None
     parent_id: int | None
     user_id: int | None
+    child_count: int = 0
+    block_count: int = 0
+    content_bytes: int = 0
     created_at: datetime
     updated_at: datetime | None
 
@@ -28,6 +43,30 @@ class PageResponse(BaseModel):
         from_attributes = True
 
 
+class BacklinkResponse(BaseModel):
+    """A page that references another page, with the referencing block IDs"""
+    page_id: int
+    title: str
+    icon: str | None
+    block_ids: list[int]
+
+
+class PageTreeNode(BaseModel):
+    """A page in the hierarchy with its child pages (served from the in-memory index)"""
+    id: int
+    title: str
+    icon: str | None
+    parent_id: int | None
+    children: list["PageTreeNode"] = []
+
+
+class PageBreadcrumb(BaseModel):
+    """One step of the path from a top-level page down to a page"""
+    id: int
+    title: str
+    icon: str | None
+
+
 class PageWithBlocksResponse(PageResponse):
     """Page response with its blocks included"""
     blocks: list["BlockResponse"] = []
@@ -36,6 +75,25 @@ class PageWithBlocksResponse(PageResponse):
         from_attributes = True
 
 
+class PageWindowResponse(PageWithBlocksResponse):
+    """Page response with only the first window of its blocks"""
+    total_blocks: int
+    has_more: bool
+    max_order: float | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class PageBatchResponse(BaseModel):
+    """Several pages fetched in one request (blocks included when requested)"""
+    pages: list[PageWithBlocksResponse | PageResponse]
+    missing: list[int] = []
+
+
 # Import at the end to avoid circular dependency
 from app.schemas.block import BlockResponse
+PageTreeNode.model_rebuild()
 PageWithBlocksResponse.model_rebuild()
+PageWindowResponse.model_rebuild()
+PageBatchResponse.model_rebuild()
@@ -0,0 +1,20 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class TodoResponse(BaseModel):
+    """A todo block with the page it belongs to"""
+    id: int
+    page_id: int
+    content: str | None
+    order: float
+    checked: bool
+    updated_at: datetime | None
+    page_title: str
+    page_icon: str | None
+
+
+class TodoListResponse(BaseModel):
+    """One window of todos; pass next_after_id as after_id to get the next one"""
+    items: list[TodoResponse]
+    next_after_id: int | None
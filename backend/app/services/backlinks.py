@@ -0,0 +1,165 @@
+"""
+페이지 백링크 인덱스 모듈
+
+블록 내용에서 다른 페이지 참조(`/pages/<id>` 링크)를 추출해서
+`page_links` 테이블에 저장합니다. 블록을 쓸 때마다 인덱스에 저장된 기존 참조와
+새 참조를 비교해서 바뀐 부분만 추가/삭제하므로,
+"이 페이지를 참조하는 곳" 조회는 블록 내용을 스캔하지 않고 인덱스만으로 처리됩니다.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, func, insert, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.models import Block, Page, PageLink
+
+# 마크다운 링크나 URL 안의 페이지 경로: [제목](/pages/12), http://host/pages/12
+PAGE_REF_PATTERN = re.compile(r"/pages/(\d+)\b")
+
+# SQLite 바인드 변수 제한을 넘지 않도록 IN 절을 나눠서 처리
+CHUNK_SIZE = 500
+
+
+def extract_page_refs(content: Optional[str]) -> Set[int]:
+    """
+    블록 내용에서 참조하는 페이지 ID 추출
+
+    Args:
+        content: 블록 내용
+
+    Returns:
+        참조 페이지 ID 집합
+    """
+    if not content or "/pages/" not in content:
+        return set()
+    return {int(page_id) for page_id in PAGE_REF_PATTERN.findall(content)}
+
+
+def chunks(items: List, size: int = CHUNK_SIZE) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def sync_block_links(db: Session, blocks: Iterable[Tuple[int, int, Optional[str]]]) -> None:
+    """
+    블록들의 참조를 인덱스와 비교해서 바뀐 링크만 반영
+
+    커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        blocks: (블록 ID, 페이지 ID, 새 내용) 목록
+    """
+    wanted: Dict[int, Set[int]] = {}
+    source_pages: Dict[int, int] = {}
+    for block_id, page_id, content in blocks:
+        wanted[block_id] = extract_page_refs(content)
+        source_pages[block_id] = page_id
+    if not wanted:
+        return
+
+    # 인덱스에 저장된 기존 참조
+    existing: Dict[int, Set[int]] = {block_id: set() for block_id in wanted}
+    for block_ids in chunks(list(wanted)):
+        rows = db.execute(
+            select(PageLink.source_block_id, PageLink.target_page_id)
+            .where(PageLink.source_block_id.in_(block_ids))
+        )
+        for block_id, target_page_id in rows:
+            existing[block_id].add(target_page_id)
+
+    removed = [
+        (block_id, target_page_id)
+        for block_id, targets in existing.items()
+        for target_page_id in targets - wanted[block_id]
+    ]
+    added = [
+        (block_id, target_page_id)
+        for block_id, targets in wanted.items()
+        for target_page_id in targets - existing[block_id]
+    ]
+
+    for pairs in chunks(removed):
+        db.execute(
+            delete(PageLink).where(
+                tuple_(PageLink.source_block_id, PageLink.target_page_id).in_(pairs)
+            )
+        )
+
+    if not added:
+        return
+
+    # 존재하는 페이지에 대한 참조만 인덱스에 저장
+    target_ids = list({target_page_id for _, target_page_id in added})
+    valid_targets: Set[int] = set()
+    for page_ids in chunks(target_ids):
+        valid_targets.update(db.scalars(select(Page.id).where(Page.id.in_(page_ids))))
+
+    rows = [
+        {
+            "source_block_id": block_id,
+            "target_page_id": target_page_id,
+            "source_page_id": source_pages[block_id],
+        }
+        for block_id, target_page_id in added
+        if target_page_id in valid_targets
+    ]
+    if rows:
+        db.execute(insert(PageLink), rows)
+
+
+def fetch_backlinks(db: Session, page_id: int) -> List[Dict]:
+    """
+    page_id를 참조하는 페이지와 블록 목록을 인덱스에서 조회
+
+    Args:
+        db: 데이터베이스 세션
+        page_id: 참조 대상 페이지 ID
+
+    Returns:
+        BacklinkResponse 형식의 dict 리스트 (참조하는 페이지별)
+    """
+    rows = db.execute(
+        select(PageLink.source_page_id, Page.title, Page.icon, PageLink.source_block_id)
+        .join(Page, Page.id == PageLink.source_page_id)
+        .where(PageLink.target_page_id == page_id)
+        .order_by(PageLink.source_page_id, PageLink.source_block_id)
+    )
+    backlinks: Dict[int, Dict] = {}
+    for source_page_id, title, icon, source_block_id in rows:
+        entry = backlinks.setdefault(
+            source_page_id,
+            {"page_id": source_page_id, "title": title, "icon": icon, "block_ids": []},
+        )
+        entry["block_ids"].append(source_block_id)
+    return list(backlinks.values())
+
+
+def rebuild_links(db: Session, batch_size: int = 1000) -> int:
+    """
+    모든 블록 내용을 다시 읽어서 백링크 인덱스 재구성 (관리용)
+
+    Args:
+        db: 데이터베이스 세션
+        batch_size: 한 번에 처리할 블록 수
+
+    Returns:
+        인덱스에 저장된 링크 수
+    """
+    db.execute(delete(PageLink))
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Block.id, Block.page_id, Block.content)
+            .where(Block.id > last_id, Block.content.like("%/pages/%"))
+            .order_by(Block.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        sync_block_links(db, rows)
+        last_id = rows[-1][0]
+    db.commit()
+    return db.scalar(select(func.count()).select_from(PageLink))
@@ -0,0 +1,443 @@
+"""
+온라인 데이터베이스 백업 모듈
+
+서버를 멈추지 않고 SQLite 온라인 백업 API(`sqlite3.Connection.backup`)로
+데이터베이스를 복사합니다.
+
+- 한 번에 `pages_per_step` 페이지씩 복사하고 단계 사이에 잠깐 쉬므로,
+  writer는 한 단계가 끝날 때까지만 기다립니다 (WAL 모드에서는 기다리지 않음).
+  writer가 잠금을 기다릴 수 있는 최대 시간은 `writer_block_max_ms`로 보고합니다
+  (실제 커밋 지연은 `benchmarks/bench_backup.py`로 측정).
+- 복사 중 다른 연결이 쓰면 SQLite가 복사를 처음부터 다시 시작합니다.
+  `max_restarts`를 넘으면 WAL 모드에서는 한 번에 복사해서 끝내고 (읽기 트랜잭션이라
+  writer를 막지 않음), rollback journal 모드에서는 한 번에 복사하면 복사하는 내내
+  writer가 막히므로 `BackupRestarted`로 실패합니다.
+- 복사한 파일은 고정 크기 청크로 나눠 내용 해시로 저장합니다 (증분 스냅샷).
+  바뀌지 않은 청크는 이전 스냅샷과 공유하므로 매시간 백업해도 바뀐 부분만 저장됩니다.
+  스냅샷은 청크 해시 목록을 담은 manifest(JSON)입니다.
+- 복원은 청크를 다시 합쳐 무결성을 검사한 뒤 백업 API로 대상 파일에 덮어씁니다.
+
+디렉터리 구조:
+    <backup_dir>/<데이터베이스 이름>/snapshots/<스냅샷 ID>.json
+    <backup_dir>/<데이터베이스 이름>/chunks/<해시 앞 2자리>/<해시>[.gz]
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+GZIP_LEVEL = 3  # 압축률보다 처리량 우선
+
+
+class BackupRestarted(Exception):
+    """다른 연결의 쓰기로 단계 복사가 너무 자주 다시 시작됨"""
+
+
+class BackupInProgress(Exception):
+    """이미 백업이 실행 중"""
+
+
+def database_name(path: str) -> str:
+    """백업 디렉터리 이름으로 쓸 데이터베이스 파일 이름 (확장자 제외)"""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def snapshot_id() -> str:
+    """시각 기반 스냅샷 ID (정렬 순서 = 생성 순서)"""
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 이름을 바꿔서 중간 상태의 파일이 남지 않도록 저장"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(data)
+    os.replace(tmp_path, path)
+
+
+class BackupManager:
+    """
+    온라인 백업 / 증분 스냅샷 / 복원 관리자
+
+    Args:
+        backup_dir: 백업 저장 폴더
+        pages_per_step: 한 단계에 복사할 페이지 수
+        step_sleep_ms: 단계 사이에 쉬는 시간 (ms, 그동안 writer가 커밋)
+        max_restarts: 단계 복사를 다시 시작하는 최대 횟수 (넘으면 WAL 모드는 한 번에 복사, 아니면 실패)
+        chunk_size: 증분 스냅샷 청크 크기 (bytes, 페이지 크기의 배수)
+        compress: 청크 gzip 압축 여부
+        keep: 보관할 스냅샷 수 (0이면 모두 보관)
+    """
+
+    def __init__(
+        self,
+        backup_dir: str = "./backups",
+        pages_per_step: int = 1024,
+        step_sleep_ms: int = 5,
+        max_restarts: int = 3,
+        chunk_size: int = 4 * 1024 * 1024,
+        compress: bool = True,
+        keep: int = 48,
+    ):
+        self.backup_dir = backup_dir
+        self.pages_per_step = pages_per_step
+        self.step_sleep = step_sleep_ms / 1000
+        self.max_restarts = max_restarts
+        self.chunk_size = chunk_size
+        self.compress = compress
+        self.keep = keep
+
+        self._lock = threading.Lock()
+        self.running: Optional[str] = None
+        self.last_result: Optional[Dict[str, Any]] = None
+        self.last_error: Optional[str] = None
+        self.backup_count = 0
+        self.failure_count = 0
+
+    def database_dir(self, name: str) -> str:
+        return os.path.join(self.backup_dir, name)
+
+    def manifest_path(self, name: str, snapshot: str) -> str:
+        return os.path.join(self.database_dir(name), "snapshots", f"{snapshot}.json")
+
+    def chunk_path(self, name: str, digest: str, compressed: bool) -> str:
+        suffix = ".gz" if compressed else ""
+        return os.path.join(self.database_dir(name), "chunks", digest[:2], digest + suffix)
+
+    def copy_online(self, source_path: str, dest_path: str) -> Dict[str, Any]:
+        """
+        온라인 백업 API로 데이터베이스를 단계별 복사
+
+        Args:
+            source_path: 원본 SQLite 파일
+            dest_path: 복사본 파일 (있으면 덮어씀)
+
+        Returns:
+            복사 통계 (단계 수, 재시작 횟수, 단계별 소요 시간 등)
+        """
+        metrics = {
+            "steps": 0,
+            "restarts": 0,
+            "single_step": False,
+            "single_step_ms": 0.0,
+            "max_step_ms": 0.0,
+            "step_ms_total": 0.0,
+        }
+        state = {"remaining": None, "step_started": 0.0}
+
+        def progress(status: int, remaining: int, total: int) -> None:
+            step_ms = (time.perf_counter() - state["step_started"]) * 1000
+            metrics["steps"] += 1
+            metrics["step_ms_total"] += step_ms
+            metrics["max_step_ms"] = max(metrics["max_step_ms"], step_ms)
+            if state["remaining"] is not None and remaining > state["remaining"]:
+                # 다른 연결이 원본을 수정해서 SQLite가 처음부터 다시 복사 중
+                metrics["restarts"] += 1
+                if metrics["restarts"] > self.max_restarts:
+                    raise BackupRestarted(
+                        f"쓰기가 잦아 단계 복사가 {metrics['restarts']}번 다시 시작되었습니다"
+                    )
+            state["remaining"] = remaining
+            if remaining and self.step_sleep:
+                time.sleep(self.step_sleep)
+            state["step_started"] = time.perf_counter()
+
+        source = sqlite3.connect(source_path, timeout=30)
+        dest = sqlite3.connect(dest_path)
+        try:
+            journal_mode = source.execute("PRAGMA journal_mode").fetchone()[0]
+            metrics["journal_mode"] = journal_mode
+            try:
+                state["step_started"] = time.perf_counter()
+                source.backup(dest, pages=self.pages_per_step, progress=progress)
+            except BackupRestarted as error:
+                if journal_mode != "wal":
+                    # 한 번에 복사하면 복사하는 내내 writer가 막힘
+                    raise BackupRestarted(
+                        f"{error} (rollback journal 모드에서는 writer를 막지 않고 끝낼 수 없으므로 "
+                        f"BACKUP_WAL_ENABLED=true로 WAL 모드를 쓰거나 BACKUP_MAX_RESTARTS를 늘리세요)"
+                    ) from None
+                # WAL 모드의 읽기 트랜잭션은 writer를 막지 않으므로 남은 부분을 한 번에 복사
+                metrics["single_step"] = True
+                started = time.perf_counter()
+                source.backup(dest, pages=-1)
+                metrics["single_step_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        finally:
+            dest.close()
+            source.close()
+
+        metrics["max_step_ms"] = round(metrics["max_step_ms"], 2)
+        metrics["avg_step_ms"] = round(metrics.pop("step_ms_total") / max(metrics["steps"], 1), 2)
+        # rollback journal 모드에서는 각 단계가 공유 잠금을 잡으므로 writer는 최대 한 단계만큼 막힘
+        metrics["writer_block_max_ms"] = 0.0 if journal_mode == "wal" else metrics["max_step_ms"]
+        return metrics
+
+    def store_chunks(self, name: str, path: str, compress: bool) -> Dict[str, Any]:
+        """
+        파일을 청크로 나눠 아직 없는 청크만 저장
+
+        Returns:
+            {"chunks": 해시 목록, "new_chunks": 새로 저장한 수, "stored_bytes": 새로 쓴 바이트}
+        """
+        digests: List[str] = []
+        new_chunks = 0
+        stored_bytes = 0
+        with open(path, "rb") as file:
+            while True:
+                data = file.read(self.chunk_size)
+                if not data:
+                    break
+                digest = hashlib.sha256(data).hexdigest()
+                digests.append(digest)
+                if self.find_chunk(name, digest) is not None:
+                    continue
+                payload = gzip.compress(data, compresslevel=GZIP_LEVEL) if compress else data
+                write_atomic(self.chunk_path(name, digest, compress), payload)
+                new_chunks += 1
+                stored_bytes += len(payload)
+        return {"chunks": digests, "new_chunks": new_chunks, "stored_bytes": stored_bytes}
+
+    def find_chunk(self, name: str, digest: str) -> Optional[str]:
+        """압축 여부와 관계없이 저장된 청크 경로 (없으면 None)"""
+        for compressed in (True, False):
+            path = self.chunk_path(name, digest, compressed)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def read_chunk(self, name: str, digest: str) -> bytes:
+        """청크를 읽고 해시 검증"""
+        path = self.find_chunk(name, digest)
+        if path is None:
+            raise ValueError(f"청크가 없습니다: {digest}")
+        with open(path, "rb") as file:
+            data = file.read()
+        if path.endswith(".gz"):
+            data = gzip.decompress(data)
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"청크가 손상되었습니다: {digest}")
+        return data
+
+    def create(self, source_path: str, compress: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        스냅샷 생성 (호출한 스레드에서 끝날 때까지 실행)
+
+        Args:
+            source_path: 백업할 SQLite 파일
+            compress: 청크 압축 여부 (None이면 설정값)
+
+        Returns:
+            스냅샷 manifest (청크 목록 제외)
+
+        Raises:
+            BackupInProgress: 다른 백업이 실행 중인 경우
+        """
+        if not self._lock.acquire(blocking=False):
+            raise BackupInProgress()
+        return self._create_locked(source_path, compress)
+
+    def _create_locked(self, source_path: str, compress: Optional[bool]) -> Dict[str, Any]:
+        """잠금을 잡은 상태에서 스냅샷 생성 (끝나면 잠금 해제)"""
+        name = database_name(source_path)
+        compress = self.compress if compress is None else compress
+        self.running = name
+        started = time.perf_counter()
+        snapshot = snapshot_id()
+        copy_path = os.path.join(self.database_dir(name), f".{snapshot}.db")
+        try:
+            os.makedirs(self.database_dir(name), exist_ok=True)
+            copy_metrics = self.copy_online(source_path, copy_path)
+            copy_seconds = time.perf_counter() - started
+            size = os.path.getsize(copy_path)
+
+            stored = self.store_chunks(name, copy_path, compress)
+            total_seconds = time.perf_counter() - started
+            manifest = {
+                "id": snapshot,
+                "database": name,
+                "source": os.path.abspath(source_path),
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "size_bytes": size,
+                "chunk_size": self.chunk_size,
+                "compressed": compress,
+                "chunks": stored["chunks"],
+                "stats": {
+                    **copy_metrics,
+                    "copy_seconds": round(copy_seconds, 3),
+                    "copy_mb_per_s": round(size / 1e6 / max(copy_seconds, 1e-6), 1),
+                    "total_seconds": round(total_seconds, 3),
+                    "chunk_count": len(stored["chunks"]),
+                    "new_chunks": stored["new_chunks"],
+                    "stored_bytes": stored["stored_bytes"],
+                },
+            }
+            write_atomic(
+                self.manifest_path(name, snapshot),
+                json.dumps(manifest, ensure_ascii=False).encode("utf-8"),
+            )
+            if self.keep:
+                self.prune(name, self.keep)
+
+            summary = {key: value for key, value in manifest.items() if key != "chunks"}
+            self.last_result = summary
+            self.last_error = None
+            self.backup_count += 1
+            return summary
+        except Exception as error:
+            self.last_error = f"{name}: {error}"
+            self.failure_count += 1
+            raise
+        finally:
+            if os.path.exists(copy_path):
+                os.remove(copy_path)
+            self.running = None
+            self._lock.release()
+
+    def start(self, source_path: str, compress: Optional[bool] = None) -> bool:
+        """
+        백그라운드 스레드에서 스냅샷 생성 시작
+
+        Returns:
+            시작했으면 True, 이미 실행 중이면 False
+        """
+        if not self._lock.acquire(blocking=False):
+            return False
+
+        def run() -> None:
+            try:
+                self._create_locked(source_path, compress)
+            except Exception:
+                logger.exception("백업 실패: %s", source_path)
+
+        threading.Thread(target=run, name="backup", daemon=True).start()
+        return True
+
+    def read_manifest(self, name: str, snapshot: str) -> Dict[str, Any]:
+        path = self.manifest_path(name, snapshot)
+        if not os.path.exists(path):
+            raise ValueError(f"스냅샷이 없습니다: {name}/{snapshot}")
+        with open(path, "rb") as file:
+            return json.loads(file.read())
+
+    def list_snapshots(self, name: str) -> List[Dict[str, Any]]:
+        """스냅샷 목록 (오래된 순, 청크 목록 제외)"""
+        snapshot_dir = os.path.join(self.database_dir(name), "snapshots")
+        if not os.path.isdir(snapshot_dir):
+            return []
+        snapshots = []
+        for file_name in sorted(os.listdir(snapshot_dir)):
+            if file_name.endswith(".json"):
+                manifest = self.read_manifest(name, file_name[:-len(".json")])
+                manifest.pop("chunks")
+                snapshots.append(manifest)
+        return snapshots
+
+    def prune(self, name: str, keep: int) -> int:
+        """
+        최근 keep개만 남기고 오래된 스냅샷과 어디에서도 쓰지 않는 청크 삭제
+
+        Returns:
+            삭제한 스냅샷 수
+        """
+        snapshots = [snapshot["id"] for snapshot in self.list_snapshots(name)]
+        expired = snapshots[:-keep] if keep > 0 else []
+        for snapshot in expired:
+            os.remove(self.manifest_path(name, snapshot))
+        if not expired:
+            return 0
+
+        referenced = set()
+        for snapshot in snapshots[len(expired):]:
+            referenced.update(self.read_manifest(name, snapshot)["chunks"])
+        chunk_dir = os.path.join(self.database_dir(name), "chunks")
+        for root, _, file_names in os.walk(chunk_dir):
+            for file_name in file_names:
+                if file_name.split(".")[0] not in referenced:
+                    os.remove(os.path.join(root, file_name))
+        return len(expired)
+
+    def restore(self, name: str, snapshot: str, target_path: str) -> Dict[str, Any]:
+        """
+        스냅샷을 대상 데이터베이스로 복원
+
+        청크를 합친 파일의 무결성을 검사한 뒤 백업 API로 대상에 덮어쓰므로,
+        대상이 열려 있어도 중간 상태가 보이지 않습니다. 메모리 인덱스와 write-behind
+        버퍼가 복원 전 데이터를 갖고 있으므로 복원 후에는 서버를 재시작해야 합니다.
+
+        Args:
+            name: 데이터베이스 이름 (백업 폴더 이름)
+            snapshot: 스냅샷 ID
+            target_path: 복원할 SQLite 파일
+
+        Returns:
+            {"id", "size_bytes", "seconds"}
+
+        Raises:
+            ValueError: 스냅샷/청크가 없거나 손상된 경우
+        """
+        started = time.perf_counter()
+        manifest = self.read_manifest(name, snapshot)
+        restore_path = f"{target_path}.restore"
+        try:
+            with open(restore_path, "wb") as file:
+                for digest in manifest["chunks"]:
+                    file.write(self.read_chunk(name, digest))
+            if os.path.getsize(restore_path) != manifest["size_bytes"]:
+                raise ValueError(f"스냅샷 크기가 맞지 않습니다: {name}/{snapshot}")
+
+            source = sqlite3.connect(restore_path)
+            try:
+                result = source.execute("PRAGMA integrity_check").fetchone()[0]
+                if result != "ok":
+                    raise ValueError(f"스냅샷 무결성 검사 실패: {result}")
+                dest = sqlite3.connect(target_path, timeout=60)
+                try:
+                    source.backup(dest)
+                finally:
+                    dest.close()
+            finally:
+                source.close()
+        finally:
+            if os.path.exists(restore_path):
+                os.remove(restore_path)
+
+        return {
+            "id": snapshot,
+            "size_bytes": manifest["size_bytes"],
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """백업 통계"""
+        return {
+            "running": self.running,
+            "backup_count": self.backup_count,
+            "failure_count": self.failure_count,
+            "last_result": self.last_result,
+            "last_error": self.last_error,
+        }
+
+
+# 전역 백업 관리자 인스턴스
+backup_manager = BackupManager(
+    backup_dir=settings.backup_dir,
+    pages_per_step=settings.backup_pages_per_step,
+    step_sleep_ms=settings.backup_step_sleep_ms,
+    max_restarts=settings.backup_max_restarts,
+    chunk_size=settings.backup_chunk_size_mb * 1024 * 1024,
+    compress=settings.backup_compress,
+    keep=settings.backup_keep,
+)
@@ -0,0 +1,139 @@
+"""
+변경 로그(delta sync) 모듈
+
+오프라인이었던 클라이언트가 모든 페이지를 다시 받지 않도록, 페이지와 블록의
+추가/수정/삭제를 단조 증가하는 `seq`와 함께 `change_log` 테이블에 기록합니다.
+
+- 기록은 SQLite 트리거(마이그레이션 v0001)가 하므로 라우터, write-behind 반영, `INSERT ... SELECT` 복제,
+  일괄 이동, ON DELETE CASCADE 삭제까지 모든 쓰기 경로가 빠짐없이 기록됩니다.
+- 엔티티마다 마지막 변경 하나만 남기므로(`INSERT OR REPLACE`) 로그 크기는
+  변경된 엔티티 수를 넘지 않고, 삭제는 tombstone(op='delete')으로 남습니다.
+- SQLite는 쓰기 트랜잭션이 하나씩 실행되므로 seq 순서가 커밋 순서와 같습니다.
+- `compact_change_log()`는 보존 기간이 지난 기록을 지우고 그 지점(horizon)을 기록합니다.
+  horizon보다 오래된 커서로 요청하면 전체를 다시 받아야 합니다 (410).
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Block, ChangeLogEntry, ChangeLogState, Page
+from app.services.serialization import (
+    BLOCK_COLUMNS,
+    BLOCK_KEYS,
+    PAGE_COLUMNS,
+    PAGE_KEYS,
+    rows_to_dicts,
+)
+
+
+def read_horizon(db: Session) -> int:
+    """압축으로 지워진 마지막 seq (없으면 0)"""
+    return db.execute(
+        select(ChangeLogState.compacted_seq).where(ChangeLogState.id == 1)
+    ).scalar() or 0
+
+
+def current_cursor(db: Session) -> int:
+    """가장 최근 변경의 seq (없으면 horizon)"""
+    latest = db.execute(select(func.max(ChangeLogEntry.seq))).scalar()
+    return latest if latest is not None else read_horizon(db)
+
+
+def fetch_rows_by_id(columns, keys, id_column, db: Session, ids: List[int]) -> Dict[int, Dict]:
+    """ID 목록의 현재 행을 응답 형식 dict로 조회"""
+    if not ids:
+        return {}
+    rows = rows_to_dicts(keys, db.execute(select(*columns).where(id_column.in_(ids))))
+    return {row["id"]: row for row in rows}
+
+
+def fetch_changes(db: Session, since: int, limit: int) -> Dict[str, Any]:
+    """
+    since 이후의 변경 사항을 seq 순으로 조회
+
+    수정/추가는 현재 행 데이터(PageResponse / BlockResponse 형식)와 함께,
+    삭제는 tombstone으로 반환합니다. 호출 전에 since가 horizon 이후인지 확인해야 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        since: 클라이언트가 마지막으로 받은 seq
+        limit: 최대 변경 수
+
+    Returns:
+        {"changes": [...], "cursor": 다음 since 값, "has_more": bool}
+    """
+    entries = db.execute(
+        select(
+            ChangeLogEntry.seq,
+            ChangeLogEntry.entity,
+            ChangeLogEntry.entity_id,
+            ChangeLogEntry.page_id,
+            ChangeLogEntry.op,
+        )
+        .where(ChangeLogEntry.seq > since)
+        .order_by(ChangeLogEntry.seq)
+        .limit(limit + 1)
+    ).all()
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    # 현재 행 데이터는 엔티티 종류별로 한 번에 조회
+    upserted: Dict[str, List[int]] = {"page": [], "block": []}
+    for _, entity, entity_id, _, op in entries:
+        if op == "upsert":
+            upserted[entity].append(entity_id)
+    current = {
+        "page": fetch_rows_by_id(PAGE_COLUMNS, PAGE_KEYS, Page.id, db, upserted["page"]),
+        "block": fetch_rows_by_id(BLOCK_COLUMNS, BLOCK_KEYS, Block.id, db, upserted["block"]),
+    }
+
+    changes: List[Dict[str, Any]] = []
+    for seq, entity, entity_id, page_id, op in entries:
+        data = current[entity].get(entity_id) if op == "upsert" else None
+        if op == "upsert" and data is None:
+            # 로그를 읽은 뒤 삭제된 행: 삭제 기록이 뒤따르므로 tombstone으로 보냄
+            op = "delete"
+        changes.append({
+            "seq": seq,
+            "entity": entity,
+            "id": entity_id,
+            "page_id": page_id,
+            "op": op,
+            "data": data,
+        })
+
+    cursor = entries[-1][0] if entries else since
+    return {"changes": changes, "cursor": cursor, "has_more": has_more}
+
+
+def compact_change_log(db: Session, retention_days: float) -> int:
+    """
+    보존 기간이 지난 변경 기록 삭제 (커밋까지 수행)
+
+    삭제한 마지막 seq를 horizon으로 기록하므로, 그보다 오래된 커서는 410을 받습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        retention_days: 보존 기간 (일)
+
+    Returns:
+        삭제한 기록 수
+    """
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=retention_days)
+    horizon = db.execute(
+        select(func.max(ChangeLogEntry.seq)).where(ChangeLogEntry.changed_at < cutoff)
+    ).scalar()
+    if horizon is None:
+        return 0
+
+    removed = db.execute(delete(ChangeLogEntry).where(ChangeLogEntry.seq <= horizon)).rowcount
+    updated = db.execute(
+        update(ChangeLogState).where(ChangeLogState.id == 1).values(compacted_seq=horizon)
+    ).rowcount
+    if not updated:
+        db.execute(insert(ChangeLogState).values(id=1, compacted_seq=horizon))
+    db.commit()
+    return removed
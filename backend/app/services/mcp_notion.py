@@ -5,26 +5,26 @@ Notion API를 통해 페이지와 블록을 가져오고,
 우리 시스템 형식으로 변환하는 기능을 제공합니다.
 """
 
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+from typing import List, Dict, Any, Iterator, Optional
 from notion_client import Client
 from notion_client.errors import APIResponseError
 
 from app.config import settings
+from app.services.notion_blocks import (  # noqa: F401  (NOTION_TO_OUR_BLOCK_TYPE는 기존 import 경로 유지)
+    NOTION_TO_OUR_BLOCK_TYPE,
+    ConversionStats,
+    convert_block,
+    iter_converted_blocks,
+    plain_text,
+)
 
+# 변환/저장하는 동안 미리 받아 둘 Notion 결과 페이지 수
+PREFETCH_PAGES = 2
 
-# Notion 블록 타입을 우리 시스템 블록 타입으로 매핑
-NOTION_TO_OUR_BLOCK_TYPE = {
-    "paragraph": "text",
-    "heading_1": "heading1",
-    "heading_2": "heading2",
-    "heading_3": "heading3",
-    "bulleted_list_item": "bullet_list",
-    "numbered_list_item": "numbered_list",
-    "to_do": "todo",
-    "code": "code",
-    "quote": "quote",
-    "divider": "divider",
-}
+# 블록 목록 끝 표시
+_DONE = object()
 
 
 class NotionService:
@@ -70,6 +70,82 @@ class NotionService:
             # Notion API 에러를 그대로 전파
             raise e
 
+    def iter_notion_block_pages(
+        self, block_id: str, page_size: int = 100
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Notion 블록 목록을 페이지네이션 결과 한 페이지씩 반환하는 제너레이터
+
+        다음 페이지는 백그라운드 스레드에서 미리 요청하므로, 호출한 쪽이 현재 페이지를
+        변환/저장하는 동안 네트워크 대기가 겹쳐서 진행됩니다.
+
+        Args:
+            block_id: Notion 블록 ID (페이지 ID와 동일)
+            page_size: 한 번에 요청할 블록 수 (최대 100)
+
+        Yields:
+            블록 정보 리스트
+
+        Raises:
+            APIResponseError: Notion API 에러
+        """
+        pages: "queue.Queue" = queue.Queue(maxsize=PREFETCH_PAGES)
+        stopped = threading.Event()
+
+        def offer(item: Any) -> None:
+            # 소비하는 쪽이 중간에 멈추면 더 넣지 않고 종료
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def fetch() -> None:
+            start_cursor = None
+            try:
+                while not stopped.is_set():
+                    response = self.client.blocks.children.list(
+                        block_id=block_id,
+                        start_cursor=start_cursor,
+                        page_size=page_size
+                    )
+                    offer(response.get("results", []))
+                    if not response.get("has_more", False):
+                        break
+                    start_cursor = response.get("next_cursor")
+            except Exception as e:
+                offer(e)
+            offer(_DONE)
+
+        threading.Thread(target=fetch, name="notion-prefetch", daemon=True).start()
+        try:
+            while True:
+                item = pages.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+
+    def iter_notion_blocks(self, block_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Notion 블록을 하나씩 반환하는 제너레이터 (페이지네이션 처리)
+
+        Args:
+            block_id: Notion 블록 ID (페이지 ID와 동일)
+
+        Yields:
+            블록 정보 딕셔너리
+
+        Raises:
+            APIResponseError: Notion API 에러
+        """
+        for results in self.iter_notion_block_pages(block_id):
+            yield from results
+
     def get_notion_blocks(self, block_id: str) -> List[Dict[str, Any]]:
         """
         Notion 블록 목록 조회
@@ -83,25 +159,25 @@ class NotionService:
         Raises:
             APIResponseError: Notion API 에러
         """
-        try:
-            # 블록 목록 가져오기 (페이지네이션 처리)
-            blocks = []
-            has_more = True
-            start_cursor = None
+        return list(self.iter_notion_blocks(block_id))
 
-            while has_more:
-                response = self.client.blocks.children.list(
-                    block_id=block_id,
-                    start_cursor=start_cursor,
-                    page_size=100
-                )
-                blocks.extend(response.get("results", []))
-                has_more = response.get("has_more", False)
-                start_cursor = response.get("next_cursor")
-
-            return blocks
-        except APIResponseError as e:
-            raise e
+    def iter_import_blocks(
+        self, block_id: str, stats: Optional[ConversionStats] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Notion 블록을 가져오는 대로 우리 시스템 형식으로 변환하는 제너레이터
+
+        Args:
+            block_id: Notion 블록 ID (페이지 ID와 동일)
+            stats: 변환/건너뜀 개수를 기록할 통계 (선택사항)
+
+        Yields:
+            {"type", "content", "order"}
+
+        Raises:
+            APIResponseError: Notion API 에러
+        """
+        return iter_converted_blocks(self.iter_notion_blocks(block_id), stats)
 
     def extract_rich_text_content(self, rich_text_array: List[Dict[str, Any]]) -> str:
         """
@@ -113,10 +189,7 @@ class NotionService:
         Returns:
             합쳐진 텍스트 문자열
         """
-        if not rich_text_array:
-            return ""
-
-        return "".join([rt.get("plain_text", "") for rt in rich_text_array])
+        return plain_text(rich_text_array)
 
     def extract_page_title(self, page: Dict[str, Any]) -> str:
         """
@@ -165,80 +238,29 @@ class NotionService:
             order: 블록 순서
 
         Returns:
-            우리 시스템 블록 형식의 딕셔너리
+            우리 시스템 블록 형식의 딕셔너리 (지원하지 않는 타입은 빈 text 블록)
         """
-        block_type = notion_block.get("type")
-        our_block_type = NOTION_TO_OUR_BLOCK_TYPE.get(block_type, "text")
-
-        # 블록 내용 추출
-        block_data = notion_block.get(block_type, {})
-        content = ""
-
-        # 텍스트 기반 블록들
-        if block_type in [
-            "paragraph",
-            "heading_1",
-            "heading_2",
-            "heading_3",
-            "bulleted_list_item",
-            "numbered_list_item",
-            "quote",
-        ]:
-            rich_text = block_data.get("rich_text", [])
-            content = self.extract_rich_text_content(rich_text)
-
-        # To-do 블록
-        elif block_type == "to_do":
-            rich_text = block_data.get("rich_text", [])
-            text = self.extract_rich_text_content(rich_text)
-            checked = block_data.get("checked", False)
-            # 체크 상태를 마크다운 형식으로 표현
-            content = f"[{'x' if checked else ' '}] {text}"
-
-        # 코드 블록
-        elif block_type == "code":
-            rich_text = block_data.get("rich_text", [])
-            content = self.extract_rich_text_content(rich_text)
-            language = block_data.get("language", "")
-            if language:
-                content = f"```{language}\n{content}\n```"
-
-        # Divider는 내용 없음
-        elif block_type == "divider":
-            content = "---"
-
-        return {
-            "type": our_block_type,
-            "content": content,
-            "order": order,
-        }
+        our_block = convert_block(notion_block, order)
+        if our_block is None:
+            return {"type": "text", "content": "", "order": order}
+        return our_block
 
     def convert_notion_blocks_to_our_format(
-        self, notion_blocks: List[Dict[str, Any]]
+        self,
+        notion_blocks: List[Dict[str, Any]],
+        stats: Optional[ConversionStats] = None,
     ) -> List[Dict[str, Any]]:
         """
         Notion 블록 배열을 우리 시스템 형식으로 변환
 
         Args:
             notion_blocks: Notion 블록 객체 리스트
+            stats: 변환/건너뜀 개수를 기록할 통계 (선택사항)
 
         Returns:
-            우리 시스템 블록 형식의 리스트
+            우리 시스템 블록 형식의 리스트 (지원하지 않는 타입은 빠짐)
         """
-        our_blocks = []
-
-        for idx, notion_block in enumerate(notion_blocks):
-            # 지원하지 않는 블록 타입은 건너뛰기
-            block_type = notion_block.get("type")
-            if block_type not in NOTION_TO_OUR_BLOCK_TYPE:
-                continue
-
-            our_block = self.convert_notion_block_to_our_format(
-                notion_block, order=float(idx)
-            )
-            our_blocks.append(our_block)
-
-        return our_blocks
+        return list(iter_converted_blocks(notion_blocks, stats))
 
 
 # 편의를 위한 헬퍼 함수들
@@ -0,0 +1,145 @@
+"""
+페이지 집계 값(child_count, block_count, content_bytes) 관리 모듈
+
+사이드바가 하위 페이지나 블록을 조회하지 않고도 페이지 크기를 알 수 있도록
+`Page`에 비정규화된 집계 값을 저장합니다. 모든 쓰기 경로가 같은 트랜잭션 안에서
+증감 UPDATE를 실행하고, `reconcile_page_counts()`가 어긋난 값을 바로잡습니다.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import LargeBinary, bindparam, cast, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Page, Block
+
+
+def content_size(content: Optional[str]) -> int:
+    """블록 내용의 UTF-8 바이트 수"""
+    return len(content.encode("utf-8")) if content else 0
+
+
+# SQL에서 블록 내용의 바이트 수 (SQLite: BLOB 길이)
+block_content_bytes = func.coalesce(func.length(cast(Block.content, LargeBinary)), 0)
+
+
+def adjust_page_counts(
+    db: Session,
+    page_id: Optional[int],
+    children: int = 0,
+    blocks: int = 0,
+    content_bytes: int = 0,
+) -> None:
+    """
+    페이지 집계 값을 증감 (커밋은 호출자가 함)
+
+    Args:
+        db: 데이터베이스 세션
+        page_id: 페이지 ID (None이면 무시)
+        children: child_count 증감
+        blocks: block_count 증감
+        content_bytes: content_bytes 증감
+    """
+    if page_id is None or not (children or blocks or content_bytes):
+        return
+    db.execute(
+        update(Page)
+        .where(Page.id == page_id)
+        .values(
+            child_count=Page.child_count + children,
+            block_count=Page.block_count + blocks,
+            content_bytes=Page.content_bytes + content_bytes,
+            # 집계 값 변경은 페이지 수정으로 보지 않음
+            updated_at=Page.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def adjust_many(db: Session, deltas: Dict[int, Tuple[int, int, int]]) -> None:
+    """
+    여러 페이지의 집계 값을 한 번에 증감
+
+    Args:
+        db: 데이터베이스 세션
+        deltas: 페이지 ID -> (children, blocks, content_bytes) 증감
+    """
+    for page_id, (children, blocks, content_bytes) in deltas.items():
+        adjust_page_counts(db, page_id, children, blocks, content_bytes)
+
+
+def count_children_by_parent(db: Session, page_ids: Iterable[int]) -> Dict[Optional[int], int]:
+    """주어진 페이지들을 부모별로 센 결과"""
+    rows = db.execute(
+        select(Page.parent_id, func.count(Page.id))
+        .where(Page.id.in_(list(page_ids)))
+        .group_by(Page.parent_id)
+    )
+    return {parent_id: count for parent_id, count in rows}
+
+
+def reconcile_page_counts(db: Session) -> int:
+    """
+    모든 페이지의 집계 값을 실제 데이터와 비교해서 어긋난 값을 수정
+
+    커밋까지 수행합니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        수정한 페이지 수
+    """
+    child_counts = (
+        select(Page.parent_id.label("page_id"), func.count(Page.id).label("child_count"))
+        .where(Page.parent_id.is_not(None))
+        .group_by(Page.parent_id)
+        .subquery()
+    )
+    block_stats = (
+        select(
+            Block.page_id.label("page_id"),
+            func.count(Block.id).label("block_count"),
+            func.sum(block_content_bytes).label("content_bytes"),
+        )
+        .group_by(Block.page_id)
+        .subquery()
+    )
+    actual = db.execute(
+        select(
+            Page.id,
+            Page.child_count,
+            Page.block_count,
+            Page.content_bytes,
+            func.coalesce(child_counts.c.child_count, 0),
+            func.coalesce(block_stats.c.block_count, 0),
+            func.coalesce(block_stats.c.content_bytes, 0),
+        )
+        .outerjoin(child_counts, child_counts.c.page_id == Page.id)
+        .outerjoin(block_stats, block_stats.c.page_id == Page.id)
+    )
+
+    repairs = {}
+    for page_id, stored_children, stored_blocks, stored_bytes, children, blocks, size in actual:
+        if (stored_children, stored_blocks, stored_bytes) != (children, blocks, size):
+            repairs[page_id] = {
+                "p_id": page_id,
+                "child_count": children,
+                "block_count": blocks,
+                "content_bytes": size,
+            }
+
+    if repairs:
+        db.execute(
+            update(Page.__table__)
+            .where(Page.__table__.c.id == bindparam("p_id"))
+            .values(
+                child_count=bindparam("child_count"),
+                block_count=bindparam("block_count"),
+                content_bytes=bindparam("content_bytes"),
+                updated_at=Page.__table__.c.updated_at,
+            ),
+            list(repairs.values()),
+        )
+    db.commit()
+    return len(repairs)
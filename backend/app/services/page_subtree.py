@@ -0,0 +1,235 @@
+"""
+페이지 서브트리 일괄 처리 모듈
+
+페이지 복제와 이동을 클라이언트의 수천 번 API 호출 대신
+집합 기반 SQL (`WITH RECURSIVE` + `INSERT ... SELECT`) 몇 개로 처리합니다.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import func, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Page, Block, PageLink
+
+
+def subtree_cte(root_ids: List[int], exclude_id: Optional[int] = None):
+    """
+    root_ids와 그 모든 하위 페이지 ID를 반환하는 재귀 CTE
+
+    Args:
+        root_ids: 서브트리 루트 페이지 ID 목록
+        exclude_id: 제외할 페이지 ID (그 하위 페이지도 제외, 선택사항)
+
+    Returns:
+        `id` 컬럼 하나를 가진 재귀 CTE
+    """
+    subtree = (
+        select(Page.id.label("id"))
+        .where(Page.id.in_(root_ids))
+        .cte("subtree", recursive=True)
+    )
+    children = select(Page.id).join(subtree, Page.parent_id == subtree.c.id)
+    if exclude_id is not None:
+        children = children.where(Page.id != exclude_id)
+    return subtree.union(children)
+
+
+def id_map(old_ids, base_id: int, order_by):
+    """
+    기존 ID -> 새 ID 매핑 select
+
+    새 ID는 base_id 다음부터 order_by 순서대로 빈틈 없이 붙으므로,
+    복제할수록 ID가 복사한 행 수만큼만 늘어납니다.
+
+    Args:
+        old_ids: 기존 ID 컬럼
+        base_id: 현재 테이블의 최대 ID
+        order_by: 번호를 매길 순서 (인덱스 순서와 같으면 정렬 없이 번호를 매김)
+
+    Returns:
+        `old_id`, `new_id` 컬럼을 가진 select (WHERE 조건은 호출자가 추가)
+    """
+    return select(
+        old_ids.label("old_id"),
+        (literal(base_id) + func.row_number().over(order_by=order_by)).label("new_id"),
+    )
+
+
+def duplicate_subtree(
+    db: Session,
+    root: Page,
+    parent_id: Optional[int],
+    title: str,
+) -> int:
+    """
+    페이지 서브트리(하위 페이지와 모든 블록)를 복제
+
+    루트 복사본을 먼저 INSERT해서 쓰기 잠금을 잡은 뒤 기존 ID -> 새 ID 매핑을 만드므로,
+    복사본의 ID는 다른 쓰기와 충돌하지 않습니다. 커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        root: 복제할 루트 페이지
+        parent_id: 복사본 루트의 부모 페이지 ID
+        title: 복사본 루트의 제목
+
+    Returns:
+        복사본 루트 페이지 ID
+    """
+    # 1. 루트 복사본 생성 (SQLite는 이 시점에 쓰기 잠금을 획득)
+    #    집계 값은 원본과 같으므로 그대로 복사
+    new_root_id = db.execute(
+        insert(Page)
+        .values(
+            title=title,
+            icon=root.icon,
+            parent_id=parent_id,
+            user_id=root.user_id,
+            child_count=root.child_count,
+            block_count=root.block_count,
+            content_bytes=root.content_bytes,
+        )
+        .returning(Page.id)
+    ).scalar_one()
+
+    # 복사본을 원본 서브트리 안에 만들면 복사본 루트도 하위 페이지가 되므로 제외
+    subtree = subtree_cte([root.id], exclude_id=new_root_id)
+    in_subtree = Page.id.in_(select(subtree.c.id))
+
+    # 2. 페이지 ID 매핑: 루트는 방금 만든 복사본, 하위 페이지는 최대 ID 다음부터 순서대로
+    max_page_id = db.execute(select(func.max(Page.id))).scalar()
+    page_map = (
+        id_map(Page.id, max_page_id, Page.id)
+        .where(in_subtree, Page.id != root.id)
+        .union_all(select(literal(root.id), literal(new_root_id)))
+        .cte("page_map")
+    )
+    parent_map = page_map.alias("parent_map")
+
+    # 3. 하위 페이지 복사: id와 parent_id를 매핑으로 바꿈 (부모도 항상 서브트리 안에 있음)
+    db.execute(
+        insert(Page).from_select(
+            [
+                "id", "title", "icon", "parent_id", "user_id",
+                "child_count", "block_count", "content_bytes",
+            ],
+            select(
+                page_map.c.new_id,
+                Page.title,
+                Page.icon,
+                parent_map.c.new_id,
+                Page.user_id,
+                Page.child_count,
+                Page.block_count,
+                Page.content_bytes,
+            )
+            .join(page_map, page_map.c.old_id == Page.id)
+            .join(parent_map, parent_map.c.old_id == Page.parent_id)
+            .where(Page.id != root.id),
+        )
+    )
+
+    # 4. 블록 복사: 블록 ID 매핑을 만들고 page_id를 복사본 페이지로 바꿈
+    max_block_id = db.execute(select(func.max(Block.id))).scalar()
+    if max_block_id is None:
+        return new_root_id
+    # (page_id, order, id) 인덱스 순서로 번호를 매기므로 같은 order의 블록도 순서가 유지됨
+    block_map = (
+        id_map(Block.id, max_block_id, (Block.page_id, Block.order, Block.id))
+        .where(Block.page_id.in_(select(subtree.c.id)))
+        .cte("block_map")
+    )
+    db.execute(
+        insert(Block).from_select(
+            ["id", "page_id", "type", "content", "order"],
+            select(
+                block_map.c.new_id,
+                page_map.c.new_id,
+                Block.type,
+                Block.content,
+                Block.order,
+            )
+            .join(block_map, block_map.c.old_id == Block.id)
+            .join(page_map, page_map.c.old_id == Block.page_id),
+        )
+    )
+
+    # 5. 백링크 인덱스 복사: 복사된 블록의 참조도 그대로 유지
+    db.execute(
+        insert(PageLink).from_select(
+            ["source_block_id", "target_page_id", "source_page_id"],
+            select(
+                block_map.c.new_id,
+                PageLink.target_page_id,
+                page_map.c.new_id,
+            )
+            .join(block_map, block_map.c.old_id == PageLink.source_block_id)
+            .join(page_map, page_map.c.old_id == PageLink.source_page_id),
+        )
+    )
+
+    return new_root_id
+
+
+def fetch_subtree_rows(db: Session, root_id: int) -> List[tuple]:
+    """
+    서브트리 페이지의 계층 구조 컬럼 조회 (페이지 트리 인덱스 갱신용)
+
+    Args:
+        db: 데이터베이스 세션
+        root_id: 서브트리 루트 페이지 ID
+
+    Returns:
+        (페이지 ID, 부모 ID, 제목, 아이콘) 목록 (ID 순)
+    """
+    subtree = subtree_cte([root_id])
+    rows = db.execute(
+        select(Page.id, Page.parent_id, Page.title, Page.icon)
+        .where(Page.id.in_(select(subtree.c.id)))
+        .order_by(Page.id)
+    )
+    return [tuple(row) for row in rows]
+
+
+def moves_into_own_subtree(db: Session, page_ids: List[int], parent_id: int) -> bool:
+    """
+    parent_id가 이동할 페이지 자신이거나 그 하위 페이지인지 확인
+
+    Args:
+        db: 데이터베이스 세션
+        page_ids: 이동할 페이지 ID 목록
+        parent_id: 새 부모 페이지 ID
+
+    Returns:
+        순환 참조가 생기면 True
+    """
+    subtree = subtree_cte(page_ids)
+    found = db.execute(
+        select(subtree.c.id).where(subtree.c.id == parent_id).limit(1)
+    ).first()
+    return found is not None
+
+
+def move_pages(db: Session, page_ids: List[int], parent_id: Optional[int]) -> int:
+    """
+    여러 페이지(각 서브트리 포함)를 한 번의 UPDATE로 새 부모 아래로 이동
+
+    하위 페이지는 parent_id가 바뀌지 않으므로 함께 따라옵니다.
+    커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        page_ids: 이동할 페이지 ID 목록
+        parent_id: 새 부모 페이지 ID (None이면 최상위)
+
+    Returns:
+        이동한 페이지 수
+    """
+    result = db.execute(
+        update(Page)
+        .where(Page.id.in_(page_ids))
+        .values(parent_id=parent_id, updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
@@ -0,0 +1,450 @@
+"""
+페이지 계층 구조 메모리 인덱스 모듈
+
+순환 참조 검사, 하위 페이지 트리, 브레드크럼처럼 자주 읽히지만 작은 데이터
+(`id`, `parent_id`, `title`, `icon`)를 매번 SQLite에서 읽지 않고
+프로세스 메모리의 트리에서 바로 응답합니다.
+
+- 트리는 엔진(테넌트 샤드)마다 하나씩, 처음 사용할 때(기본 DB는 앱 시작 시) 읽어옵니다.
+- 페이지 쓰기 경로는 `record_*` 함수로 변경 사항을 세션에 기록하고,
+  커밋되면 트리에 바로 반영됩니다. 롤백되면 버려집니다.
+- 모든 페이지 계층 쓰기는 같은 트랜잭션에서 `page_tree_version`을 1 올립니다.
+  다른 워커 프로세스의 쓰기는 이 버전이 메모리 트리의 버전과 달라지는 것으로 감지하고
+  트리를 다시 읽습니다 (읽기 경로는 `page_tree_check_interval_ms`마다 확인).
+"""
+
+import threading
+import time
+from bisect import insort
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import bind_key, primary_bind
+from app.models import Page, PageTreeVersion
+
+# (페이지 ID, 부모 ID, 제목, 아이콘)
+PageTreeRow = Tuple[int, Optional[int], str, Optional[str]]
+
+# 세션 info에 변경 사항을 기록하는 키
+CHANGES_KEY = "page_tree_changes"
+VERSION_KEY = "page_tree_version"
+
+
+class PageNode:
+    """트리 노드 (메모리를 아끼기 위해 __slots__ 사용)"""
+
+    __slots__ = ("id", "parent_id", "title", "icon", "children")
+
+    def __init__(self, page_id: int, parent_id: Optional[int], title: str, icon: Optional[str]):
+        self.id = page_id
+        self.parent_id = parent_id
+        self.title = title
+        self.icon = icon
+        self.children: List[int] = []  # ID 순으로 정렬
+
+
+class PageTree:
+    """
+    엔진 하나의 페이지 계층 구조
+
+    Args:
+        rows: (페이지 ID, 부모 ID, 제목, 아이콘) 목록
+        version: rows를 읽은 시점의 page_tree_version
+    """
+
+    def __init__(self, rows: Iterable[PageTreeRow] = (), version: int = 0):
+        self.version = version
+        self.checked_at = time.monotonic()
+        self.stale = False
+        self._nodes: Dict[int, PageNode] = {}
+        self._roots: List[int] = []
+        self._lock = threading.RLock()
+
+        for page_id, parent_id, title, icon in rows:
+            self._nodes[page_id] = PageNode(page_id, parent_id, title, icon)
+        for page_id in sorted(self._nodes):
+            self._siblings(self._nodes[page_id].parent_id).append(page_id)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, page_id: int) -> bool:
+        return page_id in self._nodes
+
+    def _siblings(self, parent_id: Optional[int]) -> List[int]:
+        """parent_id의 자식 ID 목록 (최상위면 루트 목록)"""
+        if parent_id is None:
+            return self._roots
+        parent = self._nodes.get(parent_id)
+        return parent.children if parent is not None else self._roots
+
+    def _detach(self, node: PageNode) -> None:
+        try:
+            self._siblings(node.parent_id).remove(node.id)
+        except ValueError:
+            pass
+
+    # ---- 변경 (커밋 후 호출) ----
+
+    def upsert(
+        self, page_id: int, parent_id: Optional[int], title: str, icon: Optional[str]
+    ) -> None:
+        """페이지 추가 또는 수정"""
+        with self._lock:
+            node = self._nodes.get(page_id)
+            if node is None:
+                node = self._nodes[page_id] = PageNode(page_id, parent_id, title, icon)
+                insort(self._siblings(parent_id), page_id)
+                return
+            node.title = title
+            node.icon = icon
+            if node.parent_id != parent_id:
+                self._detach(node)
+                node.parent_id = parent_id
+                insort(self._siblings(parent_id), page_id)
+
+    def move(self, page_ids: List[int], parent_id: Optional[int]) -> None:
+        """여러 페이지를 새 부모 아래로 이동 (하위 페이지는 함께 따라옴)"""
+        with self._lock:
+            for page_id in page_ids:
+                node = self._nodes.get(page_id)
+                if node is None or node.parent_id == parent_id:
+                    continue
+                self._detach(node)
+                node.parent_id = parent_id
+                insort(self._siblings(parent_id), page_id)
+
+    def remove(self, page_id: int) -> None:
+        """페이지와 모든 하위 페이지 제거"""
+        with self._lock:
+            node = self._nodes.get(page_id)
+            if node is None:
+                return
+            self._detach(node)
+            stack = [page_id]
+            while stack:
+                removed = self._nodes.pop(stack.pop(), None)
+                if removed is not None:
+                    stack.extend(removed.children)
+
+    def apply_changes(self, version: int, changes: List[Tuple]) -> bool:
+        """
+        커밋된 변경 사항 반영
+
+        바로 앞 버전이 아니면(다른 쓰기를 놓쳤으면) 다시 읽도록 stale로 표시합니다.
+
+        Returns:
+            반영했으면 True
+        """
+        with self._lock:
+            if self.stale or self.version != version - 1:
+                self.stale = True
+                return False
+            for kind, *args in changes:
+                if kind == "upsert":
+                    for row in args[0]:
+                        self.upsert(*row)
+                elif kind == "move":
+                    self.move(*args)
+                elif kind == "remove":
+                    self.remove(*args)
+            self.version = version
+            return True
+
+    # ---- 조회 ----
+
+    def children(self, parent_id: Optional[int]) -> List[int]:
+        """직계 자식 페이지 ID 목록"""
+        with self._lock:
+            return list(self._siblings(parent_id))
+
+    def ancestors(self, page_id: int) -> List[Dict[str, Any]]:
+        """
+        최상위 페이지부터 page_id까지의 경로 (브레드크럼)
+
+        Returns:
+            {"id", "title", "icon"} dict 리스트 (page_id가 없으면 빈 리스트)
+        """
+        path = []
+        visited = set()
+        with self._lock:
+            node = self._nodes.get(page_id)
+            while node is not None and node.id not in visited:
+                visited.add(node.id)
+                path.append({"id": node.id, "title": node.title, "icon": node.icon})
+                node = self._nodes.get(node.parent_id) if node.parent_id is not None else None
+        path.reverse()
+        return path
+
+    def is_descendant(self, page_id: int, potential_parent_id: Optional[int]) -> bool:
+        """potential_parent_id가 page_id 자신 또는 하위 페이지인지 확인 (순환 구조도 True)"""
+        if potential_parent_id is None:
+            return False
+        visited = set()
+        with self._lock:
+            current = self._nodes.get(potential_parent_id)
+            while current is not None:
+                if current.id == page_id or current.id in visited:
+                    return True
+                visited.add(current.id)
+                if current.parent_id is None:
+                    break
+                current = self._nodes.get(current.parent_id)
+        return False
+
+    def moves_into_own_subtree(self, page_ids: List[int], parent_id: int) -> bool:
+        """parent_id가 이동할 페이지 중 하나 자신이거나 그 하위 페이지인지 확인"""
+        moving = set(page_ids)
+        visited = set()
+        with self._lock:
+            current = self._nodes.get(parent_id)
+            while current is not None and current.id not in visited:
+                if current.id in moving:
+                    return True
+                visited.add(current.id)
+                if current.parent_id is None:
+                    break
+                current = self._nodes.get(current.parent_id)
+        return False
+
+    def subtree(
+        self, root_id: Optional[int] = None, depth: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        중첩된 트리 구조 반환
+
+        Args:
+            root_id: 이 페이지의 하위 트리만 (None이면 전체)
+            depth: 최대 깊이 (None이면 제한 없음, 1이면 직계 자식만)
+
+        Returns:
+            {"id", "title", "icon", "parent_id", "children"} dict 리스트
+        """
+        with self._lock:
+            result: List[Dict[str, Any]] = []
+            stack = [(page_id, result, 1) for page_id in reversed(self._siblings(root_id))]
+            while stack:
+                page_id, siblings, level = stack.pop()
+                node = self._nodes[page_id]
+                item = {
+                    "id": node.id,
+                    "title": node.title,
+                    "icon": node.icon,
+                    "parent_id": node.parent_id,
+                    "children": [],
+                }
+                siblings.append(item)
+                if depth is None or level < depth:
+                    stack.extend(
+                        (child_id, item["children"], level + 1)
+                        for child_id in reversed(node.children)
+                    )
+            return result
+
+    def rows(self) -> Dict[int, PageTreeRow]:
+        """인덱스 내용 (일관성 검사용)"""
+        with self._lock:
+            return {
+                node.id: (node.id, node.parent_id, node.title, node.icon)
+                for node in self._nodes.values()
+            }
+
+
+def read_version(db: Session) -> int:
+    """DB의 현재 page_tree_version (행이 없으면 0)"""
+    return db.execute(
+        select(PageTreeVersion.version).where(PageTreeVersion.id == 1)
+    ).scalar() or 0
+
+
+def read_rows(db: Session) -> List[PageTreeRow]:
+    """DB에서 트리 구성에 필요한 컬럼만 조회"""
+    rows = db.execute(select(Page.id, Page.parent_id, Page.title, Page.icon))
+    return [tuple(row) for row in rows]
+
+
+class PageTreeIndex:
+    """
+    엔진별 PageTree 관리자
+
+    Args:
+        enabled: 메모리 인덱스 사용 여부 (끄면 요청마다 DB에서 트리를 구성)
+        check_interval_ms: 읽기 시 다른 워커의 쓰기를 확인하는 간격 (ms)
+        max_trees: 메모리에 둘 최대 트리 수 (테넌트 샤드, LRU)
+    """
+
+    def __init__(self, enabled: bool = True, check_interval_ms: int = 1000, max_trees: int = 64):
+        self.enabled = enabled
+        self.check_interval = check_interval_ms / 1000
+        self.max_trees = max_trees
+        self._trees: "OrderedDict[str, PageTree]" = OrderedDict()  # bind_key -> 트리
+        self._lock = threading.Lock()
+
+        # 통계
+        self.loads = 0
+        self.applied_changes = 0
+
+    def load(self, db: Session) -> PageTree:
+        """DB에서 트리를 새로 읽어 캐시에 저장"""
+        # 버전을 먼저 읽으므로 그 사이의 쓰기는 다음 확인 때 다시 읽게 됨
+        version = read_version(db)
+        tree = PageTree(read_rows(db), version)
+        self.loads += 1
+        if self.enabled:
+            key = bind_key(primary_bind(db))
+            with self._lock:
+                self._trees[key] = tree
+                self._trees.move_to_end(key)
+                while len(self._trees) > self.max_trees:
+                    self._trees.popitem(last=False)
+        return tree
+
+    def get(self, db: Session) -> PageTree:
+        """
+        읽기용 트리 반환
+
+        다른 워커의 쓰기는 check_interval마다 버전을 비교해서 감지합니다.
+        """
+        if not self.enabled:
+            return self.load(db)
+        key = bind_key(primary_bind(db))
+        with self._lock:
+            tree = self._trees.get(key)
+            if tree is not None:
+                self._trees.move_to_end(key)
+        if tree is None or tree.stale:
+            return self.load(db)
+
+        now = time.monotonic()
+        if now - tree.checked_at >= self.check_interval:
+            if read_version(db) != tree.version:
+                return self.load(db)
+            tree.checked_at = now
+        return tree
+
+    def get_current(self, db: Session) -> Optional[PageTree]:
+        """
+        쓰기 트랜잭션 안의 검증용 트리 반환
+
+        트리 버전이 이 트랜잭션에서 보이는 DB 버전과 정확히 같을 때만 반환합니다.
+        (같은 트랜잭션에서 이미 페이지를 바꿨거나 다른 워커가 바꿨으면 None →
+        호출자는 DB로 검사)
+        """
+        if not self.enabled or db.info.get(CHANGES_KEY):
+            return None
+        with self._lock:
+            tree = self._trees.get(bind_key(primary_bind(db)))
+        if tree is None or tree.stale or read_version(db) != tree.version:
+            return None
+        return tree
+
+    def apply(self, bind: Engine, version: int, changes: List[Tuple]) -> None:
+        """커밋된 변경 사항을 해당 엔진의 트리에 반영"""
+        with self._lock:
+            tree = self._trees.get(bind_key(bind))
+        if tree is not None and tree.apply_changes(version, changes):
+            self.applied_changes += len(changes)
+
+    def verify(self, db: Session) -> Dict[str, Any]:
+        """
+        메모리 트리와 DB를 비교하고, 다르면 다시 읽음
+
+        Returns:
+            일관성 여부와 서로 다른 페이지 ID 목록
+        """
+        tree = self.get(db)
+        db_rows = {row[0]: row for row in read_rows(db)}
+        tree_rows = tree.rows()
+        mismatched = sorted(
+            page_id for page_id in db_rows.keys() | tree_rows.keys()
+            if db_rows.get(page_id) != tree_rows.get(page_id)
+        )
+        if mismatched:
+            tree = self.load(db)
+        return {
+            "consistent": not mismatched,
+            "mismatched_page_ids": mismatched[:100],
+            "version": tree.version,
+            "nodes": len(tree),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """인덱스 통계"""
+        with self._lock:
+            trees = list(self._trees.values())
+        return {
+            "enabled": self.enabled,
+            "trees": len(trees),
+            "nodes": sum(len(tree) for tree in trees),
+            "loads": self.loads,
+            "applied_changes": self.applied_changes,
+        }
+
+
+# 전역 인덱스 인스턴스
+page_trees = PageTreeIndex(
+    enabled=settings.page_tree_index_enabled,
+    check_interval_ms=settings.page_tree_check_interval_ms,
+    max_trees=settings.tenant_max_open_engines,
+)
+
+
+def bump_version(db: Session) -> None:
+    """이 트랜잭션에서 처음 페이지 계층을 바꿀 때 page_tree_version을 1 올림"""
+    if VERSION_KEY in db.info:
+        return
+    version = db.execute(
+        update(PageTreeVersion)
+        .where(PageTreeVersion.id == 1)
+        .values(version=PageTreeVersion.version + 1)
+        .returning(PageTreeVersion.version)
+    ).scalar()
+    if version is None:
+        version = 1
+        db.execute(insert(PageTreeVersion).values(id=1, version=version))
+    db.info[VERSION_KEY] = version
+
+
+def record_change(db: Session, *change) -> None:
+    bump_version(db)
+    db.info.setdefault(CHANGES_KEY, []).append(change)
+
+
+def record_pages(db: Session, rows: Iterable[PageTreeRow]) -> None:
+    """
+    추가/수정된 페이지 기록 (커밋 후 트리에 반영)
+
+    Args:
+        db: 쓰기 세션
+        rows: (페이지 ID, 부모 ID, 제목, 아이콘) 목록
+    """
+    record_change(db, "upsert", list(rows))
+
+
+def record_move(db: Session, page_ids: List[int], parent_id: Optional[int]) -> None:
+    """여러 페이지의 부모 변경 기록"""
+    record_change(db, "move", list(page_ids), parent_id)
+
+
+def record_delete(db: Session, page_id: int) -> None:
+    """페이지(하위 페이지 포함) 삭제 기록"""
+    record_change(db, "remove", page_id)
+
+
+@event.listens_for(Session, "after_commit")
+def apply_page_tree_changes(session: Session) -> None:
+    changes = session.info.pop(CHANGES_KEY, None)
+    version = session.info.pop(VERSION_KEY, None)
+    if changes and version is not None:
+        page_trees.apply(primary_bind(session), version, changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_page_tree_changes(session: Session) -> None:
+    session.info.pop(CHANGES_KEY, None)
+    session.info.pop(VERSION_KEY, None)
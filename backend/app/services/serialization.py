@@ -0,0 +1,420 @@
+"""
+읽기 전용 엔드포인트를 위한 고속 직렬화 모듈
+
+ORM 객체를 만들고 Pydantic `response_model`로 검증하는 대신,
+Core SELECT 결과 튜플에서 바로 dict를 만들고 orjson으로 인코딩합니다.
+응답 형식(wire format)은 `PageResponse` / `BlockResponse`와 동일합니다.
+
+클라이언트가 `Accept: application/msgpack`을 보내면 같은 내용을 MessagePack으로 인코딩하고,
+`Content-Type: application/msgpack` 요청 본문도 해석합니다 (`MsgPackRoute`).
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import orjson
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.models import Page, Block
+
+try:
+    import msgpack
+except ImportError:  # msgpack은 선택 의존성
+    msgpack = None
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+# JSON 응답에 해당하는 Accept 항목 (구체적인 순서)
+JSON_MEDIA_RANGES = ("application/json", "application/*", "*/*")
+
+
+# PageResponse 필드와 같은 순서의 컬럼
+PAGE_COLUMNS = (
+    Page.id,
+    Page.title,
+    Page.icon,
+    Page.parent_id,
+    Page.user_id,
+    Page.child_count,
+    Page.block_count,
+    Page.content_bytes,
+    Page.created_at,
+    Page.updated_at,
+)
+
+# BlockResponse 필드와 같은 순서의 컬럼
+BLOCK_COLUMNS = (
+    Block.id,
+    Block.page_id,
+    Block.type,
+    Block.content,
+    Block.order,
+    Block.created_at,
+    Block.updated_at,
+)
+
+PAGE_KEYS = tuple(column.key for column in PAGE_COLUMNS)
+BLOCK_KEYS = tuple(column.key for column in BLOCK_COLUMNS)
+
+# Pydantic과 같은 datetime 표기("Z")를 위해 OPT_UTC_Z 사용
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def rows_to_dicts(keys: tuple, rows: Iterable[tuple]) -> List[Dict[str, Any]]:
+    """
+    Core 결과 튜플을 응답용 dict 리스트로 변환
+
+    Args:
+        keys: 컬럼 이름 튜플
+        rows: SELECT 결과 행
+
+    Returns:
+        dict 리스트
+    """
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def fetch_page_rows(db: Session, parent_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    페이지 목록을 Core SELECT로 조회
+
+    Args:
+        db: 데이터베이스 세션
+        parent_id: 부모 페이지 ID 필터 (선택사항)
+
+    Returns:
+        PageResponse 형식의 dict 리스트
+    """
+    stmt = select(*PAGE_COLUMNS)
+    if parent_id is not None:
+        stmt = stmt.where(Page.parent_id == parent_id)
+    return rows_to_dicts(PAGE_KEYS, db.execute(stmt))
+
+
+def fetch_page_row(db: Session, page_id: int) -> Optional[Dict[str, Any]]:
+    """
+    단일 페이지를 Core SELECT로 조회
+
+    Args:
+        db: 데이터베이스 세션
+        page_id: 페이지 ID
+
+    Returns:
+        PageResponse 형식의 dict (없으면 None)
+    """
+    row = db.execute(select(*PAGE_COLUMNS).where(Page.id == page_id)).first()
+    if row is None:
+        return None
+    return dict(zip(PAGE_KEYS, row))
+
+
+def fetch_block_rows(
+    db: Session,
+    page_id: int,
+    after_order: Optional[float] = None,
+    after_id: Optional[int] = None,
+    before_order: Optional[float] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    페이지의 블록 목록을 order 순으로 Core SELECT 조회
+
+    (order, id) 순서의 keyset 범위 조회를 지원합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        page_id: 페이지 ID
+        after_order: 이 order 이후의 블록만 조회 (선택사항)
+        after_id: after_order와 같은 order인 블록 중 이 ID 이후만 조회 (선택사항)
+        before_order: 이 order 이전의 블록만 조회 (선택사항)
+        limit: 최대 블록 수 (선택사항)
+
+    Returns:
+        BlockResponse 형식의 dict 리스트
+    """
+    stmt = select(*BLOCK_COLUMNS).where(Block.page_id == page_id)
+    if after_order is not None:
+        if after_id is not None:
+            stmt = stmt.where(
+                or_(
+                    Block.order > after_order,
+                    and_(Block.order == after_order, Block.id > after_id),
+                )
+            )
+        else:
+            stmt = stmt.where(Block.order > after_order)
+    if before_order is not None:
+        stmt = stmt.where(Block.order < before_order)
+    stmt = stmt.order_by(Block.order, Block.id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return rows_to_dicts(BLOCK_KEYS, db.execute(stmt))
+
+
+def fetch_pages_by_ids(db: Session, page_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    여러 페이지를 한 번의 Core SELECT로 조회
+
+    Args:
+        db: 데이터베이스 세션
+        page_ids: 페이지 ID 목록
+
+    Returns:
+        PageResponse 형식의 dict 리스트 (ID 순, 없는 페이지는 빠짐)
+    """
+    if not page_ids:
+        return []
+    stmt = select(*PAGE_COLUMNS).where(Page.id.in_(page_ids)).order_by(Page.id)
+    return rows_to_dicts(PAGE_KEYS, db.execute(stmt))
+
+
+def fetch_blocks_by_page(db: Session, page_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    여러 페이지의 블록을 한 번의 Core SELECT로 조회해서 페이지별로 묶음
+
+    `(page_id, order, id)` 인덱스 순서로 읽으므로 정렬 단계가 없습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        page_ids: 페이지 ID 목록
+
+    Returns:
+        {페이지 ID: order 순 BlockResponse 형식의 dict 리스트} (블록 없는 페이지는 빠짐)
+    """
+    blocks: Dict[int, List[Dict[str, Any]]] = {}
+    if not page_ids:
+        return blocks
+    stmt = (
+        select(*BLOCK_COLUMNS)
+        .where(Block.page_id.in_(page_ids))
+        .order_by(Block.page_id, Block.order, Block.id)
+    )
+    for row in db.execute(stmt):
+        block = dict(zip(BLOCK_KEYS, row))
+        blocks.setdefault(block["page_id"], []).append(block)
+    return blocks
+
+
+def fetch_block_row(db: Session, block_id: int) -> Optional[Dict[str, Any]]:
+    """
+    단일 블록을 Core SELECT로 조회
+
+    Args:
+        db: 데이터베이스 세션
+        block_id: 블록 ID
+
+    Returns:
+        BlockResponse 형식의 dict (없으면 None)
+    """
+    row = db.execute(select(*BLOCK_COLUMNS).where(Block.id == block_id)).first()
+    if row is None:
+        return None
+    return dict(zip(BLOCK_KEYS, row))
+
+
+def fetch_block_stats(db: Session, page_id: int) -> Tuple[int, Optional[float]]:
+    """
+    페이지의 전체 블록 수와 마지막 order 조회
+
+    Args:
+        db: 데이터베이스 세션
+        page_id: 페이지 ID
+
+    Returns:
+        (블록 수, 최대 order) 튜플
+    """
+    count, max_order = db.execute(
+        select(func.count(Block.id), func.max(Block.order)).where(Block.page_id == page_id)
+    ).one()
+    return count, max_order
+
+
+def dumps(payload: Any) -> bytes:
+    """payload를 orjson으로 인코딩"""
+    return orjson.dumps(payload, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(ORJSONResponse):
+    """Pydantic 검증을 거치지 않고 orjson으로 바로 인코딩하는 응답"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def encode_msgpack_default(value: Any) -> Any:
+    """MessagePack이 모르는 타입을 JSON 응답과 같은 표기로 변환"""
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+class MsgPackResponse(Response):
+    """MessagePack 응답"""
+
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=encode_msgpack_default, use_bin_type=True)
+
+
+def parse_media_types(header: str) -> List[Tuple[str, float]]:
+    """
+    Accept 형식의 헤더를 (미디어 타입, q 값) 목록으로 변환
+
+    q 값이 없으면 1, 잘못된 q 값은 0으로 봅니다.
+    """
+    media_types = []
+    for item in header.lower().split(","):
+        media_type, *params = [part.strip() for part in item.split(";")]
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    quality = 0.0
+        media_types.append((media_type, quality))
+    return media_types
+
+
+def is_msgpack(content_type: Optional[str]) -> bool:
+    """Content-Type 헤더가 MessagePack 미디어 타입인지 확인 (파라미터 제외)"""
+    if not content_type:
+        return False
+    return content_type.split(";")[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    """
+    Accept 헤더에 따라 MessagePack으로 응답할지 결정
+
+    MessagePack 타입을 직접 적고 q > 0이며, JSON보다 q 값이 작지 않을 때만
+    MessagePack을 고릅니다. JSON의 q 값은 가장 구체적인 항목
+    (application/json > application/* > */*)을 따릅니다.
+    """
+    if not accept:
+        return False
+    msgpack_quality = 0.0
+    json_qualities: Dict[str, float] = {}
+    for media_type, quality in parse_media_types(accept):
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_quality = max(msgpack_quality, quality)
+        elif media_type in JSON_MEDIA_RANGES:
+            json_qualities[media_type] = max(json_qualities.get(media_type, 0.0), quality)
+    json_quality = next(
+        (json_qualities[media_type] for media_type in JSON_MEDIA_RANGES if media_type in json_qualities),
+        0.0,
+    )
+    return msgpack_quality > 0 and msgpack_quality >= json_quality
+
+
+def render(request: Request, payload: Any) -> Response:
+    """
+    Accept 헤더에 따라 JSON(orjson) 또는 MessagePack 응답 생성
+
+    Args:
+        request: 현재 요청
+        payload: 응답 내용 (dict / list)
+
+    Returns:
+        FastJSONResponse 또는 MsgPackResponse
+    """
+    if msgpack is not None and accepts_msgpack(request.headers.get("accept")):
+        response = MsgPackResponse(payload)
+    else:
+        response = FastJSONResponse(payload)
+    # 같은 URL이라도 Accept 헤더에 따라 형식이 달라지므로 캐시가 구분하도록 함
+    response.headers.add_vary_header("Accept")
+    return response
+
+
+def iter_json_stream(key: str, items: List[Any], extra: Dict[str, Any]) -> Iterator[bytes]:
+    """{key: [...items], **extra}를 항목 하나씩 JSON으로 인코딩"""
+    yield b'{"' + key.encode() + b'":['
+    for index, item in enumerate(items):
+        yield (b"," if index else b"") + dumps(item)
+    yield b"]"
+    for extra_key, value in extra.items():
+        yield b',"' + extra_key.encode() + b'":' + dumps(value)
+    yield b"}"
+
+
+def iter_msgpack_stream(key: str, items: List[Any], extra: Dict[str, Any]) -> Iterator[bytes]:
+    """{key: [...items], **extra}를 항목 하나씩 MessagePack으로 인코딩"""
+    packer = msgpack.Packer(default=encode_msgpack_default, use_bin_type=True)
+    yield packer.pack_map_header(1 + len(extra)) + packer.pack(key)
+    yield packer.pack_array_header(len(items))
+    for item in items:
+        yield packer.pack(item)
+    for extra_key, value in extra.items():
+        yield packer.pack(extra_key) + packer.pack(value)
+
+
+def render_stream(
+    request: Request, key: str, items: List[Any], extra: Optional[Dict[str, Any]] = None
+) -> StreamingResponse:
+    """
+    항목이 많은 응답을 한 번에 인코딩하지 않고 항목 단위로 스트리밍
+
+    응답 본문은 `{key: [...items], **extra}`이며 형식 선택은 `render()`와 같습니다.
+
+    Args:
+        request: 현재 요청
+        key: 항목 리스트의 키
+        items: 인코딩할 항목 (이미 조회가 끝난 값이어야 함)
+        extra: 리스트 뒤에 붙일 나머지 필드
+
+    Returns:
+        StreamingResponse (JSON 또는 MessagePack)
+    """
+    extra = extra or {}
+    if msgpack is not None and accepts_msgpack(request.headers.get("accept")):
+        response = StreamingResponse(
+            iter_msgpack_stream(key, items, extra), media_type=MsgPackResponse.media_type
+        )
+    else:
+        response = StreamingResponse(
+            iter_json_stream(key, items, extra), media_type=FastJSONResponse.media_type
+        )
+    response.headers.add_vary_header("Accept")
+    return response
+
+
+class MsgPackRoute(APIRoute):
+    """
+    MessagePack 요청 본문을 JSON으로 바꿔서 기존 검증 로직에 넘기는 라우트 클래스
+
+    `APIRouter(route_class=MsgPackRoute)`로 사용합니다.
+    """
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+
+        async def handler(request: Request) -> Response:
+            if is_msgpack(request.headers.get("content-type")):
+                if msgpack is None:
+                    raise HTTPException(status_code=415, detail="MessagePack is not supported")
+                try:
+                    payload = msgpack.unpackb(await request.body(), raw=False)
+                except Exception:
+                    raise HTTPException(status_code=400, detail="Invalid MessagePack body")
+
+                scope = dict(request.scope)
+                scope["headers"] = [
+                    (key, value)
+                    for key, value in request.scope["headers"]
+                    if key not in (b"content-type", b"content-length")
+                ] + [(b"content-type", b"application/json")]
+                request = Request(scope, request.receive)
+                request._body = orjson.dumps(payload)
+
+            return await original_handler(request)
+
+        return handler
@@ -0,0 +1,101 @@
+"""
+워크스페이스 전체 할 일(todo) 조회 모듈
+
+할 일 블록의 체크 상태는 `Block.checked` 생성 컬럼("[x] " 접두어에서 계산)에 있고,
+`type = 'todo'` 부분 인덱스 `(checked, id)`로 조회합니다.
+블록 내용을 스캔하거나 문자열을 파싱하지 않고, ID 기준 keyset 페이지네이션으로
+블록이 수백만 개여도 창 하나를 인덱스 범위 조회로 가져옵니다.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import literal_column, select
+from sqlalchemy.orm import Session
+
+from app.models import Block, Page
+
+TODO_TYPE = "todo"
+
+# 부분 인덱스(WHERE type = 'todo')를 쓰려면 바인드 변수가 아닌 리터럴이어야 함
+IS_TODO = Block.type == literal_column(f"'{TODO_TYPE}'")
+
+TODO_COLUMNS = (
+    Block.id,
+    Block.page_id,
+    Block.content,
+    Block.order,
+    Block.checked,
+    Block.updated_at,
+    Page.title.label("page_title"),
+    Page.icon.label("page_icon"),
+)
+TODO_KEYS = tuple(column.key for column in TODO_COLUMNS)
+
+
+def is_checked(content: Optional[str]) -> bool:
+    """할 일 블록 내용이 체크된 상태인지 확인 (생성 컬럼과 같은 규칙)"""
+    return bool(content) and content.startswith("[x]")
+
+
+def fetch_todos(
+    db: Session,
+    checked: Optional[bool] = None,
+    after_id: Optional[int] = None,
+    limit: int = 50,
+    overlay: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    할 일 블록을 ID 순으로 페이지 정보와 함께 조회
+
+    체크 상태 필터는 SQL에서 LIMIT 전에 적용합니다. overlay로 덮어쓴 값 때문에
+    필터와 맞지 않게 된 항목은 빼고, 창이 찰 때까지 다음 행을 이어서 조회하므로
+    더 남은 항목이 있는데 짧은 창을 반환하지 않습니다.
+    overlay로는 필터에서 빠지는 항목만 걸러낼 수 있으므로, 필터를 쓸 때는 호출자가
+    아직 반영되지 않은 값을 먼저 반영해야 새로 필터에 맞게 된 항목도 포함됩니다.
+
+    Args:
+        db: 데이터베이스 세션
+        checked: 체크 상태 필터 (None이면 전체)
+        after_id: 이 블록 ID 이후만 조회 (keyset 커서)
+        limit: 최대 개수
+        overlay: 아직 DB에 반영되지 않은 값을 항목에 덮어쓰는 함수 (선택사항)
+
+    Returns:
+        (TodoResponse 형식의 dict 리스트, 다음 창의 after_id 또는 None)
+    """
+    items: List[Dict[str, Any]] = []
+    while True:
+        remaining = limit - len(items)
+        stmt = (
+            select(*TODO_COLUMNS)
+            .join(Page, Page.id == Block.page_id)
+            .where(IS_TODO)
+            .order_by(Block.id)
+            .limit(remaining + 1)
+        )
+        if checked is not None:
+            stmt = stmt.where(Block.checked == checked)
+        if after_id is not None:
+            stmt = stmt.where(Block.id > after_id)
+
+        rows = db.execute(stmt).all()
+        has_more = len(rows) > remaining
+        rows = rows[:remaining]
+        window = [dict(zip(TODO_KEYS, row)) for row in rows]
+        if overlay is not None:
+            # 덮어쓴 내용으로 체크 상태를 다시 계산
+            overlay(window)
+            for item in window:
+                item["checked"] = is_checked(item["content"])
+            if checked is not None:
+                window = [item for item in window if item["checked"] == checked]
+        else:
+            for item in window:
+                item["checked"] = bool(item["checked"])
+        items.extend(window)
+
+        if not has_more:
+            return items, None
+        after_id = rows[-1][0]
+        if len(items) >= limit:
+            return items, after_id
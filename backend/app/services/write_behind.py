@@ -0,0 +1,334 @@
+"""
+블록 내용 저장을 위한 write-behind 버퍼 모듈
+
+타이핑 중 프론트엔드가 수백 ms마다 보내는 `update_block` 요청을 바로 커밋하지 않고
+메모리에 모아 두었다가, 짧은 주기나 개수 임계값에 도달하면 한 트랜잭션으로 반영합니다.
+같은 블록에 대한 연속 수정은 마지막 값 하나로 합쳐집니다.
+대기 값은 (데이터베이스 경로, 블록 ID)로 구분하므로 테넌트 샤드마다 따로 반영되고,
+샤드 엔진이 LRU에서 밀려나 다시 만들어져도 같은 값을 찾습니다.
+
+- 읽기 경로는 `overlay()`로 버퍼에 있는 값을 덮어써서 항상 최신 값을 봅니다.
+- 버퍼를 거치지 않는 쓰기는 `flush_if_pending()`으로 먼저 대기 중인 값을 반영합니다.
+- 앱 종료 시 `stop()`이 남은 값을 모두 반영합니다.
+- 백링크 인덱스와 페이지 집계 값은 반영 시점에 같은 트랜잭션에서 갱신됩니다.
+- 단일 writer가 켜져 있으면 반영도 writer 큐를 거쳐 다른 쓰기와 함께 커밋됩니다.
+
+버퍼는 프로세스 메모리에 있으므로 다른 워커는 아직 반영되지 않은 값을 보지 못합니다.
+그래서 write-behind는 워커 하나로만 실행할 수 있으며,
+`WEB_CONCURRENCY`가 2 이상이면 시작하지 않습니다.
+"""
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import bind_key, primary_bind
+from app.models import Block
+from app.services.backlinks import sync_block_links
+from app.services.page_counts import adjust_many, block_content_bytes, content_size
+from app.services.writer import write_queue
+
+
+logger = logging.getLogger(__name__)
+
+# 버퍼링 가능한 블록 필드
+BUFFERED_FIELDS = {"content"}
+
+# (세션이 연결된 데이터베이스의 bind_key, 블록 ID)
+BufferKey = Tuple[str, int]
+
+
+def utc_now() -> datetime:
+    """SQLite CURRENT_TIMESTAMP와 같은 형식(naive UTC, 초 단위)의 현재 시각"""
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+class BlockWriteBuffer:
+    """
+    블록 수정 사항을 모았다가 일괄 반영하는 write-behind 버퍼
+
+    Args:
+        enabled: 버퍼 사용 여부
+        flush_interval_ms: 주기적 반영 간격 (ms)
+        max_pending: 이 개수 이상 쌓이면 즉시 반영
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        flush_interval_ms: int = 200,
+        max_pending: int = 500,
+    ):
+        self.enabled = enabled
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_pending = max_pending
+
+        self._pending: Dict[BufferKey, Dict[str, Any]] = {}  # 반영 대기 값
+        self._inflight: Dict[BufferKey, Dict[str, Any]] = {}  # 현재 반영 중인 값
+        self._binds: Dict[str, Engine] = {}  # bind_key -> 반영에 쓸 최근 엔진
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 통계
+        self.buffered_updates = 0
+        self.flushed_rows = 0
+        self.flush_count = 0
+
+    def accepts(self, update_data: Dict[str, Any]) -> bool:
+        """이 수정 요청을 버퍼로 처리할 수 있는지 확인"""
+        return self.enabled and bool(update_data) and set(update_data) <= BUFFERED_FIELDS
+
+    def put(self, db: Session, block_id: int, update_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        블록 수정 사항을 버퍼에 추가 (같은 블록은 합쳐짐)
+
+        Args:
+            db: 블록이 속한 데이터베이스 세션
+            block_id: 블록 ID
+            update_data: 수정할 필드 값
+
+        Returns:
+            해당 블록의 대기 중인 전체 수정 값 (updated_at 포함)
+        """
+        with self._lock:
+            bind = primary_bind(db)
+            database = bind_key(bind)
+            self._binds[database] = bind
+            entry = self._pending.setdefault((database, block_id), {})
+            entry.update(update_data)
+            entry["updated_at"] = utc_now()
+            self.buffered_updates += 1
+            pending_count = len(self._pending)
+            merged = dict(entry)
+
+        if pending_count >= self.max_pending:
+            self._wake.set()
+        return merged
+
+    def get(self, db: Session, block_id: int) -> Optional[Dict[str, Any]]:
+        """블록의 대기 중인 수정 값 조회 (없으면 None)"""
+        key = (bind_key(primary_bind(db)), block_id)
+        with self._lock:
+            inflight = self._inflight.get(key)
+            pending = self._pending.get(key)
+            if inflight is None and pending is None:
+                return None
+            return {**(inflight or {}), **(pending or {})}
+
+    def overlay(self, db: Session, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        DB에서 읽은 블록 dict에 대기 중인 값을 덮어씀
+
+        Args:
+            db: 블록을 읽은 데이터베이스 세션
+            rows: BlockResponse 형식의 dict 리스트
+
+        Returns:
+            같은 리스트 (제자리 수정)
+        """
+        if not self._pending and not self._inflight:
+            return rows
+        database = bind_key(primary_bind(db))
+        with self._lock:
+            for row in rows:
+                key = (database, row["id"])
+                inflight = self._inflight.get(key)
+                if inflight:
+                    row.update(inflight)
+                pending = self._pending.get(key)
+                if pending:
+                    row.update(pending)
+        return rows
+
+    def discard(self, db: Session, block_id: int) -> None:
+        """삭제된 블록의 대기 중인 값 제거"""
+        with self._lock:
+            self._pending.pop((bind_key(primary_bind(db)), block_id), None)
+
+    def flush_if_pending(self, db: Session, block_id: int) -> None:
+        """
+        버퍼를 거치지 않는 쓰기 전에 호출하는 쓰기 장벽
+
+        해당 블록에 대기 중이거나 반영 중인 값이 있으면 반영이 끝날 때까지 기다립니다.
+        """
+        key = (bind_key(primary_bind(db)), block_id)
+        with self._lock:
+            waiting = key in self._pending or key in self._inflight
+        if waiting:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        대기 중인 모든 수정 사항을 엔진(샤드)마다 한 트랜잭션으로 반영
+
+        Returns:
+            반영한 블록 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                self._inflight, self._pending = self._pending, {}
+                batch = self._inflight
+                binds = dict(self._binds)
+
+            # 엔진별, 같은 필드 조합별로 묶어서 executemany
+            groups: Dict[str, Dict[tuple, List[Dict[str, Any]]]] = {}
+            for (database, block_id), values in batch.items():
+                params = {f"new_{key}": value for key, value in values.items()}
+                params["b_id"] = block_id
+                groups.setdefault(database, {}).setdefault(tuple(sorted(values)), []).append(params)
+
+            failed: List[BufferKey] = []
+            for database, field_groups in groups.items():
+                content_ids = [
+                    block_id for (key_database, block_id), values in batch.items()
+                    if key_database == database and "content" in values
+                ]
+                try:
+                    self._commit(binds[database], self._apply_operation(field_groups, content_ids))
+                except Exception:
+                    failed.extend(key for key in batch if key[0] == database)
+                    logger.exception("Failed to flush buffered block updates")
+
+            with self._lock:
+                # 실패한 값은 더 새로운 대기 값을 덮어쓰지 않도록 되돌림
+                for key in failed:
+                    self._pending[key] = {**batch[key], **self._pending.get(key, {})}
+                self._inflight = {}
+                # 대기 값이 없는 데이터베이스의 엔진은 잡아 두지 않음
+                waiting = {database for database, _ in self._pending}
+                self._binds = {
+                    database: bind for database, bind in self._binds.items() if database in waiting
+                }
+            if failed:
+                raise RuntimeError(f"Failed to flush {len(failed)} buffered block updates")
+
+            self.flushed_rows += len(batch)
+            self.flush_count += 1
+            return len(batch)
+
+    @staticmethod
+    def _apply_operation(
+        field_groups: Dict[tuple, List[Dict[str, Any]]], content_ids: List[int]
+    ) -> Callable[[Session], None]:
+        """엔진 하나의 대기 값을 반영하는 쓰기 작업 (커밋은 호출자, 다시 실행해도 안전)"""
+
+        def apply(db: Session) -> None:
+            # 반영 전 내용 크기 (content_bytes 증감 계산용)
+            old_sizes = {
+                block_id: size
+                for block_id, size in db.execute(
+                    select(Block.id, block_content_bytes).where(Block.id.in_(content_ids))
+                )
+            } if content_ids else {}
+
+            for fields, params in field_groups.items():
+                stmt = (
+                    Block.__table__.update()
+                    .where(Block.__table__.c.id == bindparam("b_id"))
+                    .values({field: bindparam(f"new_{field}") for field in fields})
+                )
+                db.execute(stmt, params)
+
+            if content_ids:
+                rows = db.execute(
+                    select(Block.id, Block.page_id, Block.content)
+                    .where(Block.id.in_(content_ids))
+                ).all()
+                sync_block_links(db, rows)
+
+                deltas = {}
+                for block_id, page_id, content in rows:
+                    delta = content_size(content) - old_sizes.get(block_id, 0)
+                    if delta:
+                        _, _, total = deltas.get(page_id, (0, 0, 0))
+                        deltas[page_id] = (0, 0, total + delta)
+                adjust_many(db, deltas)
+
+        return apply
+
+    @staticmethod
+    def _commit(bind: Engine, operation: Callable[[Session], None]) -> None:
+        """쓰기 작업을 단일 writer(켜져 있으면) 또는 새 세션에서 실행하고 커밋"""
+        if write_queue.enabled:
+            write_queue.submit(bind, operation).result()
+            return
+        db = Session(bind=bind)
+        try:
+            operation(db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        """백그라운드 반영 루프"""
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                # 다음 주기에 다시 시도
+                pass
+
+    def start(self) -> None:
+        """
+        백그라운드 반영 스레드 시작 (버퍼가 꺼져 있으면 무시)
+
+        Raises:
+            RuntimeError: 워커가 여러 개인 경우 (다른 워커가 버퍼의 값을 보지 못함)
+        """
+        if not self.enabled or self._thread is not None:
+            return
+        if settings.web_concurrency > 1:
+            raise RuntimeError(
+                "BLOCK_WRITE_BEHIND_ENABLED requires a single worker "
+                f"(WEB_CONCURRENCY={settings.web_concurrency})"
+            )
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="block-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """백그라운드 스레드를 멈추고 남은 수정 사항을 모두 반영"""
+        if self._thread is not None:
+            self._stopped.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """버퍼 통계"""
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "enabled": self.enabled,
+            "pending": pending,
+            "buffered_updates": self.buffered_updates,
+            "flushed_rows": self.flushed_rows,
+            "flush_count": self.flush_count,
+        }
+
+
+# 전역 버퍼 인스턴스
+block_write_buffer = BlockWriteBuffer(
+    enabled=settings.block_write_behind_enabled,
+    flush_interval_ms=settings.block_write_behind_interval_ms,
+    max_pending=settings.block_write_behind_max_pending,
+)
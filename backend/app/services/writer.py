@@ -0,0 +1,269 @@
+"""
+SQLite 단일 writer 큐 모듈
+
+스레드 풀의 여러 요청이 동시에 `commit()`하면 SQLite 쓰기 잠금을 두고 경쟁하다가
+재시도 대기로 지연이 튀거나 "database is locked" 에러가 납니다.
+단일 writer를 켜면 라우터의 쓰기 작업은 엔진(샤드)마다 하나뿐인 writer 스레드로 보내지고,
+writer는 큐에 쌓인 작업을 한 트랜잭션으로 묶어 커밋(group commit)한 뒤
+각 호출자에게 결과를 돌려줍니다. 읽기는 지금처럼 각자의 연결에서 동시에 실행됩니다.
+
+- 쓰기 작업은 `operation(db) -> 결과` 함수이며, 결과는 커밋 후에도 쓸 수 있는
+  값(dict 등)이어야 합니다. 커밋은 writer가 합니다.
+- 작업 하나가 예외를 내면 그 작업에만 예외를 돌려주고, 나머지 작업은
+  새 트랜잭션에서 다시 실행합니다. 따라서 작업은 다시 실행해도 안전해야 합니다.
+- 작업 안에서 다른 세션으로 커밋하면(예: `block_write_buffer.flush()`) 자기 자신을
+  기다리게 되므로, 그런 쓰기 장벽은 작업을 보내기 전에 호출해야 합니다.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import bind_key, primary_bind
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 쓰기 작업: writer 세션을 받아 결과를 반환 (커밋은 writer가 함)
+WriteOperation = Callable[[Session], Any]
+
+
+class WriteRequest:
+    """writer 큐에 들어가는 쓰기 작업 하나"""
+
+    __slots__ = ("operation", "future")
+
+    def __init__(self, operation: WriteOperation):
+        self.operation = operation
+        self.future: Future = Future()
+
+
+class EngineWriter:
+    """
+    엔진 하나의 쓰기를 전담하는 writer 스레드
+
+    Args:
+        bind: 쓰기 대상 엔진
+        max_batch: 한 트랜잭션에 묶을 최대 작업 수
+        batch_window: 첫 작업 이후 더 기다릴 시간 (초)
+    """
+
+    def __init__(self, bind: Engine, max_batch: int, batch_window: float):
+        self.bind = bind
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.queue: "queue.Queue[Optional[WriteRequest]]" = queue.Queue()
+        self.thread: Optional[threading.Thread] = None
+
+        # 통계
+        self.batches = 0
+        self.operations = 0
+        self.failed = 0
+
+    def next_batch(self, first: WriteRequest) -> List[WriteRequest]:
+        """첫 작업과 함께 큐에 쌓인 작업을 max_batch개까지 모음"""
+        batch = [first]
+        while len(batch) < self.max_batch:
+            try:
+                if self.batch_window:
+                    request = self.queue.get(timeout=self.batch_window)
+                else:
+                    request = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                # 종료 신호는 이번 배치를 처리한 뒤 다시 받도록 되돌림
+                self.queue.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def commit_batch(self, batch: List[WriteRequest]) -> None:
+        """
+        작업들을 한 트랜잭션으로 실행하고 커밋
+
+        실패한 작업은 빼고 나머지를 새 트랜잭션에서 다시 실행합니다.
+        """
+        remaining = [
+            request for request in batch if request.future.set_running_or_notify_cancel()
+        ]
+        while remaining:
+            db = Session(bind=self.bind, autoflush=False)
+            results = []
+            failed: Optional[tuple] = None
+            try:
+                for request in remaining:
+                    try:
+                        results.append(request.operation(db))
+                    except Exception as exc:
+                        failed = (request, exc)
+                        break
+                if failed is None:
+                    db.commit()
+            except Exception as exc:
+                # 커밋 실패: 배치 전체 실패
+                db.rollback()
+                logger.exception("Failed to commit write batch")
+                for request in remaining:
+                    request.future.set_exception(exc)
+                self.failed += len(remaining)
+                return
+            finally:
+                db.close()
+
+            if failed is None:
+                for request, result in zip(remaining, results):
+                    request.future.set_result(result)
+                self.batches += 1
+                self.operations += len(remaining)
+                return
+
+            request, exc = failed
+            request.future.set_exception(exc)
+            self.failed += 1
+            remaining.remove(request)
+
+
+class SingleWriterQueue:
+    """
+    엔진별 writer 스레드 관리자
+
+    writer 스레드는 처음 쓰기가 들어올 때 만들어지고,
+    일정 시간 쓰기가 없으면 종료되어 사라집니다 (샤드 엔진이 많아도 스레드가 쌓이지 않음).
+
+    Args:
+        enabled: 단일 writer 사용 여부
+        max_batch: 한 트랜잭션에 묶을 최대 작업 수
+        batch_window_ms: 첫 작업 이후 더 기다릴 시간 (ms, 0이면 이미 쌓인 작업만 묶음)
+        idle_seconds: 이 시간 동안 쓰기가 없으면 writer 스레드 종료
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_batch: int = 64,
+        batch_window_ms: int = 0,
+        idle_seconds: float = 30.0,
+    ):
+        self.enabled = enabled
+        self.max_batch = max_batch
+        self.batch_window = batch_window_ms / 1000
+        self.idle_seconds = idle_seconds
+        self._writers: Dict[str, EngineWriter] = {}  # bind_key -> writer (파일마다 하나)
+        self._lock = threading.Lock()
+
+        # 종료된 writer들의 누적 통계
+        self._retired = {"batches": 0, "operations": 0, "failed": 0}
+
+    def submit(self, bind: Engine, operation: WriteOperation) -> Future:
+        """
+        쓰기 작업을 엔진의 writer 큐에 추가
+
+        Args:
+            bind: 쓰기 대상 엔진
+            operation: 쓰기 작업
+
+        Returns:
+            커밋 후 작업 결과(또는 예외)가 설정되는 Future
+        """
+        request = WriteRequest(operation)
+        with self._lock:
+            writer = self._writers.get(bind_key(bind))
+            if writer is None:
+                writer = EngineWriter(bind, self.max_batch, self.batch_window)
+                writer.thread = threading.Thread(
+                    target=self._run, args=(writer,), name="sqlite-writer", daemon=True
+                )
+                self._writers[bind_key(bind)] = writer
+                writer.thread.start()
+            # 잠금 안에서 넣어야 종료 중인 writer에 작업이 남지 않음
+            writer.queue.put(request)
+        return request.future
+
+    def _run(self, writer: EngineWriter) -> None:
+        """writer 스레드 루프"""
+        while True:
+            try:
+                request = writer.queue.get(timeout=self.idle_seconds)
+            except queue.Empty:
+                with self._lock:
+                    if writer.queue.empty():
+                        self._writers.pop(bind_key(writer.bind), None)
+                        self._retire(writer)
+                        return
+                continue
+            if request is None:
+                return
+            writer.commit_batch(writer.next_batch(request))
+
+    def _retire(self, writer: EngineWriter) -> None:
+        """종료된 writer의 통계를 누적 (self._lock 안에서 호출)"""
+        self._retired["batches"] += writer.batches
+        self._retired["operations"] += writer.operations
+        self._retired["failed"] += writer.failed
+
+    def stop(self) -> None:
+        """모든 writer 스레드를 큐에 남은 작업을 처리한 뒤 종료"""
+        with self._lock:
+            writers = list(self._writers.values())
+            self._writers.clear()
+            for writer in writers:
+                writer.queue.put(None)
+        for writer in writers:
+            writer.thread.join()
+        with self._lock:
+            for writer in writers:
+                self._retire(writer)
+
+    def stats(self) -> Dict[str, Any]:
+        """writer 큐 통계"""
+        with self._lock:
+            writers = list(self._writers.values())
+            totals = dict(self._retired)
+        for writer in writers:
+            totals["batches"] += writer.batches
+            totals["operations"] += writer.operations
+            totals["failed"] += writer.failed
+        return {
+            "enabled": self.enabled,
+            "writers": len(writers),
+            "queued": sum(writer.queue.qsize() for writer in writers),
+            **totals,
+        }
+
+
+# 전역 writer 큐 인스턴스
+write_queue = SingleWriterQueue(
+    enabled=settings.single_writer_enabled,
+    max_batch=settings.single_writer_max_batch,
+    batch_window_ms=settings.single_writer_batch_window_ms,
+)
+
+
+def run_write(db: Session, operation: Callable[[Session], T]) -> T:
+    """
+    쓰기 작업을 실행하고 커밋
+
+    단일 writer가 켜져 있으면 세션 엔진의 writer 스레드에서 다른 요청의 쓰기와
+    함께 커밋하고, 꺼져 있으면 요청 세션에서 바로 실행하고 커밋합니다.
+
+    Args:
+        db: 요청 세션 (writer를 쓰면 어느 엔진에 쓸지만 결정)
+        operation: 쓰기 작업 (세션을 받아 결과를 반환)
+
+    Returns:
+        operation의 결과
+    """
+    if not write_queue.enabled:
+        result = operation(db)
+        db.commit()
+        return result
+    return write_queue.submit(primary_bind(db), operation).result()
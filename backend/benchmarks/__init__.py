@@ -0,0 +1,6 @@
+"""
+성능 측정 스크립트 모음
+
+사용법 (backend 폴더에서 실행):
+    python -m benchmarks.<스크립트 이름>
+"""
@@ -0,0 +1,119 @@
+"""
+온라인 백업 중 writer 대기 시간 벤치마크
+
+임시 SQLite 파일을 만들고, 다른 프로세스(서버 워커 역할)가 계속 작은 쓰기 트랜잭션을
+커밋하는 동안 `BackupManager.create()`로 스냅샷을 만듭니다. 백업 전과 백업 중의
+커밋 지연 시간을 비교해서 writer가 실제로 얼마나 막히는지를 journal 모드별로 측정하고,
+백업이 보고한 `writer_block_max_ms`(잠금 대기 상한)와 나란히 출력합니다.
+측정한 커밋 지연에는 잠금 대기 외에 CPU/디스크 경합도 포함됩니다.
+
+사용법 (backend 폴더에서 실행):
+    python -m benchmarks.bench_backup [데이터베이스 크기 MB] [writer 쓰기 간격 ms]
+
+예제:
+    python -m benchmarks.bench_backup 64 2
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+from app.services.backup import BackupManager, BackupRestarted
+
+ROW_BYTES = 1000
+
+
+def create_database(path: str, size_mb: int, journal_mode: str) -> None:
+    connection = sqlite3.connect(path)
+    connection.execute(f"PRAGMA journal_mode={journal_mode}")
+    connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, payload BLOB)")
+    rows = size_mb * 1_000_000 // ROW_BYTES
+    connection.executemany(
+        "INSERT INTO items (payload) VALUES (?)",
+        (((b"x" * ROW_BYTES),) for _ in range(rows)),
+    )
+    connection.commit()
+    connection.close()
+
+
+def write_loop(path: str, interval: float, stop_event, connection) -> None:
+    """interval마다 한 행을 쓰고 커밋하며 (끝난 시각, 커밋 소요 시간 ms)를 기록해서 돌려줌"""
+    database = sqlite3.connect(path, timeout=60)
+    latencies = []
+    while not stop_event.is_set():
+        started = time.time()
+        database.execute("INSERT INTO items (payload) VALUES (?)", (b"y" * ROW_BYTES,))
+        database.commit()
+        finished = time.time()
+        latencies.append((finished, (finished - started) * 1000))
+        time.sleep(interval)
+    database.close()
+    connection.send(latencies)
+
+
+def window(latencies: list[tuple[float, float]], start: float, end: float) -> list[float]:
+    return [latency for finished, latency in latencies if start <= finished <= end]
+
+
+def summarize(latencies: list[float]) -> str:
+    if not latencies:
+        return "쓰기 없음"
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (
+        f"{len(ordered)}회, 중간값 {statistics.median(ordered):.2f} ms, "
+        f"p99 {p99:.2f} ms, 최대 {ordered[-1]:.2f} ms"
+    )
+
+
+def bench(journal_mode: str, size_mb: int, interval_ms: float) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "bench.db")
+        create_database(path, size_mb, journal_mode)
+        manager = BackupManager(backup_dir=os.path.join(workdir, "backups"), keep=0)
+
+        stop_event = multiprocessing.Event()
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        writer = multiprocessing.Process(
+            target=write_loop, args=(path, interval_ms / 1000, stop_event, sender)
+        )
+        writer.start()
+        time.sleep(1.0)
+        backup_started = time.time()
+        error = None
+        try:
+            result = manager.create(path, compress=False)
+        except BackupRestarted as restarted:
+            result, error = None, restarted
+        backup_finished = time.time()
+        stop_event.set()
+        latencies = receiver.recv()
+        writer.join()
+
+        print(f"[{journal_mode}] {size_mb} MB, writer 간격 {interval_ms} ms")
+        print(f"  백업 전 커밋: {summarize(window(latencies, backup_started - 1.0, backup_started))}")
+        print(f"  백업 중 커밋: {summarize(window(latencies, backup_started, backup_finished))}")
+        if error is not None:
+            print(f"  백업 실패 ({backup_finished - backup_started:.2f}초): {error}")
+            return
+        stats = result["stats"]
+        print(
+            f"  백업 {stats['copy_seconds']}초, 단계 {stats['steps']}회, 재시작 {stats['restarts']}회, "
+            f"한 번에 복사 {stats['single_step']} ({stats['single_step_ms']} ms), "
+            f"보고된 writer 최대 대기 {stats['writer_block_max_ms']} ms"
+        )
+
+
+def main() -> None:
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    interval_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    for journal_mode in ("delete", "wal"):
+        bench(journal_mode, size_mb, interval_ms)
+
+
+if __name__ == "__main__":
+    main()
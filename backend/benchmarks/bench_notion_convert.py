@@ -0,0 +1,198 @@
+"""
+Notion 블록 변환 / 가져오기 벤치마크
+
+1. 변환: 기존 if/elif 변환과 타입별 변환 함수 등록 방식(`iter_converted_blocks`)의
+   처리량을 큰 합성 Notion 블록 목록으로 비교합니다.
+2. 가져오기: 페이지네이션 응답마다 네트워크 지연이 있는 가짜 Notion 클라이언트로
+   "모두 받은 뒤 변환하고 ORM으로 한 개씩 저장"하는 기존 흐름과
+   "미리 받기 + 스트리밍 변환 + 묶음 INSERT" 흐름의 전체 시간을 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_notion_convert [블록 수] [페이지당 지연 ms]
+
+예제:
+    python -m benchmarks.bench_notion_convert 100000 20
+"""
+
+import sys
+import time
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models import Block, Page
+from app.services.mcp_notion import NotionService
+from app.services.notion_blocks import (
+    NOTION_TO_OUR_BLOCK_TYPE,
+    ConversionStats,
+    batched,
+    iter_converted_blocks,
+)
+
+BLOCK_TYPES = [
+    "paragraph", "paragraph", "paragraph", "heading_2", "bulleted_list_item",
+    "to_do", "code", "quote", "divider", "image", "numbered_list_item", "table",
+]
+
+
+def synthetic_block(index: int) -> dict:
+    """실제 API 응답과 비슷한 모양의 Notion 블록"""
+    block_type = BLOCK_TYPES[index % len(BLOCK_TYPES)]
+    data = {
+        "rich_text": [
+            {"type": "text", "plain_text": f"블록 {index} ", "annotations": {"bold": False}},
+            {"type": "text", "plain_text": "내용 " * 8, "annotations": {"bold": True}},
+        ],
+        "color": "default",
+    }
+    if block_type == "to_do":
+        data["checked"] = index % 2 == 0
+    if block_type == "code":
+        data["language"] = "python"
+    return {"object": "block", "id": f"block-{index}", "type": block_type, block_type: data}
+
+
+def legacy_convert(notion_blocks: list) -> list:
+    """비교용: 기존 if/elif 변환 (호출마다 텍스트 타입 목록 생성, 건너뛴 타입 기록 없음)"""
+    our_blocks = []
+    for idx, notion_block in enumerate(notion_blocks):
+        block_type = notion_block.get("type")
+        if block_type not in NOTION_TO_OUR_BLOCK_TYPE:
+            continue
+        block_data = notion_block.get(block_type, {})
+        content = ""
+        if block_type in [
+            "paragraph", "heading_1", "heading_2", "heading_3",
+            "bulleted_list_item", "numbered_list_item", "quote",
+        ]:
+            content = "".join([rt.get("plain_text", "") for rt in block_data.get("rich_text", [])])
+        elif block_type == "to_do":
+            text = "".join([rt.get("plain_text", "") for rt in block_data.get("rich_text", [])])
+            content = f"[{'x' if block_data.get('checked', False) else ' '}] {text}"
+        elif block_type == "code":
+            content = "".join([rt.get("plain_text", "") for rt in block_data.get("rich_text", [])])
+            language = block_data.get("language", "")
+            if language:
+                content = f"```{language}\n{content}\n```"
+        elif block_type == "divider":
+            content = "---"
+        our_blocks.append({
+            "type": NOTION_TO_OUR_BLOCK_TYPE.get(block_type, "text"),
+            "content": content,
+            "order": float(idx),
+        })
+    return our_blocks
+
+
+class FakeChildren:
+    """blocks.children.list 페이지네이션 응답 (요청마다 지연)"""
+
+    def __init__(self, blocks: list, latency: float):
+        self.blocks = blocks
+        self.latency = latency
+
+    def list(self, block_id, start_cursor=None, page_size=100):
+        time.sleep(self.latency)
+        start = int(start_cursor or 0)
+        end = min(start + page_size, len(self.blocks))
+        return {
+            "results": self.blocks[start:end],
+            "has_more": end < len(self.blocks),
+            "next_cursor": str(end),
+        }
+
+
+def fake_service(blocks: list, latency: float) -> NotionService:
+    service = NotionService.__new__(NotionService)
+    service.client = type("FakeClient", (), {})()
+    service.client.blocks = type("FakeBlocks", (), {})()
+    service.client.blocks.children = FakeChildren(blocks, latency)
+    return service
+
+
+def new_page(db: Session) -> int:
+    page = Page(title="Imported")
+    db.add(page)
+    db.flush()
+    return page.id
+
+
+def import_sequential(db: Session, service: NotionService) -> int:
+    """기존 흐름: 전부 받기 -> 전부 변환 -> ORM 객체로 한 개씩 저장"""
+    page_id = new_page(db)
+    notion_blocks = [block for results in sequential_pages(service) for block in results]
+    for block_data in legacy_convert(notion_blocks):
+        db.add(Block(page_id=page_id, **block_data))
+    db.flush()
+    db.commit()
+    return db.query(Block).filter(Block.page_id == page_id).count()
+
+
+def sequential_pages(service: NotionService):
+    """미리 받기 없이 한 페이지씩 요청"""
+    start_cursor = None
+    while True:
+        response = service.client.blocks.children.list(block_id="x", start_cursor=start_cursor)
+        yield response["results"]
+        if not response["has_more"]:
+            return
+        start_cursor = response["next_cursor"]
+
+
+def import_streaming(db: Session, service: NotionService, stats: ConversionStats) -> int:
+    """새 흐름: 미리 받기 + 스트리밍 변환 + 묶음 INSERT"""
+    page_id = new_page(db)
+    count = 0
+    for batch in batched(service.iter_import_blocks("x", stats), 500):
+        rows = [{"page_id": page_id, **block_data} for block_data in batch]
+        db.execute(insert(Block).returning(Block.id), rows).all()
+        count += len(rows)
+    db.commit()
+    return count
+
+
+def main():
+    block_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+
+    notion_blocks = [synthetic_block(i) for i in range(block_count)]
+    print(f"합성 Notion 블록 {block_count}개")
+
+    start = time.perf_counter()
+    legacy = legacy_convert(notion_blocks)
+    legacy_seconds = time.perf_counter() - start
+
+    stats = ConversionStats()
+    start = time.perf_counter()
+    converted = list(iter_converted_blocks(notion_blocks, stats))
+    registry_seconds = time.perf_counter() - start
+    assert converted == legacy
+
+    print(f"if/elif 변환          : {legacy_seconds * 1000:8.1f} ms ({block_count / legacy_seconds:,.0f} 블록/s)")
+    print(f"등록 변환 함수        : {registry_seconds * 1000:8.1f} ms ({block_count / registry_seconds:,.0f} 블록/s)")
+    print(f"건너뛴 타입           : {dict(stats.skipped)}")
+
+    # 가져오기 전체 흐름 (블록 수를 줄여서 지연의 영향을 보이도록)
+    import_blocks = notion_blocks[: min(block_count, 20000)]
+    latency = latency_ms / 1000
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        start = time.perf_counter()
+        import_sequential(db, fake_service(import_blocks, latency))
+        sequential_seconds = time.perf_counter() - start
+    with Session(engine) as db:
+        start = time.perf_counter()
+        import_streaming(db, fake_service(import_blocks, latency), ConversionStats())
+        streaming_seconds = time.perf_counter() - start
+
+    pages = -(-len(import_blocks) // 100)
+    print(f"\n가져오기 {len(import_blocks)}개 블록 ({pages}페이지, 페이지당 {latency_ms:.0f} ms 지연)")
+    print(f"받기 -> 변환 -> ORM 저장 : {sequential_seconds * 1000:8.1f} ms")
+    print(f"스트리밍 + 묶음 INSERT   : {streaming_seconds * 1000:8.1f} ms")
+    print(f"속도 향상               : {sequential_seconds / streaming_seconds:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+페이지 응답 형식 벤치마크
+
+JSON(orjson) / MessagePack 인코딩과 gzip / brotli 압축 조합별로
+전송 바이트 수와 인코딩+압축 CPU 시간을 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_response_formats [블록 수] [반복 횟수]
+
+예제:
+    python -m benchmarks.bench_response_formats 5000 20
+"""
+
+import sys
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.middleware.compression import GzipCompressor, BrotliCompressor, brotli
+from app.services.serialization import (
+    MsgPackResponse,
+    dumps,
+    fetch_block_rows,
+    fetch_page_row,
+    msgpack,
+)
+from benchmarks.bench_serialization import seed
+
+
+def encoders():
+    """(이름, 인코딩 함수) 목록"""
+    result = [("json", dumps)]
+    if msgpack is not None:
+        result.append(("msgpack", MsgPackResponse(None).render))
+    return result
+
+
+def compressors():
+    """(이름, 압축 함수) 목록"""
+    result = [("none", None), ("gzip-6", lambda: GzipCompressor(6))]
+    if brotli is not None:
+        result.append(("br-4", lambda: BrotliCompressor(4)))
+        result.append(("br-9", lambda: BrotliCompressor(9)))
+    return result
+
+
+def encode(payload, encoder, compressor_factory) -> bytes:
+    """인코딩 후 (선택적으로) 압축"""
+    body = encoder(payload)
+    if compressor_factory is None:
+        return body
+    compressor = compressor_factory()
+    return compressor.compress(body) + compressor.finish()
+
+
+def main():
+    block_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    page_id = seed(db, block_count)
+
+    payload = fetch_page_row(db, page_id)
+    payload["blocks"] = fetch_block_rows(db, page_id)
+
+    print(f"블록 수: {block_count}, 반복: {repeat}")
+    print(f"{'형식':<10}{'압축':<10}{'바이트':>12}{'비율':>8}{'CPU(ms)':>10}")
+    baseline = len(dumps(payload))
+    for encoder_name, encoder in encoders():
+        for compressor_name, compressor_factory in compressors():
+            body = encode(payload, encoder, compressor_factory)
+            start = time.perf_counter()
+            for _ in range(repeat):
+                encode(payload, encoder, compressor_factory)
+            elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+            print(
+                f"{encoder_name:<10}{compressor_name:<10}{len(body):>12}"
+                f"{len(body) / baseline:>8.2f}{elapsed_ms:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+페이지 조회 직렬화 벤치마크
+
+ORM + Pydantic(response_model) + stdlib json 경로와
+Core 튜플 + orjson 고속 경로를 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_serialization [블록 수] [반복 횟수]
+
+예제:
+    python -m benchmarks.bench_serialization 5000 20
+"""
+
+import json
+import sys
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Page, Block
+from app.schemas import PageWithBlocksResponse
+from app.services.serialization import dumps, fetch_page_row, fetch_block_rows
+
+
+def seed(db, block_count: int) -> int:
+    """블록이 많은 페이지 하나를 생성"""
+    page = Page(title="Benchmark", icon="📄")
+    db.add(page)
+    db.flush()
+    db.bulk_insert_mappings(
+        Block,
+        [
+            {
+                "page_id": page.id,
+                "type": "text",
+                "content": f"블록 내용 {i} " * 4,
+                "order": float(i),
+            }
+            for i in range(block_count)
+        ],
+    )
+    db.commit()
+    return page.id
+
+
+def orm_path(db, page_id: int) -> bytes:
+    """기존 경로: ORM 객체 -> Pydantic 검증 -> stdlib json"""
+    db.expire_all()
+    page = db.query(Page).filter(Page.id == page_id).first()
+    payload = PageWithBlocksResponse.model_validate(page).model_dump(mode="json")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(db, page_id: int) -> bytes:
+    """고속 경로: Core 튜플 -> dict -> orjson"""
+    page = fetch_page_row(db, page_id)
+    page["blocks"] = fetch_block_rows(db, page_id)
+    return dumps(page)
+
+
+def measure(fn, db, page_id: int, repeat: int) -> float:
+    """평균 실행 시간(ms) 측정"""
+    fn(db, page_id)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(db, page_id)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    block_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    page_id = seed(db, block_count)
+
+    # 두 경로의 응답 내용이 같은지 확인
+    assert json.loads(orm_path(db, page_id)) == json.loads(fast_path(db, page_id))
+
+    orm_ms = measure(orm_path, db, page_id, repeat)
+    fast_ms = measure(fast_path, db, page_id, repeat)
+
+    print(f"블록 수: {block_count}, 반복: {repeat}")
+    print(f"ORM + Pydantic + json : {orm_ms:8.2f} ms")
+    print(f"Core + orjson         : {fast_ms:8.2f} ms")
+    print(f"속도 향상             : {orm_ms / fast_ms:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+워커 시작 시간 벤치마크
+
+새 프로세스에서 `app.main` import 시간과 startup 이벤트(마이그레이션 확인,
+페이지 트리 로드)까지 걸린 시간을 측정하고, 여러 워커가 빈 데이터베이스에서
+동시에 시작해도 마이그레이션이 한 번만 적용되는지 확인합니다.
+
+사용법 (backend 폴더에서 실행):
+    python -m benchmarks.bench_startup [반복 횟수] [동시 워커 수]
+
+예제:
+    python -m benchmarks.bench_startup 10 8
+"""
+
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 작업 디렉터리(./app.db)를 바꿔서 실행하는 워커 시작 스크립트
+STARTUP_SCRIPT = """
+import sys, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app.main.app):
+    ready = time.perf_counter()
+print(imported - started, ready - started, "notion_client" in sys.modules)
+"""
+
+MIGRATE_SCRIPT = """
+from app.database import engine
+from app.migrations import run_migrations
+print(len(run_migrations(engine)))
+"""
+
+
+def spawn(script: str, workdir: str) -> subprocess.Popen:
+    env = dict(os.environ, PYTHONPATH=BACKEND_DIR, PYTHONDONTWRITEBYTECODE="1")
+    return subprocess.Popen(
+        [sys.executable, "-c", script], cwd=workdir, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+    )
+
+
+def communicate(process: subprocess.Popen) -> str:
+    stdout, stderr = process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(stderr)
+    return stdout.strip()
+
+
+def bench_cold_start(repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        # 첫 실행은 빈 데이터베이스에 마이그레이션 적용
+        first_import, first_ready, _ = communicate(spawn(STARTUP_SCRIPT, workdir)).split()
+        print(f"빈 DB 첫 시작: import {float(first_import) * 1000:7.1f} ms, "
+              f"ready {float(first_ready) * 1000:7.1f} ms")
+
+        import_times, ready_times, notion_loaded = [], [], False
+        for _ in range(repeat):
+            imported, ready, loaded = communicate(spawn(STARTUP_SCRIPT, workdir)).split()
+            import_times.append(float(imported))
+            ready_times.append(float(ready))
+            notion_loaded = notion_loaded or loaded == "True"
+
+    print(f"이후 시작 ({repeat}회 중앙값): import {statistics.median(import_times) * 1000:7.1f} ms, "
+          f"ready {statistics.median(ready_times) * 1000:7.1f} ms")
+    print(f"시작 시 notion_client 로드: {'예' if notion_loaded else '아니오'}")
+
+
+def bench_concurrent_workers(workers: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        started = time.perf_counter()
+        processes = [spawn(MIGRATE_SCRIPT, workdir) for _ in range(workers)]
+        applied = [int(communicate(process)) for process in processes]
+        elapsed = time.perf_counter() - started
+
+        with sqlite3.connect(os.path.join(workdir, "app.db")) as connection:
+            versions = [row[0] for row in connection.execute("SELECT version FROM schema_version")]
+
+    runners = sum(1 for count in applied if count)
+    print(f"동시 워커 {workers}개: {elapsed * 1000:7.1f} ms, "
+          f"마이그레이션 실행 워커 {runners}개, 기록된 버전 {versions}")
+    if runners != 1 or len(versions) != len(set(versions)):
+        raise SystemExit("❌ 마이그레이션이 한 번만 적용되지 않았습니다.")
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    bench_cold_start(repeat)
+    bench_concurrent_workers(workers)
+
+
+if __name__ == "__main__":
+    main()
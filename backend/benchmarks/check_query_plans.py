@@ -0,0 +1,226 @@
+"""
+라우터 쿼리 실행 계획 점검
+
+`app/routers/`의 모든 엔드포인트를 시드 데이터베이스에 호출하면서 실행된 SQL을 모으고,
+각 SQL의 `EXPLAIN QUERY PLAN`에 전체 테이블 스캔(SCAN)이나 임시 정렬
+(USE TEMP B-TREE)이 있으면 실패합니다. 인덱스를 바꾸거나 쿼리를 고친 뒤 실행해서
+계획이 나빠지지 않았는지 확인합니다.
+
+- 요청 목록(REQUESTS)에 없는 라우터 엔드포인트가 있으면 실패하므로,
+  새 엔드포인트를 추가할 때 이 목록에도 추가해야 합니다.
+- 스캔이 의도된 쿼리(전체 목록, 시작 시 전체 로드 등)는 ALLOWED_PLANS에 이유와 함께 둡니다.
+
+사용법 (backend 폴더에서 실행):
+    python -m benchmarks.check_query_plans [-v]
+"""
+
+import os
+import re
+import sys
+import tempfile
+from collections import OrderedDict
+
+# 관리 API 요청 옵션 (점검 중에만 쓰는 토큰)
+ADMIN = {"headers": {"X-Admin-Token": "check"}}
+
+# 외부 API가 필요한 엔드포인트: (메서드, 경로) -> 이유
+SKIPPED_ROUTES = {
+    ("POST", "/api/mcp/import"): "Notion API 호출이 필요함",
+}
+
+# 전체 스캔/정렬이 의도된 쿼리: (엔드포인트 경로, SQL 정규식) -> 이유
+ALLOWED_PLANS = {
+    ("GET /api/pages/", r"^SELECT .* FROM pages$"): "필터 없는 전체 페이지 목록",
+    ("GET /api/examples/", r"^SELECT .* FROM examples"): "전체 예제 목록",
+    ("*", r"^SELECT pages\.id, pages\.parent_id, pages\.title, pages\.icon FROM pages$"):
+        "페이지 트리 메모리 인덱스 전체 로드 (시작/검증 시)",
+    ("GET /api/todos/", r"FROM blocks JOIN pages .* WHERE blocks\.type = 'todo' ORDER BY blocks\.id LIMIT"):
+        "부분 인덱스(type = 'todo')를 id 순으로 읽다가 LIMIT에서 멈춤",
+    ("POST /api/pages/move", r"FROM pages WHERE pages\.id IN \(.*\) GROUP BY pages\.parent_id"):
+        "요청한 페이지(최대 1000개)만 부모별로 묶는 작은 정렬",
+}
+
+# 각 엔드포인트 호출: (메서드, 경로 템플릿, 실제 경로, 요청 인자)
+REQUESTS = [
+    ("GET", "/api/examples/", "/api/examples/", {}),
+    ("POST", "/api/examples/", "/api/examples/", {"json": {"name": "example"}}),
+    ("GET", "/api/examples/{example_id}", "/api/examples/1", {}),
+    ("DELETE", "/api/examples/{example_id}", "/api/examples/1", {}),
+    ("GET", "/api/pages/", "/api/pages/", {}),
+    ("GET", "/api/pages/", "/api/pages/", {"params": {"parent_id": 1}}),
+    ("GET", "/api/pages/tree", "/api/pages/tree", {"params": {"root_id": 1, "depth": 2}}),
+    ("GET", "/api/pages/batch", "/api/pages/batch", {"params": {"ids": "2,3,4,999"}}),
+    ("GET", "/api/pages/batch", "/api/pages/batch", {"params": {"ids": "5,2,9", "include_blocks": True}}),
+    ("GET", "/api/pages/{page_id}", "/api/pages/2", {}),
+    ("GET", "/api/pages/{page_id}", "/api/pages/2", {"params": {"block_limit": 20}}),
+    ("GET", "/api/pages/{page_id}/backlinks", "/api/pages/3", {}),
+    ("GET", "/api/pages/{page_id}/breadcrumbs", "/api/pages/40", {}),
+    ("GET", "/api/pages/{page_id}/blocks", "/api/pages/2/blocks", {}),
+    ("GET", "/api/pages/{page_id}/blocks", "/api/pages/2/blocks",
+     {"params": {"after_order": 10.0, "after_id": 50, "limit": 20}}),
+    ("GET", "/api/pages/{page_id}/blocks", "/api/pages/2/blocks",
+     {"params": {"after_order": 10.0, "limit": 20}}),
+    ("GET", "/api/pages/{page_id}/blocks", "/api/pages/2/blocks",
+     {"params": {"before_order": 10.0, "limit": 20}}),
+    ("GET", "/api/todos/", "/api/todos/", {"params": {"limit": 20}}),
+    ("GET", "/api/todos/", "/api/todos/", {"params": {"checked": True, "after_id": 10, "limit": 20}}),
+    ("GET", "/api/changes/", "/api/changes/", {"params": {"limit": 50}}),
+    ("GET", "/api/changes/", "/api/changes/", {"params": {"since": 100, "limit": 50}}),
+    ("POST", "/api/pages/", "/api/pages/", {"json": {"title": "new", "parent_id": 5}}),
+    ("PATCH", "/api/pages/{page_id}", "/api/pages/6", {"json": {"title": "renamed", "parent_id": 7}}),
+    ("POST", "/api/pages/{page_id}/duplicate", "/api/pages/8/duplicate", {"json": {}}),
+    ("POST", "/api/pages/move", "/api/pages/move", {"json": {"page_ids": [9, 10], "parent_id": 11}}),
+    ("POST", "/api/blocks", "/api/blocks",
+     {"json": {"page_id": 2, "type": "text", "content": "see /pages/4", "order": 1000.0}}),
+    ("PATCH", "/api/blocks/{block_id}", "/api/blocks/3", {"json": {"content": "see /pages/5"}}),
+    ("POST", "/api/blocks/reorder", "/api/blocks/reorder", {"json": {"block_id": 4, "new_order": 0.5}}),
+    ("DELETE", "/api/blocks/{block_id}", "/api/blocks/5", {}),
+    ("DELETE", "/api/pages/{page_id}", "/api/pages/12", {}),
+    ("GET", "/api/admin/metrics", "/api/admin/metrics", ADMIN),
+    ("GET", "/api/admin/page-tree/verify", "/api/admin/page-tree/verify", ADMIN),
+    ("POST", "/api/admin/backups", "/api/admin/backups", ADMIN),
+    ("GET", "/api/admin/backups", "/api/admin/backups", ADMIN),
+]
+
+PAGE_COUNT = 300
+BLOCKS_PER_PAGE = 40
+
+EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH|UPDATE|DELETE|INSERT)\b", re.IGNORECASE)
+
+
+def seed(db) -> None:
+    """페이지 트리, 블록(할 일/링크 포함) 생성"""
+    from app.models import Block, Page
+    from app.services.backlinks import rebuild_links
+    from app.services.page_counts import reconcile_page_counts
+
+    db.bulk_insert_mappings(
+        Page,
+        [
+            {"id": page_id, "title": f"Page {page_id}", "parent_id": page_id // 3 or None}
+            for page_id in range(1, PAGE_COUNT + 1)
+        ],
+    )
+    blocks = []
+    for page_id in range(1, PAGE_COUNT + 1):
+        for i in range(BLOCKS_PER_PAGE):
+            if i % 5 == 0:
+                blocks.append({"page_id": page_id, "type": "todo", "content": f"[{'x' if i % 10 else ' '}] task {i}", "order": float(i)})
+            elif i % 7 == 0:
+                blocks.append({"page_id": page_id, "type": "text", "content": f"see /pages/{(page_id % PAGE_COUNT) + 1}", "order": float(i)})
+            else:
+                blocks.append({"page_id": page_id, "type": "text", "content": f"block {i}", "order": float(i)})
+    db.bulk_insert_mappings(Block, blocks)
+    db.commit()
+    rebuild_links(db)
+    reconcile_page_counts(db)
+
+
+def is_allowed(route: str, statement: str) -> bool:
+    normalized = " ".join(statement.split())
+    for (allowed_route, pattern), _ in ALLOWED_PLANS.items():
+        if allowed_route in ("*", route) and re.search(pattern, normalized):
+            return True
+    return False
+
+
+def problems(plan, tables: set) -> list:
+    """
+    실행 계획에서 테이블 전체 스캔/임시 정렬 단계
+
+    재귀 CTE 작업 집합(`SCAN subtree`) 같은 테이블이 아닌 대상의 스캔은 제외합니다.
+    """
+    found = []
+    for row in plan:
+        detail = row[-1]
+        words = detail.split()
+        if (words[0] == "SCAN" and words[1] in tables) or "USE TEMP B-TREE" in detail:
+            found.append(detail)
+    return found
+
+
+def main() -> int:
+    verbose = "-v" in sys.argv[1:]
+    workdir = tempfile.mkdtemp()
+    os.chdir(workdir)  # ./app.db를 임시 폴더에 생성
+
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+
+    from app.config import settings
+    from app.database import SessionLocal, engine
+    from app.main import app
+    from app.migrations import run_migrations
+
+    settings.admin_api_token = ADMIN["headers"]["X-Admin-Token"]  # 관리 API는 토큰이 있어야 켜짐
+
+    run_migrations(engine)
+    with SessionLocal() as db:
+        seed(db)
+
+    # 라우터 엔드포인트 목록과 요청 목록 비교
+    routes = {
+        (method, route.path)
+        for route in app.routes
+        if getattr(route, "endpoint", None) is not None
+        and route.endpoint.__module__.startswith("app.routers.")
+        for method in route.methods
+    }
+    covered = {(method, template) for method, template, _, _ in REQUESTS}
+    missing = sorted(routes - covered - set(SKIPPED_ROUTES))
+
+    captured: "OrderedDict[tuple, tuple]" = OrderedDict()
+    current = {"route": None}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        if current["route"] is None or not EXPLAINABLE.match(statement):
+            return
+        if executemany:
+            parameters = parameters[0] if parameters else ()
+        captured.setdefault((current["route"], statement), tuple(parameters or ()))
+
+    failed_requests = []
+    with TestClient(app) as client:
+        for method, template, path, kwargs in REQUESTS:
+            current["route"] = f"{method} {template}"
+            response = client.request(method, path, **kwargs)
+            if response.status_code >= 400:
+                failed_requests.append(f"{current['route']} -> {response.status_code}: {response.text[:200]}")
+        current["route"] = None
+
+    violations = []
+    with engine.connect() as connection:
+        tables = set(connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        ).scalars())
+        for (route, statement), parameters in captured.items():
+            plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            found = problems(plan, tables)
+            if verbose:
+                print(f"\n[{route}] {' '.join(statement.split())[:160]}")
+                for row in plan:
+                    print(f"    {row[-1]}")
+            if found and not is_allowed(route, statement):
+                violations.append((route, statement, found))
+
+    print(f"엔드포인트 {len(covered)}개 호출, SQL {len(captured)}개 점검")
+    for (method, path), reason in SKIPPED_ROUTES.items():
+        print(f"⏭️  {method} {path}: 건너뜀 ({reason})")
+    for route in failed_requests:
+        print(f"❌ 요청 실패: {route}")
+    for method, path in missing:
+        print(f"❌ 점검 목록에 없는 엔드포인트: {method} {path}")
+    for route, statement, found in violations:
+        print(f"\n❌ [{route}]\n    {' '.join(statement.split())}")
+        for detail in found:
+            print(f"    -> {detail}")
+
+    if failed_requests or missing or violations:
+        return 1
+    print("✅ 모든 쿼리가 인덱스를 사용합니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""
+관리용 CLI 스크립트
+
+사용법 (backend 폴더에서 실행):
+    python manage.py migrate [--status]
+    python manage.py shards list
+    python manage.py shards create <tenant_id> [<tenant_id> ...]
+    python manage.py shards migrate [<tenant_id> ...]
+    python manage.py backlinks rebuild [--tenant <tenant_id>]
+    python manage.py counts reconcile [--tenant <tenant_id>]
+    python manage.py changes compact [--tenant <tenant_id>] [--days <days>]
+    python manage.py backup create [--tenant <tenant_id>] [--no-compress]
+    python manage.py backup list [--tenant <tenant_id>]
+    python manage.py backup restore <snapshot_id> [--tenant <tenant_id>]
+"""
+
+import argparse
+import os
+import sys
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal, engine, tenant_engines
+from app.migrations import LATEST_VERSION, current_version, run_migrations
+from app.services.backlinks import rebuild_links
+from app.services.backup import BackupRestarted, backup_manager, database_name
+from app.services.change_log import compact_change_log
+from app.services.page_counts import reconcile_page_counts
+
+
+def migrate_shard(tenant_id: int) -> None:
+    """테넌트 샤드 스키마를 최신 마이그레이션까지 생성/갱신"""
+    run_migrations(tenant_engines.get_engine(tenant_id))
+
+
+def schema_migrate(args) -> int:
+    if args.status:
+        version = current_version(engine)
+        print(f"스키마 버전: {version} (최신: {LATEST_VERSION})")
+        return 0 if version >= LATEST_VERSION else 1
+    applied = run_migrations(engine)
+    if applied:
+        print(f"✅ 마이그레이션 적용: {', '.join(f'v{version:04d}' for version in applied)}")
+    else:
+        print(f"✅ 이미 최신입니다 (v{LATEST_VERSION:04d})")
+    return 0
+
+
+def shards_list(args) -> int:
+    tenant_ids = tenant_engines.list_tenants()
+    if not tenant_ids:
+        print(f"샤드가 없습니다. ({tenant_engines.shard_dir})")
+        return 0
+    for tenant_id in tenant_ids:
+        size = os.path.getsize(tenant_engines.shard_path(tenant_id))
+        print(f"tenant {tenant_id}: {tenant_engines.shard_path(tenant_id)} ({size} bytes)")
+    return 0
+
+
+def shards_create(args) -> int:
+    os.makedirs(tenant_engines.shard_dir, exist_ok=True)
+    for tenant_id in args.tenant_ids:
+        if tenant_engines.shard_exists(tenant_id):
+            print(f"⚠️  tenant {tenant_id}: 이미 존재합니다.")
+            continue
+        migrate_shard(tenant_id)
+        print(f"✅ tenant {tenant_id}: 생성됨 ({tenant_engines.shard_path(tenant_id)})")
+    return 0
+
+
+def shards_migrate(args) -> int:
+    tenant_ids = args.tenant_ids or tenant_engines.list_tenants()
+    failed = 0
+    for tenant_id in tenant_ids:
+        if not tenant_engines.shard_exists(tenant_id):
+            print(f"❌ tenant {tenant_id}: 샤드가 없습니다.")
+            failed += 1
+            continue
+        migrate_shard(tenant_id)
+        print(f"✅ tenant {tenant_id}: 마이그레이션 완료")
+    return 1 if failed else 0
+
+
+def open_session(tenant_id: int | None) -> Session:
+    """기본 데이터베이스 또는 테넌트 샤드 세션 생성"""
+    if tenant_id is None:
+        return SessionLocal()
+    return Session(bind=tenant_engines.get_engine(tenant_id))
+
+
+def backlinks_rebuild(args) -> int:
+    db = open_session(args.tenant)
+    try:
+        link_count = rebuild_links(db)
+    finally:
+        db.close()
+    print(f"✅ 백링크 인덱스 재구성 완료: {link_count}개 링크")
+    return 0
+
+
+def counts_reconcile(args) -> int:
+    db = open_session(args.tenant)
+    try:
+        repaired = reconcile_page_counts(db)
+    finally:
+        db.close()
+    print(f"✅ 페이지 집계 값 점검 완료: {repaired}개 페이지 수정")
+    return 0
+
+
+def changes_compact(args) -> int:
+    db = open_session(args.tenant)
+    try:
+        removed = compact_change_log(db, args.days)
+    finally:
+        db.close()
+    print(f"✅ 변경 로그 압축 완료: {removed}개 기록 삭제 ({args.days}일 이전)")
+    return 0
+
+
+def database_path(tenant_id: int | None) -> str:
+    """기본 데이터베이스 또는 테넌트 샤드 파일 경로"""
+    if tenant_id is None:
+        return engine.url.database
+    return tenant_engines.shard_path(tenant_id)
+
+
+def backup_create(args) -> int:
+    try:
+        result = backup_manager.create(database_path(args.tenant), compress=args.compress)
+    except BackupRestarted as error:
+        print(f"❌ {error}")
+        return 1
+    stats = result["stats"]
+    print(f"✅ 스냅샷 생성: {result['database']}/{result['id']} ({result['size_bytes']} bytes)")
+    print(
+        f"   복사 {stats['copy_seconds']}초 ({stats['copy_mb_per_s']} MB/s), "
+        f"단계 {stats['steps']}회, 재시작 {stats['restarts']}회, "
+        f"writer 최대 대기 {stats['writer_block_max_ms']} ms ({stats['journal_mode']})"
+    )
+    print(
+        f"   청크 {stats['chunk_count']}개 중 새 청크 {stats['new_chunks']}개 "
+        f"({stats['stored_bytes']} bytes 저장)"
+    )
+    return 0
+
+
+def backup_list(args) -> int:
+    name = database_name(database_path(args.tenant))
+    snapshots = backup_manager.list_snapshots(name)
+    if not snapshots:
+        print(f"스냅샷이 없습니다. ({backup_manager.database_dir(name)})")
+        return 0
+    for snapshot in snapshots:
+        stats = snapshot["stats"]
+        print(
+            f"{snapshot['id']}: {snapshot['size_bytes']} bytes, "
+            f"새 청크 {stats['new_chunks']}/{stats['chunk_count']}, "
+            f"{stats['copy_mb_per_s']} MB/s"
+        )
+    return 0
+
+
+def backup_restore(args) -> int:
+    target_path = database_path(args.tenant)
+    try:
+        result = backup_manager.restore(database_name(target_path), args.snapshot_id, target_path)
+    except ValueError as error:
+        print(f"❌ {error}")
+        return 1
+    print(f"✅ {result['id']} 복원 완료: {target_path} ({result['seconds']}초)")
+    print("   서버를 재시작해야 메모리 인덱스가 복원된 데이터를 다시 읽습니다.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Module 5 관리 명령")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser("migrate", help="기본 데이터베이스 스키마 마이그레이션")
+    migrate_parser.add_argument("--status", action="store_true", help="적용된 버전만 확인")
+    migrate_parser.set_defaults(func=schema_migrate)
+
+    shards = commands.add_parser("shards", help="테넌트 샤드 관리")
+    shard_commands = shards.add_subparsers(dest="shard_command", required=True)
+
+    shard_commands.add_parser("list", help="샤드 목록").set_defaults(func=shards_list)
+
+    create = shard_commands.add_parser("create", help="샤드 생성")
+    create.add_argument("tenant_ids", nargs="+", type=int)
+    create.set_defaults(func=shards_create)
+
+    migrate = shard_commands.add_parser("migrate", help="샤드 스키마 갱신 (기본: 전체)")
+    migrate.add_argument("tenant_ids", nargs="*", type=int)
+    migrate.set_defaults(func=shards_migrate)
+
+    backlinks = commands.add_parser("backlinks", help="백링크 인덱스 관리")
+    backlink_commands = backlinks.add_subparsers(dest="backlink_command", required=True)
+    rebuild = backlink_commands.add_parser("rebuild", help="모든 블록에서 인덱스 재구성")
+    rebuild.add_argument("--tenant", type=int, default=None, help="테넌트 샤드 ID")
+    rebuild.set_defaults(func=backlinks_rebuild)
+
+    counts = commands.add_parser("counts", help="페이지 집계 값 관리")
+    count_commands = counts.add_subparsers(dest="count_command", required=True)
+    reconcile = count_commands.add_parser("reconcile", help="어긋난 집계 값 수정")
+    reconcile.add_argument("--tenant", type=int, default=None, help="테넌트 샤드 ID")
+    reconcile.set_defaults(func=counts_reconcile)
+
+    changes = commands.add_parser("changes", help="변경 로그 관리")
+    change_commands = changes.add_subparsers(dest="change_command", required=True)
+    compact = change_commands.add_parser("compact", help="보존 기간이 지난 기록 삭제")
+    compact.add_argument("--tenant", type=int, default=None, help="테넌트 샤드 ID")
+    compact.add_argument(
+        "--days", type=float, default=settings.change_log_retention_days, help="보존 기간 (일)"
+    )
+    compact.set_defaults(func=changes_compact)
+
+    backup = commands.add_parser("backup", help="온라인 백업 / 복원")
+    backup_commands = backup.add_subparsers(dest="backup_command", required=True)
+    backup_create_parser = backup_commands.add_parser("create", help="스냅샷 생성 (서버 실행 중 가능)")
+    backup_create_parser.add_argument("--tenant", type=int, default=None, help="테넌트 샤드 ID")
+    backup_create_parser.add_argument(
+        "--no-compress", dest="compress", action="store_false", default=None, help="청크 압축 안 함"
+    )
+    backup_create_parser.set_defaults(func=backup_create)
+    backup_list_parser = backup_commands.add_parser("list", help="스냅샷 목록")
+    backup_list_parser.add_argument("--tenant", type=int, default=None, help="테넌트 샤드 ID")
+    backup_list_parser.set_defaults(func=backup_list)
+    backup_restore_parser = backup_commands.add_parser("restore", help="스냅샷 복원 (서버 중지 후 실행)")
+    backup_restore_parser.add_argument("snapshot_id")
+    backup_restore_parser.add_argument("--tenant", type=int, default=None, help="테넌트 샤드 ID")
+    backup_restore_parser.set_defaults(func=backup_restore)
+
+    return parser
+
+
+if __name__ == "__main__":
+    parsed = build_parser().parse_args()
+    sys.exit(parsed.func(parsed))
@@ -0,0 +1,27 @@
+"""
+테스트 공통 fixture
+
+앱은 현재 폴더의 ./app.db를 사용하므로 임시 폴더로 이동한 뒤 앱을 시작합니다.
+(시작할 때 마이그레이션이 실행되어 빈 데이터베이스가 만들어짐)
+"""
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import engine
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client(tmp_path_factory):
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("db"))
+    engine.dispose()
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        engine.dispose()
+        os.chdir(cwd)
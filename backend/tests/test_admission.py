@@ -0,0 +1,90 @@
+import asyncio
+
+from app.config import settings
+from app.middleware.admission import (
+    AdmissionControlMiddleware,
+    AdmissionController,
+    ConcurrencyLimiter,
+    client_key,
+)
+
+
+def make_controller(rate_per_second=1.0, burst=5):
+    return AdmissionController(
+        enabled=True,
+        concurrency={"read": 4, "write": 4, "heavy": 1},
+        queue_sizes={"read": 4, "write": 4, "heavy": 1},
+        queue_timeout=1.0,
+        retry_after_seconds=1.0,
+        rate_per_second=rate_per_second,
+        burst=burst,
+    )
+
+
+def http_scope(headers=()):
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/pages/",
+        "headers": [(key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in headers],
+        "client": ("10.0.0.1", 5000),
+    }
+
+
+async def send_requests(middleware, scopes):
+    statuses = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    for scope in scopes:
+        await middleware(scope, None, send)
+    return statuses
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def test_rotating_tenant_header_does_not_bypass_rate_limit():
+    middleware = AdmissionControlMiddleware(ok_app, make_controller(burst=5))
+    scopes = [http_scope([(settings.tenant_header, str(i))]) for i in range(20)]
+
+    statuses = asyncio.run(send_requests(middleware, scopes))
+
+    assert statuses.count(200) == 5
+    assert statuses.count(429) == 15
+
+
+def test_client_key_ignores_tenant_header_without_sharding():
+    assert client_key(http_scope([(settings.tenant_header, "42")])) == "10.0.0.1"
+    assert client_key(http_scope()) == "10.0.0.1"
+
+
+def test_cancelled_waiter_does_not_leak_slot():
+    async def scenario():
+        limiter = ConcurrencyLimiter(limit=1, max_waiting=4, wait_timeout=5.0)
+        assert await limiter.acquire()
+
+        # 대기 중에 취소된 요청
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        assert limiter.waiting == 0
+
+        # 취소가 전달되기 전에 슬롯을 넘겨받은 요청
+        handed_over = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        handed_over.cancel()
+        limiter.release()
+        results = await asyncio.gather(handed_over, return_exceptions=True)
+        assert isinstance(results[0], asyncio.CancelledError)
+
+        assert limiter.waiting == 0
+        assert limiter.active == 0
+        assert await limiter.acquire()
+
+    asyncio.run(scenario())
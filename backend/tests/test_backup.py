@@ -0,0 +1,68 @@
+import sqlite3
+
+import pytest
+
+from app.config import settings
+from app.services.backup import BackupManager, BackupRestarted
+
+
+ADMIN_ROUTES = [
+    ("GET", "/api/admin/metrics"),
+    ("GET", "/api/admin/page-tree/verify"),
+    ("GET", "/api/admin/backups"),
+    ("POST", "/api/admin/backups"),
+]
+
+
+@pytest.mark.parametrize("method, path", ADMIN_ROUTES)
+def test_admin_api_disabled_without_token(client, method, path):
+    assert client.request(method, path).status_code == 404
+
+
+@pytest.mark.parametrize("method, path", ADMIN_ROUTES)
+def test_admin_api_requires_admin_token(client, monkeypatch, method, path):
+    monkeypatch.setattr(settings, "admin_api_token", "secret")
+    assert client.request(method, path).status_code == 401
+    assert client.request(method, path, headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+
+def test_admin_api_accepts_admin_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "admin_api_token", "secret")
+    headers = {"X-Admin-Token": "secret"}
+    assert client.get("/api/admin/metrics", headers=headers).status_code == 200
+    assert client.get("/api/admin/page-tree/verify", headers=headers).status_code == 200
+    assert client.get("/api/admin/backups", headers=headers).status_code == 200
+
+
+def create_database(path, journal_mode):
+    connection = sqlite3.connect(path)
+    connection.execute(f"PRAGMA journal_mode={journal_mode}")
+    connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, payload BLOB)")
+    connection.executemany("INSERT INTO items (payload) VALUES (?)", [(b"x" * 1000,)] * 2000)
+    connection.commit()
+    return connection
+
+
+@pytest.mark.parametrize("journal_mode", ["delete", "wal"])
+def test_backup_under_constant_writes(tmp_path, monkeypatch, journal_mode):
+    path = str(tmp_path / "app.db")
+    connection = create_database(path, journal_mode)
+    manager = BackupManager(backup_dir=str(tmp_path / "backups"), pages_per_step=16, max_restarts=2)
+
+    # 단계 사이마다 다른 연결로 쓰기를 해서 복사가 계속 다시 시작되도록 함
+    def write_between_steps(seconds):
+        connection.execute("INSERT INTO items (payload) VALUES (?)", (b"y",))
+        connection.commit()
+
+    monkeypatch.setattr("app.services.backup.time.sleep", write_between_steps)
+
+    if journal_mode == "delete":
+        # 한 번에 복사하면 writer가 복사 내내 막히므로 실패해야 함
+        with pytest.raises(BackupRestarted):
+            manager.create(path)
+        assert manager.failure_count == 1
+    else:
+        stats = manager.create(path)["stats"]
+        assert stats["single_step"] is True
+        assert stats["writer_block_max_ms"] == 0.0
+    connection.close()
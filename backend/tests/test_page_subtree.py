@@ -0,0 +1,86 @@
+from sqlalchemy import func, select
+
+from app.database import SessionLocal
+from app.models import Block, Page
+
+
+def create_page(client, title, parent_id=None):
+    response = client.post("/api/pages/", json={"title": title, "parent_id": parent_id})
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def table_stats(model):
+    with SessionLocal() as db:
+        return db.execute(select(func.count(model.id), func.max(model.id))).one()
+
+
+def test_duplicate_copies_subtree(client):
+    root = create_page(client, "root")
+    child = create_page(client, "child", root)
+    grandchild = create_page(client, "grandchild", child)
+    for page_id in (root, child, grandchild):
+        client.post("/api/blocks", json={"page_id": page_id, "type": "text", "content": f"block {page_id}"})
+
+    response = client.post(f"/api/pages/{root}/duplicate")
+    assert response.status_code == 201
+    new_root = response.json()["id"]
+
+    new_children = client.get(f"/api/pages/?parent_id={new_root}").json()
+    assert [page["title"] for page in new_children] == ["child"]
+    new_grandchildren = client.get(f"/api/pages/?parent_id={new_children[0]['id']}").json()
+    assert [page["title"] for page in new_grandchildren] == ["grandchild"]
+
+    blocks = client.get(f"/api/pages/{new_grandchildren[0]['id']}/blocks").json()
+    assert [block["content"] for block in blocks] == [f"block {grandchild}"]
+
+
+def test_repeated_duplicate_ids_grow_with_row_count(client):
+    root = create_page(client, "repeat")
+    other = create_page(client, "other")
+    child = create_page(client, "repeat child", root)
+    # 서브트리의 블록 ID가 다른 페이지의 블록 ID와 섞여 있도록 번갈아 생성
+    for i in range(3):
+        for page_id in (root, other, child):
+            client.post("/api/blocks", json={"page_id": page_id, "type": "text", "content": str(i), "order": i})
+
+    pages_before, max_page_before = table_stats(Page)
+    blocks_before, max_block_before = table_stats(Block)
+    for _ in range(20):
+        assert client.post(f"/api/pages/{root}/duplicate").status_code == 201
+
+    # 복제마다 페이지 2개, 블록 6개만 늘어나므로 ID도 그만큼만 늘어나야 함
+    page_count, max_page_id = table_stats(Page)
+    block_count, max_block_id = table_stats(Block)
+    assert page_count == pages_before + 20 * 2
+    assert block_count == blocks_before + 20 * 6
+    assert max_page_id == max_page_before + 20 * 2
+    assert max_block_id == max_block_before + 20 * 6
+
+
+def test_duplicate_into_own_subtree_copies_once(client):
+    a = create_page(client, "A")
+    b = create_page(client, "B", a)
+    d = create_page(client, "D", b)
+    for page_id in (a, b, d):
+        client.post("/api/blocks", json={"page_id": page_id, "type": "text", "content": f"block {page_id}"})
+    pages_before, _ = table_stats(Page)
+    blocks_before, _ = table_stats(Block)
+
+    response = client.post(f"/api/pages/{a}/duplicate", json={"parent_id": d})
+    assert response.status_code == 201
+    new_root = response.json()
+
+    # 원본 A > B > D만 한 번 복사됨 (복사본 루트는 다시 복사되지 않음)
+    assert table_stats(Page)[0] == pages_before + 3
+    assert table_stats(Block)[0] == blocks_before + 3
+    assert new_root["parent_id"] == d
+
+    new_b = client.get(f"/api/pages/?parent_id={new_root['id']}").json()
+    assert [(page["title"], page["child_count"]) for page in new_b] == [("B", 1)]
+    new_d = client.get(f"/api/pages/?parent_id={new_b[0]['id']}").json()
+    assert [(page["title"], page["child_count"], page["block_count"]) for page in new_d] == [("D", 0, 1)]
+    assert client.get(f"/api/pages/?parent_id={new_d[0]['id']}").json() == []
+
+    original_d = client.get(f"/api/pages/{d}").json()
+    assert original_d["child_count"] == 1
@@ -0,0 +1,16 @@
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_router_queries_use_indexes():
+    # 점검 스크립트는 작업 폴더와 앱 설정을 바꾸므로 별도 프로세스에서 실행
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.check_query_plans"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
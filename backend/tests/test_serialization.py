@@ -0,0 +1,56 @@
+import pytest
+
+from app.services.serialization import accepts_msgpack, is_msgpack
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, False),
+        ("*/*", False),
+        ("application/json", False),
+        ("application/msgpack", True),
+        ("application/x-msgpack", True),
+        ("application/msgpack;q=0", False),
+        ("application/msgpack; q=0.0, application/json", False),
+        ("application/x-msgpack-foo", False),
+        ("application/json;q=0.5, application/msgpack", True),
+        ("application/json, application/msgpack;q=0.5", False),
+        ("application/msgpack, application/json", True),
+        ("application/msgpack;q=0.5, application/json;q=0, */*", True),
+        ("application/msgpack;q=bad", False),
+    ],
+)
+def test_accepts_msgpack(accept, expected):
+    assert accepts_msgpack(accept) is expected
+
+
+@pytest.mark.parametrize(
+    "content_type, expected",
+    [
+        ("application/msgpack", True),
+        ("Application/MsgPack; charset=binary", True),
+        ("application/x-msgpack-foo", False),
+        ("application/json", False),
+    ],
+)
+def test_is_msgpack(content_type, expected):
+    assert is_msgpack(content_type) is expected
+
+
+def test_msgpack_response_negotiation(client):
+    assert client.get("/api/pages/", headers={"Accept": "application/msgpack"}).headers[
+        "content-type"
+    ].startswith("application/msgpack")
+    assert client.get("/api/pages/", headers={"Accept": "application/msgpack;q=0"}).headers[
+        "content-type"
+    ].startswith("application/json")
+
+
+@pytest.mark.parametrize("accept", ["application/json", "application/msgpack"])
+def test_negotiated_responses_vary_on_accept(client, accept):
+    page_id = client.post("/api/pages/", json={"title": "vary"}).json()["id"]
+    for path in ["/api/pages/", f"/api/pages/batch?ids={page_id}"]:
+        response = client.get(path, headers={"Accept": accept})
+        assert response.status_code == 200
+        assert "accept" in [value.strip().lower() for value in response.headers["vary"].split(",")]
@@ -0,0 +1,55 @@
+from app.services.write_behind import block_write_buffer
+
+
+def test_checked_filter_fills_window_despite_buffered_edits(client, monkeypatch):
+    page_id = client.post("/api/pages/", json={"title": "todos"}).json()["id"]
+    block_ids = [
+        client.post(
+            "/api/blocks", json={"page_id": page_id, "type": "todo", "content": f"[ ] task {i}", "order": i}
+        ).json()["id"]
+        for i in range(6)
+    ]
+    start = {"after_id": block_ids[0] - 1}
+
+    # 앞의 세 개를 체크했지만 아직 버퍼에만 있음 (DB에는 체크 안 된 상태)
+    monkeypatch.setattr(block_write_buffer, "enabled", True)
+    for block_id in block_ids[:3]:
+        response = client.patch(f"/api/blocks/{block_id}", json={"content": "[x] done"})
+        assert response.status_code == 200
+
+    try:
+        response = client.get("/api/todos/", params={**start, "checked": False, "limit": 2}).json()
+        assert [item["id"] for item in response["items"]] == block_ids[3:5]
+        assert response["next_after_id"] == block_ids[4]
+
+        response = client.get(
+            "/api/todos/", params={"after_id": response["next_after_id"], "checked": False, "limit": 2}
+        ).json()
+        assert [item["id"] for item in response["items"]] == block_ids[5:]
+        assert response["next_after_id"] is None
+    finally:
+        block_write_buffer.flush()
+
+
+def test_checked_filter_includes_todos_changed_only_in_buffer(client, monkeypatch):
+    page_id = client.post("/api/pages/", json={"title": "todos"}).json()["id"]
+    done_id, open_id = [
+        client.post(
+            "/api/blocks", json={"page_id": page_id, "type": "todo", "content": content, "order": i}
+        ).json()["id"]
+        for i, content in enumerate(["[x] done", "[ ] open"])
+    ]
+    start = {"after_id": done_id - 1}
+
+    # 체크 상태를 뒤집은 값이 아직 버퍼에만 있음
+    monkeypatch.setattr(block_write_buffer, "enabled", True)
+    client.patch(f"/api/blocks/{done_id}", json={"content": "[ ] reopened"})
+    client.patch(f"/api/blocks/{open_id}", json={"content": "[x] closed"})
+
+    try:
+        unchecked = client.get("/api/todos/", params={**start, "checked": False}).json()["items"]
+        assert [item["id"] for item in unchecked] == [done_id]
+        checked = client.get("/api/todos/", params={**start, "checked": True}).json()["items"]
+        assert [item["id"] for item in checked] == [open_id]
+    finally:
+        block_write_buffer.flush()
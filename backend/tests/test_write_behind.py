@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal, TenantEngineRegistry
+from app.migrations import run_migrations
+from app.models import Block, Page
+from app.services.write_behind import BlockWriteBuffer
+from app.services.writer import write_queue
+
+
+def create_block(client):
+    page_id = client.post("/api/pages/", json={"title": "write-behind"}).json()["id"]
+    response = client.post("/api/blocks", json={"page_id": page_id, "type": "text", "content": "before"})
+    return page_id, response.json()["id"]
+
+
+def test_flush_goes_through_single_writer(client, monkeypatch):
+    page_id, block_id = create_block(client)
+    monkeypatch.setattr(write_queue, "enabled", True)
+    operations_before = write_queue.stats()["operations"]
+
+    buffer = BlockWriteBuffer(enabled=True)
+    with SessionLocal() as db:
+        buffer.put(db, block_id, {"content": "after"})
+    assert buffer.flush() == 1
+
+    assert write_queue.stats()["operations"] == operations_before + 1
+    blocks = client.get(f"/api/pages/{page_id}/blocks").json()
+    assert [block["content"] for block in blocks] == ["after"]
+
+
+def test_refuses_to_start_with_several_workers(monkeypatch):
+    monkeypatch.setattr(settings, "web_concurrency", 4)
+    buffer = BlockWriteBuffer(enabled=True)
+    with pytest.raises(RuntimeError):
+        buffer.start()
+
+
+def test_pending_updates_survive_tenant_engine_eviction(tmp_path):
+    registry = TenantEngineRegistry(str(tmp_path), max_engines=1)
+    run_migrations(registry.get_engine(1))
+    with Session(bind=registry.get_engine(1)) as db:
+        page = Page(title="tenant", user_id=1)
+        db.add(page)
+        db.flush()
+        block = Block(page_id=page.id, type="text", content="before", order=1)
+        db.add(block)
+        db.commit()
+        block_id = block.id
+
+    buffer = BlockWriteBuffer(enabled=True)
+    evicted = registry.get_engine(1)
+    with Session(bind=evicted) as db:
+        buffer.put(db, block_id, {"content": "after"})
+    registry.get_engine(2)  # 테넌트 1 엔진이 LRU에서 밀려남
+    reopened = registry.get_engine(1)
+    assert reopened is not evicted
+
+    with Session(bind=reopened) as db:
+        assert buffer.get(db, block_id)["content"] == "after"
+        buffer.flush_if_pending(db, block_id)
+        assert buffer.stats()["pending"] == 0
+        assert db.get(Block, block_id).content == "after"
+    registry.dispose_all()
@@ -2,27 +2,54 @@
 
 import { useEffect, useState } from 'react';
 import { useParams, useRouter } from 'next/navigation';
-import { PageWithBlocks, getPage, deletePage, createBlock } from '@/lib/api';
+import { PageWindow, getPageWindow, getPageBlocks, deletePage, createBlock } from '@/lib/api';
 import PageHeader from '@/components/editor/PageHeader';
 import BlockList from '@/components/editor/BlockList';
 
+// Number of blocks fetched per window
+const BLOCK_WINDOW_SIZE = 200;
+// Largest window the API returns in one request
+const MAX_BLOCK_WINDOW = 1000;
+
 export default function PageDetailPage() {
   const params = useParams();
   const router = useRouter();
   const pageId = parseInt(params.id as string);
 
-  const [page, setPage] = useState<PageWithBlocks | null>(null);
+  const [page, setPage] = useState<PageWindow | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [deleting, setDeleting] = useState(false);
 
   useEffect(() => {
-    loadPage();
+    loadPage(BLOCK_WINDOW_SIZE);
   }, [pageId]);
 
-  async function loadPage() {
+  async function loadPage(blockLimit?: number) {
     try {
-      const data = await getPage(pageId);
-      setPage(data);
+      // Reload at least as many blocks as are already on screen
+      const target = blockLimit ?? Math.max(page?.blocks.length ?? 0, BLOCK_WINDOW_SIZE);
+      const data = await getPageWindow(pageId, Math.min(target, MAX_BLOCK_WINDOW));
+
+      // A single request is capped, so follow the (order, id) cursor for the rest
+      const blocks = [...data.blocks];
+      let lastWindow = !data.has_more;
+      while (!lastWindow && blocks.length < target) {
+        const last = blocks[blocks.length - 1];
+        const limit = Math.min(target - blocks.length, MAX_BLOCK_WINDOW);
+        const next = await getPageBlocks(pageId, {
+          after_order: last.order,
+          after_id: last.id,
+          limit,
+        });
+        blocks.push(...next);
+        lastWindow = next.length < limit;
+      }
+      setPage({
+        ...data,
+        blocks,
+        has_more: !lastWindow && blocks.length < data.total_blocks,
+      });
     } catch (error) {
       console.error('Failed to load page:', error);
     } finally {
@@ -30,6 +57,29 @@ export default function PageDetailPage() {
     }
   }
 
+  async function loadMoreBlocks() {
+    if (!page || !page.has_more || loadingMore) return;
+    const last = page.blocks[page.blocks.length - 1];
+
+    setLoadingMore(true);
+    try {
+      const next = await getPageBlocks(pageId, {
+        after_order: last?.order,
+        after_id: last?.id,
+        limit: BLOCK_WINDOW_SIZE,
+      });
+      setPage((prev) => {
+        if (!prev) return prev;
+        const blocks = [...prev.blocks, ...next];
+        return { ...prev, blocks, has_more: blocks.length < prev.total_blocks };
+      });
+    } catch (error) {
+      console.error('Failed to load more blocks:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  }
+
   async function handleDelete() {
     if (!confirm('Are you sure you want to delete this page?')) return;
 
@@ -45,9 +95,7 @@ export default function PageDetailPage() {
 
   async function handleAddBlock() {
     try {
-      const maxOrder = page?.blocks.length
-        ? Math.max(...page.blocks.map((b) => b.order))
-        : -1;
+      const maxOrder = page?.max_order ?? -1;
       await createBlock({
         page_id: pageId,
         type: 'text',
@@ -104,7 +152,7 @@ export default function PageDetailPage() {
         title={page.title}
         icon={page.icon}
         createdAt={page.created_at}
-        onUpdate={loadPage}
+        onUpdate={() => loadPage()}
       />
 
       {/* Blocks */}
@@ -135,7 +183,13 @@ export default function PageDetailPage() {
         </div>
       ) : (
         <>
-          <BlockList blocks={page.blocks} pageId={page.id} onBlocksChange={loadPage} />
+          <BlockList
+            blocks={page.blocks}
+            pageId={page.id}
+            onBlocksChange={() => loadPage()}
+            hasMore={page.has_more}
+            onLoadMore={loadMoreBlocks}
+          />
 
           {/* Add Block Button at Bottom */}
           <div className="max-w-4xl mx-auto px-8 py-4">
@@ -32,6 +32,8 @@ interface BlockListProps {
   blocks: Block[];
   pageId: number;
   onBlocksChange: () => void;
+  hasMore?: boolean;
+  onLoadMore?: () => void;
 }
 
 interface SortableBlockProps {
@@ -169,7 +171,13 @@ function SortableBlock({
   );
 }
 
-export default function BlockList({ blocks, pageId, onBlocksChange }: BlockListProps) {
+export default function BlockList({
+  blocks,
+  pageId,
+  onBlocksChange,
+  hasMore = false,
+  onLoadMore,
+}: BlockListProps) {
   const [localBlocks, setLocalBlocks] = useState<Block[]>(blocks);
   const [editingBlockId, setEditingBlockId] = useState<number | null>(null);
   const [showTypeMenu, setShowTypeMenu] = useState<{
@@ -177,11 +185,27 @@ export default function BlockList({ blocks, pageId, onBlocksChange }: BlockListP
     position: { top: number; left: number };
   } | null>(null);
   const saveTimeoutRef = useRef<NodeJS.Timeout>();
+  const loadMoreRef = useRef<HTMLDivElement>(null);
 
   useEffect(() => {
-    setLocalBlocks(blocks.sort((a, b) => a.order - b.order));
+    setLocalBlocks(blocks.sort((a, b) => a.order - b.order || a.id - b.id));
   }, [blocks]);
 
+  // Fetch the next window when the end of the list scrolls into view
+  useEffect(() => {
+    const sentinel = loadMoreRef.current;
+    if (!sentinel || !hasMore || !onLoadMore) return;
+
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries[0].isIntersecting) onLoadMore();
+      },
+      { rootMargin: '600px' }
+    );
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  }, [hasMore, onLoadMore, localBlocks.length]);
+
   const sensors = useSensors(
     useSensor(PointerSensor),
     useSensor(KeyboardSensor, {
@@ -369,6 +393,7 @@ export default function BlockList({ blocks, pageId, onBlocksChange }: BlockListP
                 onAddBelow={() => handleAddBelow(block.id)}
               />
             ))}
+            {hasMore && <div ref={loadMoreRef} className="h-8" />}
           </div>
         </SortableContext>
       </DndContext>
@@ -5,6 +5,9 @@ export interface Page {
   title: string;
   icon: string | null;
   parent_id: number | null;
+  child_count: number;
+  block_count: number;
+  content_bytes: number;
   created_at: string;
   updated_at: string;
   children?: Page[];
@@ -24,6 +27,76 @@ export interface PageWithBlocks extends Page {
   blocks: Block[];
 }
 
+export interface PageWindow extends PageWithBlocks {
+  total_blocks: number;
+  has_more: boolean;
+  max_order: number | null;
+}
+
+export interface PageBatch<T extends Page = Page> {
+  pages: T[];
+  missing: number[];
+}
+
+export interface BlockRangeQuery {
+  after_order?: number;
+  after_id?: number;
+  before_order?: number;
+  limit?: number;
+}
+
+export interface Backlink {
+  page_id: number;
+  title: string;
+  icon: string | null;
+  block_ids: number[];
+}
+
+export interface PageTreeNode {
+  id: number;
+  title: string;
+  icon: string | null;
+  parent_id: number | null;
+  children: PageTreeNode[];
+}
+
+export interface PageBreadcrumb {
+  id: number;
+  title: string;
+  icon: string | null;
+}
+
+export interface Todo {
+  id: number;
+  page_id: number;
+  content: string | null;
+  order: number;
+  checked: boolean;
+  updated_at: string | null;
+  page_title: string;
+  page_icon: string | null;
+}
+
+export interface TodoList {
+  items: Todo[];
+  next_after_id: number | null;
+}
+
+export interface Change {
+  seq: number;
+  entity: 'page' | 'block';
+  id: number;
+  page_id: number | null;
+  op: 'upsert' | 'delete';
+  data: Page | Block | null;
+}
+
+export interface ChangeSet {
+  changes: Change[];
+  cursor: number;
+  has_more: boolean;
+}
+
 export interface CreatePageRequest {
   title: string;
   icon?: string | null;
@@ -61,6 +134,7 @@ export interface ImportNotionRequest {
 export interface ImportNotionResponse {
   page_id: number;
   blocks_count: number;
+  skipped_types: Record<string, number>;
   notion_page_id: string;
   title: string;
   icon?: string;
@@ -93,6 +167,120 @@ export async function getPage(id: number): Promise<PageWithBlocks> {
   return handleResponse<PageWithBlocks>(response);
 }
 
+// Get a page with only the first window of its blocks
+export async function getPageWindow(
+  id: number,
+  blockLimit: number
+): Promise<PageWindow> {
+  const response = await fetch(`/api/pages/${id}?block_limit=${blockLimit}`, {
+    method: 'GET',
+    headers: { 'Content-Type': 'application/json' },
+  });
+  return handleResponse<PageWindow>(response);
+}
+
+// Get several pages in one request (e.g. to prefetch children or linked pages)
+export async function getPagesBatch(
+  ids: number[],
+  includeBlocks: true
+): Promise<PageBatch<PageWithBlocks>>;
+export async function getPagesBatch(ids: number[], includeBlocks?: false): Promise<PageBatch>;
+export async function getPagesBatch(
+  ids: number[],
+  includeBlocks = false
+): Promise<PageBatch<Page | PageWithBlocks>> {
+  const params = new URLSearchParams({ ids: ids.join(',') });
+  if (includeBlocks) params.set('include_blocks', 'true');
+  const response = await fetch(`/api/pages/batch?${params.toString()}`, {
+    method: 'GET',
+    headers: { 'Content-Type': 'application/json' },
+  });
+  return handleResponse<PageBatch<Page | PageWithBlocks>>(response);
+}
+
+// Get a range of blocks of a page, ordered by (order, id)
+export async function getPageBlocks(
+  pageId: number,
+  range: BlockRangeQuery = {}
+): Promise<Block[]> {
+  const params = new URLSearchParams();
+  Object.entries(range).forEach(([key, value]) => {
+    if (value !== undefined) params.set(key, String(value));
+  });
+  const query = params.toString();
+  const response = await fetch(
+    `/api/pages/${pageId}/blocks${query ? `?${query}` : ''}`,
+    {
+      method: 'GET',
+      headers: { 'Content-Type': 'application/json' },
+    }
+  );
+  return handleResponse<Block[]>(response);
+}
+
+// List pages whose blocks link to this page
+export async function getBacklinks(id: number): Promise<Backlink[]> {
+  const response = await fetch(`/api/pages/${id}/backlinks`, {
+    method: 'GET',
+    headers: { 'Content-Type': 'application/json' },
+  });
+  return handleResponse<Backlink[]>(response);
+}
+
+// Get the page hierarchy (optionally below rootId, up to depth levels)
+export async function getPageTree(rootId?: number, depth?: number): Promise<PageTreeNode[]> {
+  const params = new URLSearchParams();
+  if (rootId !== undefined) params.set('root_id', String(rootId));
+  if (depth !== undefined) params.set('depth', String(depth));
+  const query = params.toString();
+  const response = await fetch(`/api/pages/tree${query ? `?${query}` : ''}`, {
+    method: 'GET',
+    headers: { 'Content-Type': 'application/json' },
+  });
+  return handleResponse<PageTreeNode[]>(response);
+}
+
+// Get the path from the top-level page down to a page
+export async function getBreadcrumbs(id: number): Promise<PageBreadcrumb[]> {
+  const response = await fetch(`/api/pages/${id}/breadcrumbs`, {
+    method: 'GET',
+    headers: { 'Content-Type': 'application/json' },
+  });
+  return handleResponse<PageBreadcrumb[]>(response);
+}
+
+// List todos across the workspace (pass next_after_id as afterId for the next window)
+export async function getTodos(
+  checked?: boolean,
+  afterId?: number,
+  limit?: number
+): Promise<TodoList> {
+  const params = new URLSearchParams();
+  if (checked !== undefined) params.set('checked', String(checked));
+  if (afterId !== undefined) params.set('after_id', String(afterId));
+  if (limit !== undefined) params.set('limit', String(limit));
+  const query = params.toString();
+  const response = await fetch(`/api/todos/${query ? `?${query}` : ''}`, {
+    method: 'GET',
+    headers: { 'Content-Type': 'application/json' },
+  });
+  return handleResponse<TodoList>(response);
+}
+
+// Get pages/blocks changed after a cursor (omit since to get the current cursor).
+// Throws when the cursor has expired (HTTP 410); refetch everything and start over.
+export async function getChanges(since?: number, limit?: number): Promise<ChangeSet> {
+  const params = new URLSearchParams();
+  if (since !== undefined) params.set('since', String(since));
+  if (limit !== undefined) params.set('limit', String(limit));
+  const query = params.toString();
+  const response = await fetch(`/api/changes/${query ? `?${query}` : ''}`, {
+    method: 'GET',
+    headers: { 'Content-Type': 'application/json' },
+  });
+  return handleResponse<ChangeSet>(response);
+}
+
 // Create a new page
 export async function createPage(data: CreatePageRequest): Promise<Page> {
   const response = await fetch('/api/pages/', {
@@ -128,6 +316,32 @@ export async function deletePage(id: number): Promise<void> {
   }
 }
 
+// Duplicate a page with its child pages and blocks (server-side copy)
+export async function duplicatePage(
+  id: number,
+  data: { parent_id?: number | null; title?: string } = {}
+): Promise<Page> {
+  const response = await fetch(`/api/pages/${id}/duplicate`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(data),
+  });
+  return handleResponse<Page>(response);
+}
+
+// Move several pages (with their subtrees) under a new parent
+export async function movePages(
+  pageIds: number[],
+  parentId: number | null
+): Promise<{ message: string; moved_count: number }> {
+  const response = await fetch('/api/pages/move', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ page_ids: pageIds, parent_id: parentId }),
+  });
+  return handleResponse<{ message: string; moved_count: number }>(response);
+}
+
 // Create a new block
 export async function createBlock(data: CreateBlockRequest): Promise<Block> {
   const response = await fetch('/api/blocks/', {